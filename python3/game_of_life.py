@@ -2,6 +2,8 @@
 
 from argparse import ArgumentParser, Namespace
 from gameoflife import MainGame
+from gameoflife.cycle_detector import CycleDetector
+from gameoflife.dataio.pattern_cache import PatternCache
 
 
 def main() -> None:
@@ -39,11 +41,65 @@ def main() -> None:
         nargs=1,
         help="specify the number of columns to use when using --wrap - default is terminal width",
     )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        default=[""],
+        choices=[*MainGame.INFINITE_ENGINES, *MainGame.WRAP_ENGINES],
+        nargs=1,
+        help="specify the Game of Life implementation to use - defaults to "
+        + f"'{next(iter(MainGame.INFINITE_ENGINES))}', or "
+        + f"'{next(iter(MainGame.WRAP_ENGINES))}' when using --wrap",
+    )
+    parser.add_argument(
+        "-g",
+        "--generations",
+        default=[0],
+        type=int,
+        nargs=1,
+        help="progress the given number of generations without the UI, then print the number "
+        + "of live cells and the time taken",
+    )
+    parser.add_argument(
+        "-s",
+        "--until-stable",
+        default=False,
+        action="store_true",
+        help="progress without the UI until the universe repeats itself, e.g. it is a still life, "
+        + "an oscillator or a spaceship, with a period of up to "
+        + f"{CycleDetector.MAX_PERIOD} generations, then print its period - with --generations "
+        + "skip ahead to that generation by whole periods",
+    )
+    parser.add_argument(
+        "--cache",
+        default=False,
+        action="store_true",
+        help="cache the cells parsed from .cells and .rle files, so each file is only parsed "
+        + "once - the cells of a file are then all read into memory rather than streamed",
+    )
     args: Namespace = parser.parse_args()
     if not args.wrap and (args.rows[0] or args.cols[0]):
         raise ValueError("Do not specify --rows or --cols without --wrap")
+    engine: str = args.engine[0]
+    if engine and engine not in (
+        MainGame.WRAP_ENGINES if args.wrap else MainGame.INFINITE_ENGINES
+    ):
+        raise ValueError(
+            f"Engine '{engine}' can't be used {'with' if args.wrap else 'without'} --wrap"
+        )
     file: str = args.file[0] if args.file else ""
-    MainGame(args.wrap, file, args.rows[0], args.cols[0]).main()
+    game: MainGame = MainGame(
+        args.wrap,
+        file,
+        args.rows[0],
+        args.cols[0],
+        engine,
+        PatternCache() if args.cache else None,
+    )
+    if args.generations[0] or args.until_stable:
+        game.run_headless(args.generations[0], args.until_stable)
+    else:
+        game.main()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,23 @@
 """Import all the other sources and re-export them for easier importing elsewhere."""
 
 # pylint: disable=useless-import-alias
+from gameoflife.coordinate import Bounds as Bounds
 from gameoflife.coordinate import Coordinate as Coordinate
+from gameoflife.cell_buffer import CellBuffer as CellBuffer
+from gameoflife.rule import Rule as Rule
 from gameoflife.gol_abc import GameOfLife as GameOfLife
 from gameoflife.gol_arrays import GameOfLifeArrays as GameOfLifeArrays
+from gameoflife.gol_bitboard import GameOfLifeBitboard as GameOfLifeBitboard
 from gameoflife.gol_dict import GameOfLifeDict as GameOfLifeDict
+from gameoflife.gol_hashlife import GameOfLifeHashLife as GameOfLifeHashLife
+from gameoflife.gol_packed import GameOfLifePacked as GameOfLifePacked
 from gameoflife.gol_set import GameOfLifeSet as GameOfLifeSet
+from gameoflife.gol_strips import GameOfLifeStrips as GameOfLifeStrips
+from gameoflife.gol_tiles import GameOfLifeTiles as GameOfLifeTiles
+
+try:
+    from gameoflife.gol_numpy import GameOfLifeNumpy as GameOfLifeNumpy
+except ImportError:  # numpy is an optional dependency
+    pass
+
 from gameoflife.main import MainGame as MainGame
@@ -0,0 +1,99 @@
+"""
+Helpers for computing the next generation of a whole row of cells at a time.
+
+A row of cells is stored in a single Python int where bit N is the cell in column N, which allows
+the neighbour counts of every cell in a row to be computed with a handful of bitwise operations.
+"""
+
+from typing import Iterable
+from gameoflife.coordinate import Bounds, Coordinate
+
+
+def next_row(  # pylint: disable=too-many-locals
+    above: int, row: int, below: int, mask: int
+) -> int:
+    """
+    Compute the next generation of a row of cells using bit sliced full adders.
+
+    The above, row and below arguments are "extended" rows, which have the cell from the column
+    to the left of the row in bit 0, and the cell from column N of the row in bit N + 1, followed
+    by the cell from the column to the right of the row. The mask selects the bits of the row.
+    """
+    # sum the 3 cells above each cell into a 2 bit number, ones and twos
+    above_ones, above_twos = _full_adder(above, above >> 1, above >> 2)
+    # sum the 3 cells below each cell into a 2 bit number, ones and twos
+    below_ones, below_twos = _full_adder(below, below >> 1, below >> 2)
+    # sum the cells to the left and right of each cell into a 2 bit number, ones and twos
+    west: int = row
+    east: int = row >> 2
+    side_ones: int = west ^ east
+    side_twos: int = west & east
+    # add the three sums together, starting with the ones column
+    ones, ones_carry = _full_adder(above_ones, below_ones, side_ones)
+    twos_sum, twos_carry = _full_adder(above_twos, below_twos, side_twos)
+    twos: int = twos_sum ^ ones_carry
+    # a carry from both parts of the twos column means there are 8 neighbours, not 4
+    fours: int = twos_carry ^ (twos_sum & ones_carry)
+    # 1. Any cell, dead or alive, with exactly 3 neighbours is alive in the next generation.
+    # 2. A live cell with exactly 2 neighbours is alive in the next generation.
+    # 3. All other cells are dead in the next generation.
+    return twos & ~fours & (ones | row >> 1) & mask
+
+
+def row_bounds(
+    rows: Iterable[int], first_row: int = 0, first_col: int = 0
+) -> Bounds | None:
+    """
+    Return the bounds of the live cells in consecutive rows of cells, or None if there are none.
+
+    The first of the rows is row first_row, and bit 0 of each row is col first_col.
+    """
+    min_row: int = -1
+    max_row: int = -1
+    # every col with a live cell in any of the rows
+    cols: int = 0
+    for row_index, row in enumerate(rows):
+        if row:
+            if min_row < 0:
+                min_row = row_index
+            max_row = row_index
+            cols |= row
+    if not cols:
+        return None
+    return (
+        first_row + min_row,
+        first_col + (cols & -cols).bit_length() - 1,
+        first_row + max_row,
+        first_col + cols.bit_length() - 1,
+    )
+
+
+def cell_rows(
+    cells: Iterable[Coordinate], rows: int, cols: int, wrap: bool = True
+) -> dict[int, int]:
+    """
+    Return the cells as rows of cells keyed by row, for a universe of rows by cols cells.
+
+    Cells outside of the universe wrap around if wrap is True, otherwise they are left out.
+    """
+    by_row: dict[int, int] = {}
+    for row, col in cells:
+        if wrap:
+            row %= rows
+            col %= cols
+        elif not (0 <= row < rows and 0 <= col < cols):
+            continue
+        by_row[row] = by_row.get(row, 0) | 1 << col
+    return by_row
+
+
+def row_region(row: int, col: int, cols: int) -> int:
+    """Return the cols cells of a row of cells from col onwards, with the cell in col in bit 0."""
+    shifted: int = row >> col if col >= 0 else row << -col
+    return shifted & ((1 << cols) - 1)
+
+
+def _full_adder(left: int, middle: int, right: int) -> tuple[int, int]:
+    """Add three rows of bits together, return a tuple of the sum bits and carry bits."""
+    partial: int = left ^ middle
+    return partial ^ right, (left & middle) | (partial & right)
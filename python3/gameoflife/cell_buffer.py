@@ -0,0 +1,96 @@
+"""A compact sequence of the coordinates of cells, packed into arrays of 64 bit ints."""
+
+from array import array
+from typing import Iterable, Iterator, Sequence, overload
+from gameoflife.coordinate import Coordinate
+
+
+class CellBuffer(Sequence[Coordinate]):
+    """
+    The coordinates of cells, as an array of their rows and an array of their cols.
+
+    Each cell takes 16 bytes, rather than the 100 or so bytes of a tuple of two ints in a list.
+    It is a sequence of (row, col) tuples, so it can be used wherever a list of cells can, and
+    iterating it with zip() reuses the same tuple for every cell as long as each one is unpacked
+    straight away. Code which knows about it can instead work on the rows and cols directly.
+    """
+
+    __slots__ = ("rows", "cols")
+
+    def __init__(self, cells: Iterable[Coordinate] = ()) -> None:
+        """Initialise the buffer with the given cells."""
+        self.rows: array[int] = array("q")
+        self.cols: array[int] = array("q")
+        self.extend(cells)
+
+    @staticmethod
+    def from_arrays(rows: "array[int]", cols: "array[int]") -> "CellBuffer":
+        """Create a buffer which takes ownership of the given arrays, of the same length."""
+        cells: CellBuffer = CellBuffer()
+        cells.rows = rows
+        cells.cols = cols
+        return cells
+
+    @staticmethod
+    def from_row(row: int, cols: "array[int]") -> "CellBuffer":
+        """Create a buffer of cells which are all in the given row, taking ownership of cols."""
+        return CellBuffer.from_arrays(array("q", [row]) * len(cols), cols)
+
+    def append(self, row: int, col: int) -> None:
+        """Add a cell to the end of the buffer."""
+        self.rows.append(row)
+        self.cols.append(col)
+
+    def extend(self, cells: Iterable[Coordinate]) -> None:
+        """Add the cells to the end of the buffer, copying the arrays of another buffer."""
+        if isinstance(cells, CellBuffer):
+            self.rows.extend(cells.rows)
+            self.cols.extend(cells.cols)
+            return
+        rows: array[int] = self.rows
+        cols: array[int] = self.cols
+        for row, col in cells:
+            rows.append(row)
+            cols.append(col)
+
+    def __len__(self) -> int:
+        """Return the number of cells."""
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        """Iterate over the cells as (row, col) tuples."""
+        return zip(self.rows, self.cols)
+
+    @overload
+    def __getitem__(self, index: int) -> Coordinate:
+        """Return the cell at the index."""
+
+    @overload
+    def __getitem__(self, index: slice) -> "CellBuffer":
+        """Return a new buffer of the cells in the slice."""
+
+    def __getitem__(self, index: int | slice) -> "Coordinate | CellBuffer":
+        """Return the cell at the index, or a new buffer of the cells in a slice."""
+        if isinstance(index, slice):
+            return CellBuffer.from_arrays(self.rows[index], self.cols[index])
+        return (self.rows[index], self.cols[index])
+
+    def __add__(self, other: Iterable[Coordinate]) -> "CellBuffer":
+        """Return a new buffer of these cells followed by the other cells."""
+        cells: CellBuffer = CellBuffer(self)
+        cells.extend(other)
+        return cells
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the cells with another buffer, or a list or tuple of cells."""
+        if isinstance(other, CellBuffer):
+            return self.rows == other.rows and self.cols == other.cols
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(
+                cell == other_cell for cell, other_cell in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the cells as a list of tuples."""
+        return f"CellBuffer({list(self)!r})"
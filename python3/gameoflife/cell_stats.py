@@ -0,0 +1,150 @@
+"""The population, bounds and rows of the live cells of a universe, updated a cell at a time."""
+
+from collections import Counter
+from typing import Collection, Iterator
+from gameoflife.coordinate import Bounds, Coordinate
+
+
+class CellStats:
+    """
+    Keeps the number of live cells and their bounding box updated as cells are born and die.
+
+    The cols of the live cells in each row, and the number of live cells in each col, are kept
+    too, so that when the last live cell on an edge of the bounding box dies the box can shrink
+    to the next row or col which still has live cells. That is only worked out when the bounds
+    are next asked for, and is proportional to the number of rows and cols with live cells
+    rather than to the number of live cells. The rows also allow regions to be looked up, and the
+    live cells to be iterated in order, a row at a time.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the statistics of an empty universe."""
+        self.population: int = 0
+        self._rows: dict[int, set[int]] = {}
+        self._cols: dict[int, int] = {}
+        self._bounds: Bounds | None = None
+        # set when an edge of the bounds has lost its last live cell
+        self._shrunk: bool = False
+
+    def add(self, row: int, col: int) -> None:
+        """Update the statistics for a cell which was born."""
+        self.population += 1
+        row_cols: set[int] | None = self._rows.get(row)
+        if row_cols is None:
+            self._rows[row] = {col}
+        else:
+            row_cols.add(col)
+        cols: dict[int, int] = self._cols
+        cols[col] = cols.get(col, 0) + 1
+        bounds: Bounds | None = self._bounds
+        if bounds is None:
+            self._bounds = (row, col, row, col)
+        elif not (bounds[0] <= row <= bounds[2] and bounds[1] <= col <= bounds[3]):
+            self._bounds = (
+                min(bounds[0], row),
+                min(bounds[1], col),
+                max(bounds[2], row),
+                max(bounds[3], col),
+            )
+
+    def add_cells(self, cells: Collection[Coordinate]) -> None:
+        """Update the statistics for many cells which were born, with one pass for the bounds."""
+        if not cells:
+            return
+        self.population += len(cells)
+        rows: dict[int, set[int]] = self._rows
+        for row, col in cells:
+            row_cols: set[int] | None = rows.get(row)
+            if row_cols is None:
+                rows[row] = {col}
+            else:
+                row_cols.add(col)
+        cols: dict[int, int] = self._cols
+        col_counts: Counter[int] = Counter(col for _, col in cells)
+        for col, count in col_counts.items():
+            cols[col] = cols.get(col, 0) + count
+        self._grow((min(cells)[0], min(col_counts), max(cells)[0], max(col_counts)))
+
+    def remove(self, row: int, col: int) -> None:
+        """Update the statistics for a cell which died."""
+        self.population -= 1
+        bounds: Bounds | None = self._bounds
+        row_cols: set[int] = self._rows[row]
+        row_cols.remove(col)
+        if not row_cols:
+            del self._rows[row]
+            # a row inside the bounds emptying doesn't change them
+            if bounds is not None and row in (bounds[0], bounds[2]):
+                self._shrunk = True
+        cols: dict[int, int] = self._cols
+        count: int = cols[col] - 1
+        if count:
+            cols[col] = count
+        else:
+            del cols[col]
+            if bounds is not None and col in (bounds[1], bounds[3]):
+                self._shrunk = True
+
+    def update(self, other: "CellStats") -> None:
+        """Add the statistics of another set of live cells, which mustn't overlap these ones."""
+        self.population += other.population
+        for row, row_cols in other._rows.items():  # pylint: disable=protected-access
+            self._rows.setdefault(row, set()).update(row_cols)
+        for col, count in other._cols.items():  # pylint: disable=protected-access
+            self._cols[col] = self._cols.get(col, 0) + count
+        other_bounds: Bounds | None = other.bounds
+        if other_bounds is not None:
+            self._grow(other_bounds)
+
+    def _grow(self, other_bounds: Bounds) -> None:
+        """Grow the bounds to include the given bounds of some new live cells."""
+        bounds: Bounds | None = self._bounds
+        if bounds is None:
+            self._bounds = other_bounds
+        else:
+            self._bounds = (
+                min(bounds[0], other_bounds[0]),
+                min(bounds[1], other_bounds[1]),
+                max(bounds[2], other_bounds[2]),
+                max(bounds[3], other_bounds[3]),
+            )
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, None if none."""
+        if self._shrunk:
+            self._shrunk = False
+            rows: dict[int, set[int]] = self._rows
+            cols: dict[int, int] = self._cols
+            self._bounds = (
+                (min(rows), min(cols), max(rows), max(cols)) if rows else None
+            )
+        return self._bounds
+
+    def iter_cells(self) -> Iterator[Coordinate]:
+        """Yield the live cells sorted by row then col, sorting one row at a time."""
+        rows: dict[int, set[int]] = self._rows
+        for row in sorted(rows):
+            for col in sorted(rows[row]):
+                yield (row, col)
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, see GameOfLife for arguments."""
+        region: list[int] = []
+        end_col: int = col + cols
+        for region_row in range(row, row + rows):
+            row_cols: set[int] | None = self._rows.get(region_row)
+            cells: int = 0
+            if row_cols is None:
+                pass
+            elif len(row_cols) <= cols:
+                # fewer live cells in the row than cells in the region to look up
+                for live_col in row_cols:
+                    if col <= live_col < end_col:
+                        cells |= 1 << (live_col - col)
+            else:
+                for index in range(cols):
+                    if col + index in row_cols:
+                        cells |= 1 << index
+            region.append(cells)
+        return region
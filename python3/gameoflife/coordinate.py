@@ -1,3 +1,24 @@
-"""To avoid circular dependencies we put a Coordinate type alias in a separate module."""
+"""The Coordinate and Bounds types and their helpers, in a module of their own to avoid cycles."""
 
 Coordinate = tuple[int, int]
+# the min row, min col, max row and max col of a rectangle of cells, all inclusive
+Bounds = tuple[int, int, int, int]
+
+
+def grow_bounds(bounds: Bounds | None, row: int, col: int) -> Bounds:
+    """Return the bounds grown to include the given cell, or just the cell if bounds is None."""
+    if bounds is None:
+        return (row, col, row, col)
+    return (
+        min(bounds[0], row),
+        min(bounds[1], col),
+        max(bounds[2], row),
+        max(bounds[3], col),
+    )
+
+
+def on_edge(bounds: Bounds | None, row: int, col: int) -> bool:
+    """Return True if the cell is on an edge of the bounds, so they might shrink if it dies."""
+    return (
+        bounds is None or row in (bounds[0], bounds[2]) or col in (bounds[1], bounds[3])
+    )
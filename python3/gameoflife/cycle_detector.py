@@ -0,0 +1,124 @@
+"""Detect when a Game of Life universe starts repeating itself, and skip ahead when it does."""
+
+from collections import deque
+from gameoflife import CellBuffer, Coordinate, GameOfLife
+from gameoflife.fingerprint import Fingerprint
+
+
+class Cycle:
+    """A repeating universe: it repeats every period generations, moved by the displacement."""
+
+    def __init__(self, generation: int, period: int, displacement: Coordinate) -> None:
+        """Initialise with the generation the cycle was first seen at, its period and movement."""
+        self.generation: int = generation
+        self.period: int = period
+        self.displacement: Coordinate = displacement
+
+    def __str__(self) -> str:
+        """Describe the cycle."""
+        return (
+            f"period {self.period}, displacement {self.displacement}, "
+            + f"from generation {self.generation}"
+        )
+
+
+class CycleDetector:
+    """
+    Detects repeats of the universe of a game using the fingerprints of each generation.
+
+    With translations, a universe that is the same as an earlier generation, wherever it has moved
+    to, is a repeat, which finds spaceships as well as still lifes and oscillators. Translations
+    should not be used with universes which wrap around. As fingerprints are hashes a false repeat
+    is possible, but with a 61 bit hash it is very unlikely.
+    """
+
+    # the default longest period that is looked for
+    MAX_PERIOD: int = 10_000
+
+    def __init__(
+        self, gol: GameOfLife, translations: bool = True, max_period: int = MAX_PERIOD
+    ) -> None:
+        """
+        Initialise the detector for the given game.
+
+        Only the fingerprints of the last max_period generations are kept, so the memory used by
+        a universe that never repeats is limited, but repeats with a longer period aren't found.
+        A max_period of 0 keeps every fingerprint.
+        """
+        self._gol: GameOfLife = gol
+        self._translations: bool = translations
+        self._max_period: int = max_period
+        # the generation and anchor each fingerprint was first seen at
+        self._seen: dict[tuple[int, int], tuple[int, Coordinate]] = {}
+        # the generations and fingerprints in _seen, oldest first
+        self._history: deque[tuple[int, tuple[int, int]]] = deque()
+
+    def check(self) -> Cycle | None:
+        """Record the current generation, return the cycle if it repeats an earlier generation."""
+        fingerprint: Fingerprint = self._gol.fingerprint()
+        key: tuple[int, int]
+        anchor: Coordinate
+        if self._translations:
+            key = fingerprint.normalised()
+            anchor = fingerprint.anchor
+        else:
+            key = (fingerprint.hash, fingerprint.population)
+            anchor = (0, 0)
+        generation: int = self._gol.generation
+        seen: tuple[int, Coordinate] | None = self._seen.get(key)
+        if seen is None:
+            self._seen[key] = (generation, anchor)
+            if self._max_period:
+                self._forget(generation, key)
+            return None
+        first_generation, first_anchor = seen
+        return Cycle(
+            first_generation,
+            generation - first_generation,
+            (anchor[0] - first_anchor[0], anchor[1] - first_anchor[1]),
+        )
+
+    def _forget(self, generation: int, key: tuple[int, int]) -> None:
+        """Record the key seen at generation, and forget those over max_period generations ago."""
+        history: deque[tuple[int, tuple[int, int]]] = self._history
+        history.append((generation, key))
+        while history[0][0] < generation - self._max_period:
+            del self._seen[history.popleft()[1]]
+
+    def run(self, generations: int = 0) -> Cycle | None:
+        """
+        Progress the game until it repeats itself, return the cycle, or None if it didn't repeat.
+
+        Stop after the given number of generations, or never stop until it repeats if 0.
+        """
+        last: int = self._gol.generation + generations
+        cycle: Cycle | None = self.check()
+        while cycle is None and (not generations or self._gol.generation < last):
+            self._gol.progress()
+            cycle = self.check()
+        return cycle
+
+    def fast_forward(self, cycle: Cycle, generation: int) -> None:
+        """
+        Advance the game to the given generation, skipping whole periods of the cycle.
+
+        Skipping a period just moves the cells by the displacement, so only the generations left
+        over after the whole periods are actually progressed.
+        """
+        gol: GameOfLife = self._gol
+        periods: int = (generation - gol.generation) // cycle.period
+        if periods > 0:
+            row_offset: int = cycle.displacement[0] * periods
+            col_offset: int = cycle.displacement[1] * periods
+            if row_offset or col_offset:
+                cells: CellBuffer = gol.get_live_cells()
+                for row, col in cells:
+                    gol.set_cell(row, col, False)
+                gol.set_cells(
+                    (row + row_offset, col + col_offset) for row, col in cells
+                )
+            gol.generation += periods * cycle.period
+            # the generations recorded so far don't line up with the new generations
+            self._seen.clear()
+            self._history.clear()
+        gol.progress_many(generation - gol.generation)
@@ -0,0 +1,34 @@
+"""Opening pattern files which might be compressed, as shown by the end of their file name."""
+
+import bz2
+import gzip
+import lzma
+from typing import Callable, Literal, TextIO
+
+# the functions to open each type of compressed file, by the extension they add to a file name
+COMPRESSIONS: dict[str, Callable[..., TextIO]] = {
+    "gz": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+def file_type(file: str) -> str:
+    """Return the extension of the file type, ignoring any compression, e.g. "rle" for a.rle.gz."""
+    extensions: list[str] = file.lower().split(".")
+    if len(extensions) > 2 and extensions[-1] in COMPRESSIONS:
+        return extensions[-2]
+    return extensions[-1]
+
+
+def open_text(file: str, mode: Literal["r", "w"]) -> TextIO:
+    """
+    Open a file in text mode, "r" or "w", decompressing or compressing it if it is compressed.
+
+    Compressed files are decompressed or compressed as they are read or written, so they are
+    never held in memory or written to a temporary file.
+    """
+    compression: str = file.lower().rsplit(".", 1)[-1]
+    if compression in COMPRESSIONS:
+        return COMPRESSIONS[compression](file, mode + "t", encoding="UTF-8")
+    return open(file, mode, encoding="UTF-8")
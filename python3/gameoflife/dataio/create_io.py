@@ -4,20 +4,45 @@ Simple function to create the different FileReaders and FileWriters.
 Using separate file to avoid module import issues.
 """
 
+from .compression import file_type
 from .file_reader import FileReaderContextManager
 from .runlengthencoded_reader import RunLengthEncodedReader
+from .macrocell_reader import MacrocellReader
 from .plaintext_reader import PlainTextReader
+from .pattern_cache import CachedReader, PatternCache
 from .file_writer import FileWriterContextManager
 from .plaintext_writer import PlainTextWriter
+from .runlengthencoded_writer import RunLengthEncodedWriter
+from .macrocell_writer import MacrocellWriter
 
 
-def create_reader(file: str) -> FileReaderContextManager:
-    """Create and return the correct FileReader."""
-    match file.lower().split(".")[-1]:
+def create_reader(
+    file: str, stream: bool = False, cache: PatternCache | None = None, workers: int = 1
+) -> FileReaderContextManager:
+    """
+    Create and return the correct FileReader, which streams its cells if stream is True.
+
+    The file can be compressed, e.g. "glider.rle.gz", see compression.COMPRESSIONS. If a cache is
+    given .rle and .cells files are only parsed the first time they are read, after that their
+    cells are loaded from the cache. Macrocell files aren't cached, they are already quick to read
+    and HashLife loads their nodes without expanding them to cells.
+
+    Large .rle files which aren't streamed, or are parsed for the cache, are decoded by up to
+    workers processes.
+    """
+    match file_type(file):
         case "rle":
-            return RunLengthEncodedReader(file)
+            if cache:
+                return CachedReader(
+                    file, RunLengthEncodedReader(file, workers=workers), cache, stream
+                )
+            return RunLengthEncodedReader(file, stream, workers)
         case "cells":
-            return PlainTextReader(file)
+            if cache:
+                return CachedReader(file, PlainTextReader(file), cache, stream)
+            return PlainTextReader(file, stream)
+        case "mc":
+            return MacrocellReader(file, stream)
         case other:
             raise ValueError(
                 f"Can't tell what file type this is from its extension: '{other}', from {file}"
@@ -29,10 +54,12 @@ def create_reader(file: str) -> FileReaderContextManager:
 
 
 def create_writer(file: str) -> FileWriterContextManager:
-    """Create and return the correct FileWriter."""
-    match file.lower().split(".")[-1]:
-        # case "rle":
-        #     return RunLengthEncodedWriter(file)
+    """Create and return the correct FileWriter, which compresses the file if its name says so."""
+    match file_type(file):
+        case "rle":
+            return RunLengthEncodedWriter(file)
+        case "mc":
+            return MacrocellWriter(file)
         case "cells":
             return PlainTextWriter(file)
         case other:
@@ -3,17 +3,41 @@
 from abc import ABC, abstractmethod
 from functools import reduce
 from types import TracebackType
-from gameoflife import Coordinate
+from typing import Iterator
+from gameoflife import CellBuffer, Coordinate
 
 
 class FileReader(ABC):
     """ABC for the interface of different file encoding types for cells for Game of Life."""
 
-    def __init__(self, file: str) -> None:
-        """Initialise."""
+    def __init__(self, file: str, stream: bool = False) -> None:
+        """
+        Initialise.
+
+        A streaming reader doesn't fill in cells, instead iter_batches() reads the cells from the
+        file as they are iterated, so only a row of cells is in memory at a time.
+        """
         self._filename: str = file
-        self.cells: list[Coordinate] = []
-        self.metadata: list[list[int | bool]]
+        self._stream: bool = stream
+        self.cells: CellBuffer = CellBuffer()
+        self.metadata: list[list[str]]
+        self.rule: str = ""  # the rule from the file, if it has one
+
+    def iter_batches(self) -> Iterator[CellBuffer]:
+        """
+        Return an iterator of batches of the live cells.
+
+        When streaming each batch is a row of cells read from the file as it is iterated, which
+        can only be done once, before the context manager exits. Otherwise the only batch is
+        cells.
+        """
+        if self._stream:
+            return self._read_batches()
+        return iter([self.cells] if self.cells else [])
+
+    @abstractmethod
+    def _read_batches(self) -> Iterator[CellBuffer]:
+        """Read the rest of the file, yielding the live cells a row of cells at a time."""
 
     @staticmethod
     def _coord_max(left: Coordinate, right: Coordinate) -> Coordinate:
@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 from types import TracebackType
-from gameoflife import Coordinate
+from typing import Iterable
+from gameoflife import Bounds, CellBuffer, Coordinate
 
 
 class FileWriter(ABC):
@@ -11,10 +12,41 @@ class FileWriter(ABC):
     def __init__(self, file: str) -> None:
         """Initialise."""
         self._filename: str = file
+        self.rule: str = "B3/S23"  # the rule to write, if the file type has one
 
     @abstractmethod
-    def write(self, metadata: list[str], cells: list[Coordinate]) -> None:
-        """Write the Game of Life data to the file."""
+    def write(
+        self,
+        metadata: list[str],
+        cells: Iterable[Coordinate],
+        bounds: Bounds | None = None,
+    ) -> None:
+        """
+        Write the Game of Life data to the file.
+
+        The cells must be sorted by row then col, and can be an iterator such as the one from
+        GameOfLife.iter_live_cells(), or a CellBuffer. If their bounds are given the cells are
+        written as they are iterated, otherwise they are read into a CellBuffer first to find them.
+        """
+
+    @staticmethod
+    def _find_bounds(
+        cells: Iterable[Coordinate], bounds: Bounds | None
+    ) -> tuple[Iterable[Coordinate], Bounds | None]:
+        """Return the cells and their bounds, reading them into a CellBuffer if bounds is None."""
+        if bounds is not None:
+            return cells, bounds
+        buffer: CellBuffer = (
+            cells if isinstance(cells, CellBuffer) else CellBuffer(cells)
+        )
+        if not buffer:
+            return buffer, None
+        return buffer, (
+            buffer.rows[0],
+            min(buffer.cols),
+            buffer.rows[-1],
+            max(buffer.cols),
+        )
 
 
 class FileWriterContextManager(FileWriter):
@@ -0,0 +1,156 @@
+"""File Loader for Macrocell file types."""
+
+from types import TracebackType
+from array import array
+from typing import Iterator, TextIO
+from gameoflife import CellBuffer
+from .compression import open_text
+from .file_reader import FileReader, FileReaderContextManager
+
+
+# pylint: disable=pointless-string-statement
+"""
+[M2] (golly 4.2)
+#R B3/S23
+#C A glider, and an 8x8 block of empty space
+.*$..*$***$
+4 0 1 0 0
+"""
+
+# a node of a Macrocell file, as its level and its contents: a level 3 leaf is the 8 rows of its
+# 8x8 cells with bit N of a row the cell in col N, a node of a higher level is the numbers of its
+# nw, ne, sw and se children, where 0 is an empty node
+MacrocellNode = tuple[int, tuple[int, ...]]
+
+
+class MacrocellReader(FileReaderContextManager):
+    """
+    Implements loading two state Macrocell data from files.
+
+    A Macrocell file is a quadtree of nodes where each distinct node is only stored once, so
+    reading the file takes time and space proportional to the number of distinct nodes. The cells
+    keep the position they have in the file, which is that the last node, the root, is centred on
+    0,0. Its cells are only expanded as they are iterated, a row at a time.
+    """
+
+    def __init__(self, file: str, stream: bool = False) -> None:
+        """Initialise the reader."""
+        super().__init__(file, stream)
+        self._file: TextIO
+        # node number 0 is the empty node, whose level depends on its parent
+        self.nodes: list[MacrocellNode] = [(0, ())]
+
+    def __enter__(self) -> FileReader:
+        """
+        Enter context manager which causes the file to be parsed immediately.
+
+        When streaming the nodes are parsed but the cells are only expanded as iter_batches() is
+        iterated.
+        """
+        self._file = open_text(self._filename, "r")
+        self.metadata = []
+        line: str = self._file.readline()
+        if not line.startswith("[M2]"):
+            raise ValueError(
+                f"Expected a Macrocell [M2] header line: {line!r}, from {self._filename}"
+            )
+        for line in self._file:
+            if line[0] == "#":
+                # #R B3/S23
+                # #C A comment
+                if line[1:2] == "R":
+                    self.rule = line[2:].strip()
+                else:
+                    # the same as the RLE metadata, e.g. ["C", "A comment"], ["C"] or []
+                    content: str = line[1:].strip()
+                    self.metadata.append(
+                        [content[0], content[1:].lstrip()]
+                        if content[1:]
+                        else [content] if content else []
+                    )
+            elif line.strip():
+                self.nodes.append(self._parse_node(line))
+
+        if not self._stream:
+            for batch in self._read_batches():
+                self.cells.extend(batch)
+        return self
+
+    def _parse_node(self, line: str) -> MacrocellNode:
+        """Parse a line with a leaf like ".*$..*$***$", or a node like "4 0 1 0 0"."""
+        if line[0] in ".*$":
+            rows: list[int] = [0] * 8
+            for row_index, row in enumerate(line.strip().split("$")[:8]):
+                for col_index, cell in enumerate(row[:8]):
+                    if cell == "*":
+                        rows[row_index] |= 1 << col_index
+            return (3, tuple(rows))
+        fields: list[str] = line.split()
+        level: int = int(fields[0]) if fields[0].isdigit() else 0
+        children: tuple[int, ...] = tuple(
+            int(child) for child in fields[1:] if child.isdigit()
+        )
+        if (
+            level < 4
+            or len(fields) != 5
+            or len(children) != 4
+            or max(children) >= len(self.nodes)
+            or any(self.nodes[child][0] != level - 1 for child in children if child)
+        ):
+            raise ValueError(
+                f"Invalid Macrocell node {len(self.nodes)}: {line!r}, from {self._filename}"
+            )
+        return (level, children)
+
+    def _read_batches(self) -> Iterator[CellBuffer]:
+        """Expand the nodes from the root, yielding the live cells a row of cells at a time."""
+        if len(self.nodes) == 1:
+            return iter([])
+        level: int = self.nodes[-1][0]
+        half: int = 1 << (level - 1)
+        return self._strip_rows([(len(self.nodes) - 1, -half)], level, -half)
+
+    def _strip_rows(
+        self, strip: list[tuple[int, int]], level: int, row: int
+    ) -> Iterator[CellBuffer]:
+        """
+        Yield the rows of live cells of a strip of non-empty nodes side by side, left to right.
+
+        Each node in the strip is its number and its left col, they are all of the given level
+        and their top row is row. Each node is only visited once for each strip it is in.
+        """
+        if level == 3:
+            for row_index in range(8):
+                cols: array[int] = array("q")
+                for number, col in strip:
+                    bits: int = self.nodes[number][1][row_index]
+                    while bits:
+                        lowest: int = bits & -bits
+                        cols.append(col + lowest.bit_length() - 1)
+                        bits ^= lowest
+                if cols:
+                    yield CellBuffer.from_row(row + row_index, cols)
+            return
+        half: int = 1 << (level - 1)
+        for first_child, strip_row in ((0, row), (2, row + half)):
+            # the top two children of every node in the strip, then the bottom two
+            children: list[tuple[int, int]] = [
+                (child, child_col)
+                for number, col in strip
+                for child, child_col in (
+                    (self.nodes[number][1][first_child], col),
+                    (self.nodes[number][1][first_child + 1], col + half),
+                )
+                if child
+            ]
+            if children:
+                yield from self._strip_rows(children, level - 1, strip_row)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager."""
+        self._file.close()
@@ -0,0 +1,137 @@
+"""File Writer for Macrocell file types."""
+
+from types import TracebackType
+from typing import Iterable, TextIO
+from gameoflife import Bounds, Coordinate
+from .compression import open_text
+from .file_writer import FileWriter, FileWriterContextManager
+
+
+# pylint: disable=pointless-string-statement
+"""
+[M2] (gameoflife)
+#R B3/S23
+#C A glider, and an 8x8 block of empty space
+.*$..*$***$
+4 0 1 0 0
+"""
+
+
+class MacrocellWriter(FileWriterContextManager):
+    """
+    Implements writing two state Macrocell data to files.
+
+    The cells are grouped into 8x8 leaves a band of 8 rows at a time, then the leaves are joined
+    into a quadtree a level at a time. Every node is deduplicated by its contents, so each
+    distinct node is only written once and the file is proportional to the number of distinct
+    nodes. The root node is centred on 0,0, so the cells keep their positions.
+    """
+
+    # translates the bits of a row of a leaf to its cells
+    _CELLS: dict[int, int] = str.maketrans("01", ".*")
+
+    def __init__(self, file: str) -> None:
+        """Initialise the writer."""
+        super().__init__(file)
+        self._file: TextIO
+
+    def __enter__(self) -> FileWriter:
+        """Enter context manager which causes the file to be opened immediately."""
+        self._file = open_text(self._filename, "w")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager."""
+        self._file.close()
+
+    def write(
+        self,
+        metadata: list[str],
+        cells: Iterable[Coordinate],
+        bounds: Bounds | None = None,
+    ) -> None:
+        """Write the metadata and cells to the file, see FileWriter for the arguments."""
+        lines: list[str] = ["[M2] (gameoflife)", f"#R {self.rule}"]
+        lines.extend(f"#C {data}" if data else "#C" for data in metadata)
+        cells, bounds = self._find_bounds(cells, bounds)
+        if bounds is not None:
+            # the root is the smallest node centred on 0,0 that holds all the cells
+            extent: int = max(-bounds[0], -bounds[1], bounds[2] + 1, bounds[3] + 1)
+            level: int = max(3, (extent - 1).bit_length() + 1)
+            # the number of each distinct node, keyed by its line in the file
+            numbers: dict[str, int] = {}
+            nodes: dict[tuple[int, int], int] = self._leaves(
+                cells, 1 << (level - 1), numbers
+            )
+            for node_level in range(4, level + 1):
+                nodes = MacrocellWriter._join(nodes, node_level, numbers)
+            lines.extend(numbers)
+        self._file.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _leaves(
+        cells: Iterable[Coordinate], half: int, numbers: dict[str, int]
+    ) -> dict[tuple[int, int], int]:
+        """
+        Return the numbers of the non-empty 8x8 leaves keyed by their position in the root.
+
+        The cells are offset by half to make them relative to the top left of the root, and only
+        one band of 8 rows of leaves is assembled at a time.
+        """
+        leaves: dict[tuple[int, int], int] = {}
+        band: dict[int, list[int]] = {}
+        band_row: int = -1
+        for row, col in cells:
+            row += half
+            col += half
+            if row >> 3 != band_row:
+                MacrocellWriter._add_leaves(band, band_row, leaves, numbers)
+                band = {}
+                band_row = row >> 3
+            leaf: list[int] | None = band.get(col >> 3)
+            if leaf is None:
+                leaf = band[col >> 3] = [0] * 8
+            leaf[row & 7] |= 1 << (col & 7)
+        MacrocellWriter._add_leaves(band, band_row, leaves, numbers)
+        return leaves
+
+    @staticmethod
+    def _add_leaves(
+        band: dict[int, list[int]],
+        band_row: int,
+        leaves: dict[tuple[int, int], int],
+        numbers: dict[str, int],
+    ) -> None:
+        """Add the leaves of a band of 8 rows to leaves, numbering them."""
+        for leaf_col, rows in band.items():
+            # .*$..*$***$ with the dead cells at the end of each row and the empty rows at the
+            # end of the leaf left out
+            line: str = "".join(
+                format(bits, "08b")[::-1].rstrip("0") + "$" for bits in rows
+            )
+            line = line.translate(MacrocellWriter._CELLS).rstrip("$") + "$"
+            leaves[(band_row, leaf_col)] = numbers.setdefault(line, len(numbers) + 1)
+
+    @staticmethod
+    def _join(
+        nodes: dict[tuple[int, int], int], level: int, numbers: dict[str, int]
+    ) -> dict[tuple[int, int], int]:
+        """Join the non-empty nodes of a level into nodes of the given level, numbering them."""
+        children: dict[tuple[int, int], list[int]] = {}
+        for (row, col), number in nodes.items():
+            quarters: list[int] | None = children.get((row >> 1, col >> 1))
+            if quarters is None:
+                quarters = children[(row >> 1, col >> 1)] = [0, 0, 0, 0]
+            quarters[(row & 1) * 2 + (col & 1)] = number
+        # 4 nw ne sw se, where 0 is an empty node
+        return {
+            position: numbers.setdefault(
+                f"{level} {nw} {ne} {sw} {se}", len(numbers) + 1
+            )
+            for position, (nw, ne, sw, se) in children.items()
+        }
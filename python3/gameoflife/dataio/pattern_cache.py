@@ -0,0 +1,169 @@
+"""An on-disk cache of the cells read from pattern files, so each file is only parsed once."""
+
+import hashlib
+import json
+import os
+from array import array
+from functools import partial
+from itertools import groupby
+from types import TracebackType
+from typing import Iterator, TypeGuard
+from gameoflife import CellBuffer
+from .file_reader import FileReader, FileReaderContextManager
+
+# the rule, metadata and cells of a pattern file
+CachedPattern = tuple[str, list[list[str]], CellBuffer]
+
+
+class PatternCache:
+    """
+    A directory of the decoded cells of pattern files, limited to max_bytes.
+
+    Each file is cached as a blob named by a hash of its path, mtime and contents, so editing or
+    replacing a file misses the cache. A blob is a line of JSON with the rule and metadata, then
+    the rows and cols arrays of the CellBuffer of the cells, which load without being parsed.
+    The least recently used blobs are evicted when a new blob takes the directory over max_bytes.
+    """
+
+    # the default size limit of the cache directory
+    MAX_BYTES: int = 64 * 1024 * 1024
+    EXTENSION: str = ".bin"
+    # the size of the chunks pattern files are hashed in, so they are never read into memory
+    HASH_BYTES: int = 1 << 20
+
+    def __init__(self, directory: str = "", max_bytes: int = MAX_BYTES) -> None:
+        """Initialise the cache, by default in $XDG_CACHE_HOME/gameoflife or ~/.cache/gameoflife."""
+        self.directory: str = directory or os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "gameoflife",
+        )
+        self.max_bytes: int = max_bytes
+
+    def key(self, file: str) -> str:
+        """Return the key of the file, a hash of its absolute path, mtime and contents."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{os.path.abspath(file)}\0{os.stat(file).st_mtime_ns}\0".encode()
+        )
+        with open(file, "rb") as file_data:
+            for chunk in iter(partial(file_data.read, PatternCache.HASH_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load(self, key: str) -> CachedPattern | None:
+        """
+        Return the rule, metadata and cells cached with the key, or None if there aren't any.
+
+        A blob that isn't what store() writes, e.g. because it is corrupt, is treated as a miss.
+        """
+        path: str = os.path.join(self.directory, key + PatternCache.EXTENSION)
+        try:
+            with open(path, "rb") as blob:
+                header: object = json.loads(blob.readline())
+                values: array[int] = array("q")
+                values.frombytes(blob.read())
+            # mark it as recently used, which is what the eviction goes by
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(header, dict) or len(values) % 2:
+            return None
+        rule: object = header.get("rule")
+        metadata: object = header.get("metadata")
+        if not isinstance(rule, str) or not PatternCache._is_metadata(metadata):
+            return None
+        half: int = len(values) // 2
+        return (rule, metadata, CellBuffer.from_arrays(values[:half], values[half:]))
+
+    @staticmethod
+    def _is_metadata(metadata: object) -> TypeGuard[list[list[str]]]:
+        """Return True if the metadata is a list of lists of strings."""
+        return isinstance(metadata, list) and all(
+            isinstance(data, list) and all(isinstance(item, str) for item in data)
+            for data in metadata
+        )
+
+    def store(self, key: str, pattern: CachedPattern) -> None:
+        """Cache the rule, metadata and cells with the key, then evict blobs over max_bytes."""
+        rule, metadata, cells = pattern
+        os.makedirs(self.directory, exist_ok=True)
+        path: str = os.path.join(self.directory, key + PatternCache.EXTENSION)
+        # written to a temporary file first so a half written blob is never loaded
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as blob:
+            blob.write(
+                json.dumps({"rule": rule, "metadata": metadata}).encode() + b"\n"
+            )
+            cells.rows.tofile(blob)
+            cells.cols.tofile(blob)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used blobs until the cache is no bigger than max_bytes."""
+        blobs: list[tuple[float, int, str]] = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(PatternCache.EXTENSION):
+                stats: os.stat_result = entry.stat()
+                blobs.append((stats.st_mtime, stats.st_size, entry.path))
+        total: int = sum(size for _, size, _ in blobs)
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+
+class CachedReader(FileReaderContextManager):
+    """
+    Reads a pattern file through a PatternCache, only parsing it with reader on a cache miss.
+
+    The reader mustn't stream, as the cells it reads are all stored in the cache. When streaming
+    iter_batches() yields the cells a row at a time, but they are all in memory already.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        reader: FileReaderContextManager,
+        cache: PatternCache,
+        stream: bool = False,
+    ) -> None:
+        """Initialise the reader, where reader reads the same file."""
+        super().__init__(file, stream)
+        self._reader: FileReaderContextManager = reader
+        self._cache: PatternCache = cache
+        self._cells: CellBuffer = CellBuffer()
+
+    def __enter__(self) -> FileReader:
+        """Enter context manager which causes the file to be loaded from the cache or parsed."""
+        key: str = self._cache.key(self._filename)
+        pattern: CachedPattern | None = self._cache.load(key)
+        if pattern is None:
+            with self._reader as reader:
+                pattern = (reader.rule, reader.metadata, reader.cells)
+            try:
+                self._cache.store(key, pattern)
+            except OSError:
+                # the cache is only an optimisation, so a cache that can't be written is skipped
+                pass
+        self.rule, self.metadata, self._cells = pattern
+        if not self._stream:
+            self.cells = self._cells
+        return self
+
+    def _read_batches(self) -> Iterator[CellBuffer]:
+        """Yield the cached cells a row of cells at a time, as slices of the buffer."""
+        start: int = 0
+        for _, row in groupby(self._cells.rows):
+            end: int = start + sum(1 for _ in row)
+            yield self._cells[start:end]
+            start = end
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager."""
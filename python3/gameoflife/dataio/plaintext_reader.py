@@ -1,8 +1,11 @@
 """File Loader for Plain Text file types."""
 
-from io import TextIOWrapper
+from array import array
+from itertools import chain
 from types import TracebackType
-import pyparsing as pp
+from typing import Iterable, Iterator, TextIO
+from gameoflife import CellBuffer
+from .compression import open_text
 from .file_reader import FileReader, FileReaderContextManager
 
 
@@ -19,51 +22,92 @@ OOO
 
 
 class PlainTextReader(FileReaderContextManager):
-    """Implements loading Plain Text data from files."""
+    """Implements loading Plain Text data from files, a line at a time."""
 
-    # !Name: Glider
-    # !Author: Richard K. Guy
-    # !The smallest, most common, and first discovered spaceship.
-    # !www.conwaylife.com/wiki/index.php?title=Glider
-    _METADATA_LINE: pp.ParserElement = pp.ZeroOrMore(
-        (
-            pp.AtLineStart("!").suppress()
-            + (pp.Optional(pp.Word(pp.printables + " ")) + pp.line_end.suppress())
-            .set_whitespace_chars(" \t")
-            .set_results_name("metadata", True)
-        )
-    )
+    def __init__(self, file: str, stream: bool = False) -> None:
+        """Initialise the reader."""
+        super().__init__(file, stream)
+        self._file: TextIO
+        # the first data line, which is read while looking for the end of the metadata
+        self._first_row: str = ""
+        # the number of empty rows before the first data line
+        self._empty_rows: int = 0
+
+    def __enter__(self) -> FileReader:
+        """
+        Enter context manager which causes the file to be parsed immediately.
+
+        When streaming only the metadata is parsed, the cells are read as iter_batches() is
+        iterated.
+        """
+        self._file = open_text(self._filename, "r")
+        self.metadata = []
+        # !Name: Glider
+        # !Author: Richard K. Guy
+        # !The smallest, most common, and first discovered spaceship.
+        # !www.conwaylife.com/wiki/index.php?title=Glider
+        line: str = self._file.readline()
+        blank_lines: int = 0
+        while line and (line[0] == "!" or not line.strip()):
+            if line[0] == "!":
+                self.metadata.append(PlainTextReader._parse_metadata(line))
+                blank_lines = 0
+            else:
+                blank_lines += 1
+            line = self._file.readline()
+        self._first_row = line
+        # blank lines before any metadata are skipped, but after it they are empty rows
+        self._empty_rows = blank_lines if self.metadata else 0
 
-    _CELL_STATES: pp.ParserElement = pp.one_of(". O").set_whitespace_chars(" \t")
+        if not self._stream:
+            for batch in self._read_batches():
+                self.cells.extend(batch)
+        return self
 
-    # .O
-    # ..O
-    # OOO
-    _DATA_ROWS: pp.ParserElement = pp.OneOrMore(
-        (pp.ZeroOrMore(_CELL_STATES) + pp.line_end.suppress()).set_results_name(
-            "data_rows", True
+    def _read_batches(self) -> Iterator[CellBuffer]:
+        """Read the data rows from the file, yielding the live cells a row of cells at a time."""
+        return PlainTextReader._decode(
+            chain((self._first_row,), self._file), self._empty_rows, self._filename
         )
-    )
 
-    _PARSER: pp.ParserElement = _METADATA_LINE + _DATA_ROWS
+    @staticmethod
+    def _parse_metadata(line: str) -> list[str]:
+        """Parse a metadata line into a list of its text, or an empty list if it has none."""
+        text: str = line[1:].rstrip("\r\n").lstrip(" \t")
+        return [text] if text else []
 
-    def __init__(self, file: str) -> None:
-        """Initialise the reader."""
-        super().__init__(file)
-        self._file: TextIOWrapper
+    @staticmethod
+    def _decode(
+        lines: Iterable[str], first_row: int, filename: str
+    ) -> Iterator[CellBuffer]:
+        """
+        Decode the data rows into batches of the Coordinates of their live cells, one per row.
 
-    def __enter__(self) -> FileReader:
-        """Enter context manager which causes the file to be parsed immediately."""
-        self._file = open(self._filename, "r", encoding="UTF-8")
-        results: pp.ParseResults = PlainTextReader._PARSER.parse_file(self._file)
-        self.metadata = (
-            results.metadata.as_list() if results.metadata else []  # type:ignore
-        )
-        for row_index, row in enumerate(results.data_rows.as_list()):  # type:ignore
-            for col_index, cell in enumerate(row):  # type:ignore
-                if cell == "O":
-                    self.cells.append((row_index, col_index))
-        return self
+        The first of the lines is row first_row. Raises ValueError for a row with anything other
+        than ".", "O", spaces and tabs.
+        """
+        # .O
+        # ..O
+        # OOO
+        for row_index, line in enumerate(lines, first_row):
+            # spaces and tabs between the cells are ignored
+            row: str = line.rstrip("\r\n").replace(" ", "").replace("\t", "")
+            if row.strip(".O"):
+                raise ValueError(
+                    f"Invalid Plain Text row {row_index}: {row!r}, from {filename}"
+                )
+            if "O" in row:
+                yield CellBuffer.from_row(
+                    row_index,
+                    array(
+                        "q",
+                        [
+                            col_index
+                            for col_index, cell in enumerate(row)
+                            if cell == "O"
+                        ],
+                    ),
+                )
 
     def __exit__(
         self,
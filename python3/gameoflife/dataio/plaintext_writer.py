@@ -1,8 +1,9 @@
 """File Writer for Plain Text file types."""
 
-from io import TextIOWrapper
 from types import TracebackType
-from gameoflife import Coordinate
+from typing import Iterable, TextIO
+from gameoflife import Bounds, Coordinate
+from .compression import open_text
 from .file_writer import FileWriter, FileWriterContextManager
 
 
@@ -21,14 +22,18 @@ OOO
 class PlainTextWriter(FileWriterContextManager):
     """Implements writing Plain Text data to files."""
 
+    # the number of rows to buffer before writing them to the file
+    BUFFER_ROWS: int = 1024
+    _LIVE: int = ord("O")
+
     def __init__(self, file: str) -> None:
         """Initialise the reader."""
         super().__init__(file)
-        self._file: TextIOWrapper
+        self._file: TextIO
 
     def __enter__(self) -> FileWriter:
         """Enter context manager which causes the file to be parsed immediately."""
-        self._file = open(self._filename, "w", encoding="UTF-8")
+        self._file = open_text(self._filename, "w")
         return self
 
     def __exit__(
@@ -40,38 +45,40 @@ class PlainTextWriter(FileWriterContextManager):
         """Exit context manager."""
         self._file.close()
 
-    def write(self, metadata: list[str], cells: list[Coordinate]) -> None:
-        """Write the Game of Life data to the file."""
-        for data in metadata:
-            self._file.write(f"!{data}\n")
-        if cells:
-            # find the min limits
-            min_row: int = cells[0][0]
-            min_col: int = cells[0][1]
-            for row, col in cells:
-                min_row = row if row < min_row else min_row
-                min_col = col if col < min_col else min_col
+    def write(
+        self,
+        metadata: list[str],
+        cells: Iterable[Coordinate],
+        bounds: Bounds | None = None,
+    ) -> None:
+        """
+        Write the Game of Life data to the file.
 
-            # keep track of where we wrote the last cell
+        Each row is assembled in a reusable buffer of dead cells and the rows are written a block
+        at a time. See FileWriter.write() for the cells and bounds.
+        """
+        blocks: list[str] = [f"!{data}\n" for data in metadata]
+        cells, bounds = self._find_bounds(cells, bounds)
+        if bounds is not None:
+            min_row, min_col, _, max_col = bounds
+            dead_row: bytes = b"." * (max_col - min_col + 1)
+            row_buffer: bytearray = bytearray(dead_row)
+            # the row being assembled, and the length of it up to its last live cell
             row_index: int = min_row
-            col_index: int = min_col
+            row_length: int = 0
             for row, col in cells:
-                # get the difference in rows from the "last" cell to this one
-                # this will be 0 when we're on the same row
-                row_difference: int = row - row_index
-                if row_difference > 0:
-                    # write out the number of newlines required
-                    self._file.write("\n" * row_difference)
-                    # reset the col_index as we are on a new row
-                    col_index = min_col
-                # get the difference in cols from the "last" cell to this one
-                col_difference: int = col - col_index
-                # if there is a col difference then that is a dead cell gap
-                if col_difference > 0:
-                    self._file.write("." * col_difference)
-                # finish by writing the live cell
-                self._file.write("O")
-                # update the index to point to the last cell +1 col of the cell we just wrote
-                row_index = row
-                col_index = col + 1
-            self._file.write("\n")
+                if row != row_index:
+                    # finish the row, with a newline for it and each of the empty rows after it
+                    blocks.append(
+                        row_buffer[:row_length].decode("ascii")
+                        + "\n" * (row - row_index)
+                    )
+                    row_buffer[:row_length] = dead_row[:row_length]
+                    row_index = row
+                    if len(blocks) >= PlainTextWriter.BUFFER_ROWS:
+                        self._file.write("".join(blocks))
+                        blocks = []
+                row_length = col - min_col + 1
+                row_buffer[row_length - 1] = PlainTextWriter._LIVE
+            blocks.append(row_buffer[:row_length].decode("ascii") + "\n")
+        self._file.write("".join(blocks))
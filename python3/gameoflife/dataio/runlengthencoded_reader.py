@@ -1,8 +1,13 @@
 """File Loader for Run Length Encoded file types."""
 
-from io import TextIOWrapper
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from types import TracebackType
-import pyparsing as pp
+from typing import Iterable, Iterator, TextIO
+from gameoflife import CellBuffer
+from .compression import open_text
 from .file_reader import FileReader, FileReaderContextManager
 
 
@@ -18,131 +23,211 @@ bob$2bo$3o!
 
 
 class RunLengthEncodedReader(FileReaderContextManager):
-    """Implements loading Run Length Encoded data from files."""
+    """
+    Implements loading Run Length Encoded data from files.
 
-    _INT_NUMBER: pp.ParserElement = pp.Word(pp.nums).set_parse_action(  # type:ignore
-        lambda t: [int(t[0])]  # type:ignore
-    )
+    The file is parsed in a single pass without building a parse tree: the metadata and header
+    lines are read a line at a time, then each line of data is split into runs by one regular
+    expression and each run count is decoded straight into a row of cells.
 
-    # is there an existing pyparsing element that has all alphas separated by spaces?
-    _CELL_STATES: pp.ParserElement = pp.one_of(" ".join(list(pp.alphas)))
-
-    # # N Glider
-    # # O Richard K. Guy
-    # #C www.conwaylife.com/wiki/index.php?title=Glider
-    # #
-    _METADATA_LINE: pp.ParserElement = pp.ZeroOrMore(
-        (
-            pp.AtLineStart("#").suppress()
-            + pp.Optional(
-                pp.one_of(" ".join(list(pp.printables)))
-            ).set_whitespace_chars(" \t")
-            + pp.Optional(pp.Word(pp.printables + " ")).set_whitespace_chars(" \t")
-        ).set_results_name("metadata", True)
-    )
+    Given more than one worker a large file which isn't streamed is decoded in parallel: the data
+    is split into chunks of whole rows, the first row of each chunk is found by counting the ends
+    of rows before it, and the chunks are decoded by a pool of processes into packed arrays.
+    """
+
+    # the smallest chunk of data worth decoding in another process
+    CHUNK_BYTES: int = 1 << 20
 
     # x = 3, y = 3, rule = B3/S23
     # x = 3, y = 3
-    _HEADER: pp.ParserElement = (
-        pp.one_of("x y") + pp.Suppress("=") + _INT_NUMBER + pp.Optional(",").suppress()
-    ).set_results_name("header", True) * 2
-
-    # Parse the actual rule in the future:
-    #   If a rule string is B34/S34:
-    #     B34 means a cell is born if it has 3 or 4 neighbors.
-    #     S34 means a cell survives if it has 3 or 4 neighbors.
-    # x = 3, y = 3, rule = B3/S23
-    # x = 3, y = 3
-    _RULE: pp.ParserElement = pp.Optional(
-        pp.Keyword("rule").suppress()
-        + pp.Suppress("=")
-        + pp.Word(pp.printables + " ").set_whitespace_chars(" \t")
-    ).set_results_name("rule")
+    _HEADER: re.Pattern[str] = re.compile(
+        r"\s*([xy])\s*=\s*(\d+)\s*,?\s*([xy])\s*=\s*(\d+)\s*,?"
+        + r"(?:\s*rule\s*=[ \t]*(\S[^\n]*?))?\s*"
+    )
 
-    # bob$2bo$3o!
+    # an optional run count followed by a cell state, or the end of a row or of the pattern
     #
     # 24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$2o8bo5bo3b2o$2o8bo3bob2o4b
     # obo$10bo5bo7bo$11bo3bo$12b2o!
-    _DATA_ROWS: pp.ParserElement = pp.OneOrMore(
-        (
-            pp.ZeroOrMore(pp.Optional(_INT_NUMBER) + _CELL_STATES)
-            + (
-                _INT_NUMBER + pp.Literal("$")
-                | pp.Literal("$").suppress()
-                | pp.Literal("!").suppress()
-            )
-        ).set_results_name("data_rows", True)
-    )
-
-    _PARSER: pp.ParserElement = _METADATA_LINE + _HEADER + _RULE + _DATA_ROWS
-
-    def __init__(self, file: str) -> None:
-        """Initialise the reader."""
-        super().__init__(file)
-        self._file: TextIOWrapper
+    _RUN: re.Pattern[str] = re.compile(r"(\d*)([A-Za-z$])|!")
+    # the end of one or more rows
+    _ROWS: re.Pattern[str] = re.compile(r"(\d*)\$")
+
+    def __init__(self, file: str, stream: bool = False, workers: int = 1) -> None:
+        """Initialise the reader, which decodes with up to workers processes if not streaming."""
+        super().__init__(file, stream)
+        self._workers: int = workers
+        self._file: TextIO
         self._cols: int
         self._rows: int
         self._rule: str
 
     def __enter__(self) -> FileReader:
-        """Enter context manager which causes the file to be parsed immediately."""
-        self._file = open(self._filename, "r", encoding="UTF-8")
-        # start: int = perf_counter_ns()
-        results: pp.ParseResults = RunLengthEncodedReader._PARSER.parse_file(self._file)
-        # last_gen_time: int = perf_counter_ns() - start
-        # print(f"Parsing finished in {round(last_gen_time / 1000)} µs")
-        self.metadata = (
-            results.metadata.as_list() if results.metadata else []  # type:ignore
+        """
+        Enter context manager which causes the file to be parsed immediately.
+
+        When streaming only the metadata and header are parsed, the cells are read as
+        iter_batches() is iterated.
+        """
+        self._file = open_text(self._filename, "r")
+        self.metadata = []
+        # #N Glider
+        # #C www.conwaylife.com/wiki/index.php?title=Glider
+        line: str = self._file.readline()
+        while line and (line[0] == "#" or not line.strip()):
+            if line[0] == "#":
+                self.metadata.append(RunLengthEncodedReader._parse_metadata(line))
+            line = self._file.readline()
+
+        self._cols, self._rows, rule = RunLengthEncodedReader._parse_header(
+            line, self._filename
         )
-        self._cols = int(results.header[0][1])  # type:ignore
-        self._rows = int(results.header[1][1])  # type:ignore
-        if results.rule:  # type: ignore
-            self._rule = results.rule[0]  # type: ignore
-
-        # print("Starting to process parsed data...")
-        # start = perf_counter_ns()
-        # create iterator in order to add types
-        row_iter: enumerate[list[int | str]] = enumerate(
-            results.data_rows  # type:ignore
+        if rule:
+            self._rule = rule
+            self.rule = rule
+
+        if not self._stream:
+            if self._workers > 1:
+                self._decode_parallel()
+            else:
+                for batch in self._read_batches():
+                    self.cells.extend(batch)
+        return self
+
+    def _decode_parallel(self) -> None:
+        """Decode the rest of the file into cells, in chunks of rows across a process pool."""
+        # whitespace is ignored anywhere and anything after the "!" is ignored
+        data: str = "".join(self._file.read().split())
+        end: int = data.find("!")
+        if end >= 0:
+            data = data[: end + 1]
+        chunks: list[str] = RunLengthEncodedReader._split(
+            data,
+            min(self._workers, len(data) // RunLengthEncodedReader.CHUNK_BYTES + 1),
         )
-        # it is necessary to keep track of an empty row offset for data like "7$"
-        empty_rows: int = 0
-        # iterate over the rows of data, equivalent to rows of cells
-        for row_index, data_row in row_iter:
-            col_index: int = 0
-            # create another iterator so we can add types
-            data_iter: enumerate[int | str] = enumerate(data_row)  # type:ignore
-            # iterate of the data elements - note not equivalent to cells yet
-            for data_index, data in data_iter:
-                # if we get an int then we replicate that number of cells
-                if isinstance(data, int):
-                    # is it a number of empty rows
-                    if data_row[data_index + 1] == "$":
-                        # track the number of empty rows, subtract 1 to avoid double counting it
-                        # because we are currently processing the first empty row
-                        empty_rows += data - 1
-                    # if it is not an empty row
+        if len(chunks) == 1:
+            for batch in RunLengthEncodedReader._decode([data], self._filename):
+                self.cells.extend(batch)
+            return
+        first_rows: list[int] = [0]
+        for chunk in chunks[:-1]:
+            first_rows.append(
+                first_rows[-1]
+                + sum(
+                    int(count) if count else 1
+                    for count in RunLengthEncodedReader._ROWS.findall(chunk)
+                )
+            )
+        with ProcessPoolExecutor(len(chunks)) as pool:
+            for cells in pool.map(
+                RunLengthEncodedReader._decode_chunk,
+                chunks,
+                first_rows,
+                repeat(self._filename),
+            ):
+                self.cells.extend(cells)
+
+    @staticmethod
+    def _split(data: str, chunks: int) -> list[str]:
+        """Split the data into about equal chunks, each but the last ending after a "$"."""
+        pieces: list[str] = []
+        start: int = 0
+        for index in range(1, chunks):
+            end: int = data.find("$", max(start, len(data) * index // chunks)) + 1
+            if not end:
+                break
+            pieces.append(data[start:end])
+            start = end
+        pieces.append(data[start:])
+        return pieces
+
+    @staticmethod
+    def _decode_chunk(chunk: str, first_row: int, filename: str) -> CellBuffer:
+        """Decode a chunk of whole rows starting at first_row, which is pickled as its arrays."""
+        cells: CellBuffer = CellBuffer()
+        for batch in RunLengthEncodedReader._decode([chunk], filename, first_row):
+            cells.extend(batch)
+        return cells
+
+    def _read_batches(self) -> Iterator[CellBuffer]:
+        """Read the data rows from the file, yielding the live cells a row of cells at a time."""
+        return RunLengthEncodedReader._decode(self._file, self._filename)
+
+    @staticmethod
+    def _parse_metadata(line: str) -> list[str]:
+        """
+        Parse a metadata line into its type character and its text, either of which is optional.
+
+        For example "#N Glider" is ["N", "Glider"], "#C" is ["C"] and "#" is [].
+        """
+        content: str = line[1:].rstrip("\r\n").lstrip(" \t")
+        if not content:
+            return []
+        text: str = content[1:].lstrip(" \t")
+        return [content[0], text] if text else [content[0]]
+
+    @staticmethod
+    def _parse_header(line: str, filename: str) -> tuple[int, int, str]:
+        """Parse the header line into the number of cols, the number of rows and the rule."""
+        match: re.Match[str] | None = RunLengthEncodedReader._HEADER.fullmatch(line)
+        if match is None:
+            raise ValueError(f"Expected an RLE header line: {line!r}, from {filename}")
+        # the x and y values are the cols and rows in the order they are given
+        return int(match[2]), int(match[4]), match[5] or ""
+
+    @staticmethod
+    def _decode(  # pylint: disable=too-many-branches
+        lines: Iterable[str], filename: str, first_row: int = 0
+    ) -> Iterator[CellBuffer]:
+        """
+        Decode the data rows into batches of the Coordinates of their live cells, one per row.
+
+        Any letter other than "o" is a dead cell, a run count before "$" ends that many rows,
+        whitespace is ignored anywhere and anything after the "!" is ignored. Raises ValueError
+        for anything else.
+        """
+        row: int = first_row
+        col: int = 0
+        # the cols of the live cells of the current row
+        cols: array[int] = array("q")
+        # the end of the previous line which wasn't a whole run, which can only be a run count
+        carry: str = ""
+        for line in lines:
+            data: str = carry + "".join(line.split())
+            position: int = 0
+            for match in RunLengthEncodedReader._RUN.finditer(data):
+                if match.start() != position:
+                    break
+                position = match.end()
+                # both are None for the "!" at the end of the pattern
+                count_str, state = match.groups()
+                count: int = int(count_str) if count_str else 1
+                if state == "o":
+                    if count == 1:
+                        cols.append(col)
                     else:
-                        live: bool = data_row[data_index + 1] == "o"
-                        # if we are adding live cells add their coords to the list of cells
-                        if live:
-                            for _ in range(data):
-                                self.cells.append((row_index + empty_rows, col_index))
-                                col_index += 1
-                        # "skip" dead cells by adding them as an offset to the col index
-                        else:
-                            col_index += data
-                    # skip the next data value as we just "used" it
-                    next(data_iter, None)
-                # otherwise transform the data value to a cell value and store it
+                        cols.extend(range(col, col + count))
+                    col += count
+                elif state == "$":
+                    if cols:
+                        yield CellBuffer.from_row(row, cols)
+                        cols = array("q")
+                    row += count
+                    col = 0
+                elif state is None:
+                    if cols:
+                        yield CellBuffer.from_row(row, cols)
+                    return
                 else:
-                    live = data_row[data_index] == "o"
-                    if live:
-                        self.cells.append((row_index + empty_rows, col_index))
-                    col_index += 1
-        # last_gen_time = perf_counter_ns() - start
-        # print(f"Processing parsed data finished in {round(last_gen_time / 1000)} µs")
-        return self
+                    col += count
+            carry = data[position:]
+            if carry and not carry.isdigit():
+                break
+        # a pattern missing its "!" ends with the data
+        if carry:
+            raise ValueError(f"Invalid RLE data: {carry[:20]!r}, from {filename}")
+        if cols:
+            yield CellBuffer.from_row(row, cols)
 
     def __exit__(
         self,
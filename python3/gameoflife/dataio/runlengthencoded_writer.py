@@ -0,0 +1,119 @@
+"""File Writer for Run Length Encoded file types."""
+
+from types import TracebackType
+from typing import Iterable, TextIO
+from gameoflife import Bounds, Coordinate
+from .compression import open_text
+from .file_writer import FileWriter, FileWriterContextManager
+
+
+# pylint: disable=pointless-string-statement
+"""
+#C The smallest, most common, and first discovered spaceship.
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+
+class RunLengthEncodedWriter(FileWriterContextManager):
+    """
+    Implements writing Run Length Encoded data to files.
+
+    The runs are encoded on the fly from the row ordered cells, only ever looking at the previous
+    cell, and the output is written a block of lines at a time.
+    """
+
+    # the maximum length of a line of data, as recommended by the RLE format
+    LINE_LENGTH: int = 70
+    # the number of runs to buffer before wrapping them into lines and writing them to the file
+    BUFFER_RUNS: int = 8192
+
+    def __init__(self, file: str) -> None:
+        """Initialise the writer."""
+        super().__init__(file)
+        self._file: TextIO
+        # the runs of the last line which hasn't been written yet, and its length
+        self._line: list[str] = []
+        self._length: int = 0
+
+    def __enter__(self) -> FileWriter:
+        """Enter context manager which causes the file to be opened immediately."""
+        self._file = open_text(self._filename, "w")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager."""
+        self._file.close()
+
+    def write(  # pylint: disable=too-many-locals
+        self,
+        metadata: list[str],
+        cells: Iterable[Coordinate],
+        bounds: Bounds | None = None,
+    ) -> None:
+        """Write the metadata and cells to the file, see FileWriter for the arguments."""
+        for data in metadata:
+            self._file.write(f"#C {data}\n" if data else "#C\n")
+        cells, bounds = self._find_bounds(cells, bounds)
+        min_row, min_col, max_row, max_col = bounds if bounds else (0, 0, -1, -1)
+        self._file.write(
+            f"x = {max_col - min_col + 1}, y = {max_row - min_row + 1}, rule = {self.rule}\n"
+        )
+
+        runs: list[str] = []
+        # the row and col after the last cell, and the length of the run of live cells that
+        # ends with it which hasn't been added to runs yet
+        row_index: int = min_row
+        col_index: int = min_col
+        live_run: int = 0
+        for row, col in cells:
+            if col == col_index and row == row_index:
+                live_run += 1
+                col_index += 1
+                continue
+            # the run of live cells has ended, then come maybe some new rows and dead cells
+            if live_run:
+                runs.append(f"{live_run}o" if live_run > 1 else "o")
+            if row != row_index:
+                rows: int = row - row_index
+                runs.append(f"{rows}$" if rows > 1 else "$")
+                col_index = min_col
+            dead_run: int = col - col_index
+            if dead_run:
+                runs.append(f"{dead_run}b" if dead_run > 1 else "b")
+            row_index = row
+            col_index = col + 1
+            live_run = 1
+            if len(runs) >= RunLengthEncodedWriter.BUFFER_RUNS:
+                self._write_runs(runs)
+                runs = []
+        if live_run:
+            runs.append(f"{live_run}o" if live_run > 1 else "o")
+        runs.append("!")
+        self._write_runs(runs)
+        self._file.write("".join(self._line) + "\n")
+        self._line = []
+        self._length = 0
+
+    def _write_runs(self, runs: list[str]) -> None:
+        """Wrap the runs into lines and write all but the last line, which can still grow."""
+        lines: list[str] = []
+        line: list[str] = self._line
+        length: int = self._length
+        for run in runs:
+            # runs are never split across lines
+            if length + len(run) > RunLengthEncodedWriter.LINE_LENGTH:
+                lines.append("".join(line))
+                line = []
+                length = 0
+            line.append(run)
+            length += len(run)
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+        self._line = line
+        self._length = length
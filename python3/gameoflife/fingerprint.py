@@ -0,0 +1,85 @@
+"""
+Fingerprints of the live cells of a universe, which can be updated a cell at a time.
+
+The hash of the live cells is the sum of ROW_BASE^row * COL_BASE^col over all of them, modulo a
+large prime. A birth or death just adds or subtracts the term of that cell, and translating every
+cell by rows and cols multiplies the hash by ROW_BASE^rows * COL_BASE^cols, which is what allows
+a pattern to be recognised wherever it has moved to.
+"""
+
+from functools import lru_cache
+from typing import Iterable
+from gameoflife.coordinate import Coordinate
+
+MODULUS: int = (1 << 61) - 1  # a Mersenne prime
+ROW_BASE: int = 0x1F3A_5C7E_9B2D_4F61 % MODULUS
+COL_BASE: int = 0x2B7E_1516_28AE_D2A6 % MODULUS
+# the number of powers of each base kept, enough for the rows and cols of most patterns, while
+# patterns that wander off keep replacing the least recently used ones
+POWER_CACHE_SIZE: int = 1 << 14
+
+
+@lru_cache(maxsize=POWER_CACHE_SIZE)
+def _row_power(row: int) -> int:
+    """Return ROW_BASE^row modulo MODULUS, negative rows use the modular inverse."""
+    return pow(ROW_BASE, row, MODULUS)
+
+
+@lru_cache(maxsize=POWER_CACHE_SIZE)
+def _col_power(col: int) -> int:
+    """Return COL_BASE^col modulo MODULUS, negative cols use the modular inverse."""
+    return pow(COL_BASE, col, MODULUS)
+
+
+class Fingerprint:
+    """
+    The hash, population and sums of the rows and cols of the live cells of a universe.
+
+    The sums give the centroid of the live cells, and the floor of the centroid is the anchor,
+    which moves by exactly as much as the cells are translated. Moving the hash so the anchor is
+    at 0,0 gives a normalised hash which is the same wherever the pattern is.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the fingerprint of an empty universe."""
+        self.hash: int = 0
+        self.population: int = 0
+        self.row_sum: int = 0
+        self.col_sum: int = 0
+
+    @staticmethod
+    def from_cells(cells: Iterable[Coordinate]) -> "Fingerprint":
+        """Create the fingerprint of the given live cells."""
+        fingerprint: Fingerprint = Fingerprint()
+        for row, col in cells:
+            fingerprint.flip(row, col, True)
+        return fingerprint
+
+    def flip(self, row: int, col: int, live: bool) -> None:
+        """Update the fingerprint for a cell which was born when live, or died otherwise."""
+        term: int = _row_power(row) * _col_power(col)
+        if live:
+            self.hash = (self.hash + term) % MODULUS
+            self.population += 1
+            self.row_sum += row
+            self.col_sum += col
+        else:
+            self.hash = (self.hash - term) % MODULUS
+            self.population -= 1
+            self.row_sum -= row
+            self.col_sum -= col
+
+    @property
+    def anchor(self) -> Coordinate:
+        """Return the floor of the centroid of the live cells, or 0,0 if there aren't any."""
+        if not self.population:
+            return (0, 0)
+        return (self.row_sum // self.population, self.col_sum // self.population)
+
+    def normalised(self) -> tuple[int, int]:
+        """Return the hash moved so that the anchor is at 0,0, and the population."""
+        row, col = self.anchor
+        return (
+            self.hash * _row_power(-row) * _col_power(-col) % MODULUS,
+            self.population,
+        )
@@ -1,16 +1,23 @@
 """Game of Life abstract class specifying the interface."""
 
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 from gameoflife.dataio.file_reader import FileReader
-from gameoflife import Coordinate
+from gameoflife import Bounds, CellBuffer, Coordinate
+from gameoflife.fingerprint import Fingerprint
+from gameoflife.rule import CONWAY, Rule
 
 
 class GameOfLife(ABC):
     """Abstract class to specify the interface for different implementations of Game of Life."""
 
+    # the number of rows read at a time by the default iter_live_cells()
+    BAND_ROWS: int = 64
+
     def __init__(self) -> None:
         """Initialise."""
         self._generation: int = 0
+        self._rule: Rule = CONWAY
 
     @abstractmethod
     def __str__(self) -> str:
@@ -20,18 +27,69 @@ class GameOfLife(ABC):
     def progress(self) -> int:
         """Progress another generation, return the number of live cells in the new generation."""
 
+    def progress_many(self, generations: int, want_counts: bool = False) -> list[int]:
+        """
+        Progress the given number of generations.
+
+        Return the number of live cells after each generation if want_counts is True, otherwise
+        an empty list, which lets implementations skip counting the live cells.
+        """
+        counts: list[int] = []
+        for _ in range(generations):
+            count: int = self.progress()
+            if want_counts:
+                counts.append(count)
+        return counts
+
     @abstractmethod
     def set_cell(self, row: int, col: int, live: bool) -> None:
         """Set a cell in the universe to the given live value."""
 
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """
+        Set all the given cells live.
+
+        By default set_cell() is called for each cell, implementations can instead set them all
+        with one bulk operation, which is how add_cells() loads patterns.
+        """
+        for row, col in cells:
+            self.set_cell(row, col, True)
+
     @abstractmethod
     def count_live_cells(self) -> int:
-        """Count the total number of live cells in the GoL universe."""
+        """
+        Return the total number of live cells in the GoL universe.
+
+        Implementations keep track of the count as cells are born and die, rather than counting
+        every cell, as the UI asks for it after every key press.
+        """
+
+    @property
+    @abstractmethod
+    def bounds(self) -> Bounds | None:
+        """
+        Return the min row, min col, max row and max col of the live cells, or None if none.
+
+        The bounds are tight, so they shrink again as well as grow as the live cells move. They are
+        O(1) for the engines that keep statistics of their cells as they change. The others work
+        them out from their cells when first asked for after a generation, then only again when a
+        set cell on an edge of the bounds dies.
+        """
 
     @abstractmethod
     def get_cell(self, row: int, col: int) -> bool | None:
         """Return the live status of the given cell."""
 
+    @abstractmethod
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """
+        Return the live cells of the region of rows by cols cells with its top left at row, col.
+
+        The region is a list of one int per row from top to bottom, where bit N is set if the
+        cell in col + N of the row is live, the same as a row of cells in gameoflife.bitrows.
+        Cells outside of a universe of a fixed size are returned as dead.
+        """
+
     @property
     def generation(self) -> int:
         """Return the current generation of the game."""
@@ -42,15 +100,71 @@ class GameOfLife(ABC):
         """Return the current generation of the game."""
         self._generation = gen
 
+    @property
+    def rule(self) -> Rule:
+        """Return the rule the game is progressed with."""
+        return self._rule
+
+    @rule.setter
+    def rule(self, rule: Rule) -> None:
+        """Set the rule the game is progressed with, raise a ValueError if it isn't supported."""
+        self._check_rule(rule)
+        self._rule = rule
+
+    def _check_rule(self, rule: Rule) -> None:
+        """Raise a ValueError if the rule isn't supported, by default only Conway's rule is."""
+        if rule != CONWAY:
+            raise ValueError(f"{type(self).__name__} only supports the rule {CONWAY}.")
+
     def add_cells(self, reader: FileReader) -> None:
-        """Load cells from the given reader."""
-        for row, col in reader.cells:
-            self.set_cell(row, col, True)
+        """
+        Load cells from the given reader, and the rule if the file has one.
 
-    @abstractmethod
-    def get_live_cells(self) -> list[Coordinate]:
+        The cells are consumed a batch at a time, so a streaming reader is read as they are set,
+        and each batch is set with set_cells().
+        """
+        if reader.rule:
+            self.rule = Rule(reader.rule)
+        for batch in reader.iter_batches():
+            self.set_cells(batch)
+
+    def fingerprint(self) -> Fingerprint:
+        """
+        Return the fingerprint of the live cells.
+
+        By default it is computed from all the live cells, implementations can instead keep it
+        updated as cells are born and die, in which case it can change after it is returned.
+        """
+        return Fingerprint.from_cells(self.iter_live_cells())
+
+    def get_live_cells(self) -> CellBuffer:
+        """
+        Return a CellBuffer of the Coordinates of all the live cells.
+
+        The cells must be sorted by row top to bottom and then in the row from left to right.
+        """
+        return CellBuffer(self.iter_live_cells())
+
+    def iter_live_cells(self) -> Iterator[Coordinate]:
         """
-        Return a list of the Coordinates of all the live cells.
+        Yield the Coordinates of all the live cells, by row top to bottom then left to right.
 
-        The list must be sorted by row top to bottom and then in the row from left to right.
+        By default the cells are read with get_region() a band of rows of the bounds at a time,
+        so only one band is in memory at once. The game mustn't change while iterating.
         """
+        bounds: Bounds | None = self.bounds
+        if bounds is None:
+            return
+        min_row, min_col, max_row, max_col = bounds
+        for first_row in range(min_row, max_row + 1, GameOfLife.BAND_ROWS):
+            region: list[int] = self.get_region(
+                first_row,
+                min_col,
+                min(GameOfLife.BAND_ROWS, max_row + 1 - first_row),
+                max_col + 1 - min_col,
+            )
+            for index, cells in enumerate(region):
+                while cells:
+                    lowest: int = cells & -cells
+                    yield (first_row + index, min_col + lowest.bit_length() - 1)
+                    cells ^= lowest
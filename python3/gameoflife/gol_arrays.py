@@ -1,17 +1,22 @@
 """Game of Life array based implementation."""
 
-from gameoflife import GameOfLife, Coordinate
+from typing import Iterable, Iterator
+from gameoflife import Bounds, GameOfLife, Coordinate
+from gameoflife.cell_stats import CellStats
+from gameoflife.rule import CONWAY, Rule
 
 
 class GameOfLifeArrays(GameOfLife):
     """Implements Game of Life using two fixed size arrays, with universe wrap around."""
 
-    def __init__(self, rows: int, cols: int) -> None:
+    def __init__(self, rows: int, cols: int, rule: Rule = CONWAY) -> None:
         """Initialise the two parallel arrays."""
         super().__init__()
         self._a_array: list[list[bool]] = [
             [False for _ in range(cols)] for _ in range(rows)
         ]
+        self._stats: CellStats = CellStats()
+        self.rule = rule
 
     def progress(self) -> int:
         """Progress the game another generation."""
@@ -20,27 +25,43 @@ class GameOfLifeArrays(GameOfLife):
             [False for _ in range(len(self._a_array[0]))]
             for _ in range(len(self._a_array))
         ]
-        count: int = 0
-
-        # loop through every cell on the board and update the _b array with the next gen.
-        for row_index, row_list in enumerate(self._a_array):
-            for col_index, live in enumerate(row_list):
-                num_neighbours: int = self._count_neighbours(row_index, col_index)
-                # 1. Any cell, dead or alive, with exactly 3 neighbours is alive in next gen.
-                if num_neighbours == 3:
-                    next_gen[row_index][col_index] = True
-                    count += 1
-                # 2. A live cell with exactly 2 neighbours is alive in the next generation.
-                elif live is True and num_neighbours == 2:
-                    next_gen[row_index][col_index] = True
-                    count += 1
-                # 3. All other cells are dead in the next generation.
-                # do nothing
+        self._stats = self._next_generation(next_gen)
 
         # swap the arrays
         self._a_array = next_gen
         self.generation += 1
-        return count
+        return self._stats.population
+
+    def progress_many(self, generations: int, want_counts: bool = False) -> list[int]:
+        """Progress the given number of generations, reusing the array of each old generation."""
+        counts: list[int] = []
+        spare: list[list[bool]] = [
+            [False for _ in range(len(self._a_array[0]))]
+            for _ in range(len(self._a_array))
+        ]
+        for _ in range(generations):
+            self._stats = self._next_generation(spare)
+            # swap the arrays
+            self._a_array, spare = spare, self._a_array
+            if want_counts:
+                counts.append(self._stats.population)
+        self.generation += generations
+        return counts
+
+    def _next_generation(self, next_gen: list[list[bool]]) -> CellStats:
+        """Write every cell of the next generation into next_gen, return its statistics."""
+        stats: CellStats = CellStats()
+        table: bytes = self._rule.table
+
+        # loop through every cell on the board and update next_gen with the next gen.
+        for row_index, new_row in enumerate(next_gen):
+            for col_index, _ in enumerate(new_row):
+                # the rule gives the next state of the cell from its neighbourhood
+                live: bool = table[self._neighbourhood(row_index, col_index)] == 1
+                new_row[col_index] = live
+                if live:
+                    stats.add(row_index, col_index)
+        return stats
 
     def set_cell(self, row: int, col: int, live: bool) -> None:
         """
@@ -51,16 +72,37 @@ class GameOfLifeArrays(GameOfLife):
         single monitor screen) this will usually simply mean that every cell in the array is set,
         and on the first generation every cell will die.
         """
-        self._a_array[row % len(self._a_array)][col % len(self._a_array[0])] = live
+        row %= len(self._a_array)
+        col %= len(self._a_array[0])
+        if self._a_array[row][col] != live:
+            self._a_array[row][col] = live
+            if live:
+                self._stats.add(row, col)
+            else:
+                self._stats.remove(row, col)
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live, wrapping them around like set_cell()."""
+        rows: int = len(self._a_array)
+        cols: int = len(self._a_array[0])
+        array: list[list[bool]] = self._a_array
+        born: list[Coordinate] = []
+        for row, col in cells:
+            row %= rows
+            col %= cols
+            if not array[row][col]:
+                array[row][col] = True
+                born.append((row, col))
+        self._stats.add_cells(born)
 
     def count_live_cells(self) -> int:
-        """Count the total number of live cells in the GoL universe."""
-        count: int = 0
-        for row in self._a_array:
-            for live in row:
-                if live:
-                    count += 1
-        return count
+        """Return the total number of live cells, which is kept updated as cells change."""
+        return self._stats.population
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        return self._stats.bounds
 
     def get_cell(self, row: int, col: int) -> bool | None:
         """Return the live status of the given cell."""
@@ -74,23 +116,32 @@ class GameOfLifeArrays(GameOfLife):
         else:
             return None
 
-    def get_live_cells(self) -> list[Coordinate]:
-        """
-        Return a list of the Coordinates of all the live cells.
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, from slices of the rows."""
+        region: list[int] = [0] * rows
+        # only the part of the region inside the array can have live cells
+        first_col: int = max(col, 0)
+        end_col: int = min(col + cols, len(self._a_array[0]))
+        for array_row in range(max(row, 0), min(row + rows, len(self._a_array))):
+            cells: int = 0
+            for index, live in enumerate(self._a_array[array_row][first_col:end_col]):
+                if live:
+                    cells |= 1 << index
+            region[array_row - row] = cells << (first_col - col)
+        return region
 
-        The list must be sorted by row top to bottom and then in the row from left to right.
-        """
-        live_cells: list[Coordinate] = []
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the Coordinates of all the live cells, by row top to bottom then left to right."""
         for row_index, row in enumerate(self._a_array):
             for col_index, cell in enumerate(row):
                 if cell:
-                    live_cells.append((row_index, col_index))
-        return live_cells
+                    yield (row_index, col_index)
 
-    def _count_neighbours(self, row: int, col: int) -> int:
-        """Count how many of the 8 neighbours of this cell are alive."""
-        count = 0
+    def _check_rule(self, rule: Rule) -> None:
+        """Every rule is supported, as every cell is evaluated every generation."""
 
+    def _neighbourhood(self, row: int, col: int) -> int:
+        """Return the neighbourhood of this cell, one bit for it and each of its 8 neighbours."""
         # check if we need to wrap around
         # if y==0 we can't decrement further, so wrap around to other extreme of array
         top: int = len(self._a_array) - 1 if row == 0 else row - 1
@@ -102,17 +153,21 @@ class GameOfLifeArrays(GameOfLife):
         # if x==a[0].length-1 we can't increment, so wrap around to 0
         right: int = 0 if col == len(self._a_array[0]) - 1 else col + 1
 
-        # check all the neighbours
-        count += self._a_array[top][left]
-        count += self._a_array[top][col]
-        count += self._a_array[top][right]
-        count += self._a_array[row][left]
-        # we don't do a[y][x] because it's the cell we're testing
-        count += self._a_array[row][right]
-        count += self._a_array[bottom][left]
-        count += self._a_array[bottom][col]
-        count += self._a_array[bottom][right]
-        return count
+        # check all the neighbours, and the cell itself in the centre bit
+        above: list[bool] = self._a_array[top]
+        middle: list[bool] = self._a_array[row]
+        below: list[bool] = self._a_array[bottom]
+        return (
+            above[left]
+            | above[col] << 1
+            | above[right] << 2
+            | middle[left] << 3
+            | middle[col] << 4
+            | middle[right] << 5
+            | below[left] << 6
+            | below[col] << 7
+            | below[right] << 8
+        )
 
     def __str__(self) -> str:
         """Return the a array as a formatted string."""
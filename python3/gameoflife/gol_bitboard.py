@@ -0,0 +1,169 @@
+"""Game of Life bitboard implementation, using one Python int per row of cells."""
+
+from typing import Iterable, Iterator
+from gameoflife import Bounds, Coordinate, GameOfLife
+from gameoflife.coordinate import grow_bounds, on_edge
+from gameoflife.bitrows import cell_rows, next_row, row_bounds, row_region
+
+
+class GameOfLifeBitboard(GameOfLife):  # pylint: disable=too-many-instance-attributes
+    """
+    Implements Game of Life using a fixed size universe with one int per row, one bit per cell.
+
+    The universe either wraps around at the edges, or when wrap is False it is bounded and every
+    cell outside of it is always dead.
+
+    The number of live cells is counted at the end of each progress() and kept updated by
+    set_cell(), the bounds are worked out from the rows when first asked for after a change.
+    """
+
+    def __init__(self, rows: int, cols: int, wrap: bool = True) -> None:
+        """Initialise the rows of the universe to be all dead."""
+        super().__init__()
+        self._rows: list[int] = [0] * rows
+        self._cols: int = cols
+        self._wrap: bool = wrap
+        self._mask: int = (1 << cols) - 1
+        # None when it needs counting again
+        self._live_count: int | None = 0
+        self._bounds: Bounds | None = None
+        self._bounds_stale: bool = False
+
+    def progress(self) -> int:
+        """Progress the game another generation."""
+        self._rows = self._next_generation(self._rows)
+        self.generation += 1
+        self._live_count = None
+        self._bounds_stale = True
+        return self.count_live_cells()
+
+    def progress_many(self, generations: int, want_counts: bool = False) -> list[int]:
+        """Progress the given number of generations, only counting live cells if wanted."""
+        if want_counts:
+            return super().progress_many(generations, want_counts)
+        rows: list[int] = self._rows
+        for _ in range(generations):
+            rows = self._next_generation(rows)
+        self._rows = rows
+        self.generation += generations
+        self._live_count = None
+        self._bounds_stale = True
+        return []
+
+    def _next_generation(self, rows: list[int]) -> list[int]:
+        """Compute the rows of the next generation from the given rows."""
+        mask: int = self._mask
+        # add the cells just outside the left and right edges to every row
+        extended: list[int]
+        if self._wrap:
+            left_shift: int = self._cols - 1
+            right_shift: int = self._cols + 1
+            extended = [
+                (row << 1) | (row >> left_shift) | ((row & 1) << right_shift)
+                for row in rows
+            ]
+        else:
+            extended = [row << 1 for row in rows]
+        # the rows just outside the top and bottom edges
+        top: int = extended[-1] if self._wrap and extended else 0
+        bottom: int = extended[0] if self._wrap and extended else 0
+
+        last: int = len(rows) - 1
+        return [
+            next_row(
+                extended[row_index - 1] if row_index else top,
+                row,
+                extended[row_index + 1] if row_index < last else bottom,
+                mask,
+            )
+            for row_index, row in enumerate(extended)
+        ]
+
+    def set_cell(self, row: int, col: int, live: bool) -> None:
+        """
+        Set a cell in the universe to the given live value.
+
+        When the universe wraps, cells outside of it will wrap around as their coordinate will be
+        modulo the number of rows and cols. Otherwise cells outside of it are ignored.
+        """
+        if self._wrap:
+            row %= len(self._rows)
+            col %= self._cols
+        elif not (0 <= row < len(self._rows) and 0 <= col < self._cols):
+            return
+        if (self._rows[row] >> col) & 1 == live:
+            return
+        if live:
+            self._rows[row] |= 1 << col
+        else:
+            self._rows[row] &= ~(1 << col)
+        if self._live_count is not None:
+            self._live_count += 1 if live else -1
+        if not self._bounds_stale:
+            # a birth can only grow the bounds, a death can only shrink them from an edge
+            if live:
+                self._bounds = grow_bounds(self._bounds, row, col)
+            elif on_edge(self._bounds, row, col):
+                self._bounds_stale = True
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live, a whole row at a time, like set_cell() does."""
+        rows: list[int] = self._rows
+        born: int = 0
+        for row, cells_row in cell_rows(
+            cells, len(rows), self._cols, self._wrap
+        ).items():
+            born += (cells_row & ~rows[row]).bit_count()
+            rows[row] |= cells_row
+        if born:
+            if self._live_count is not None:
+                self._live_count += born
+            self._bounds_stale = True
+
+    def count_live_cells(self) -> int:
+        """Return the total number of live cells, only counting them if they have changed."""
+        if self._live_count is None:
+            self._live_count = sum(row.bit_count() for row in self._rows)
+        return self._live_count
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        if self._bounds_stale:
+            self._bounds = row_bounds(self._rows)
+            self._bounds_stale = False
+        return self._bounds
+
+    def get_cell(self, row: int, col: int) -> bool | None:
+        """Return the live status of the given cell."""
+        if 0 <= row < len(self._rows) and 0 <= col < self._cols:
+            return (self._rows[row] >> col) & 1 == 1
+        return None
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, shifted out of the rows."""
+        return [
+            (
+                row_region(self._rows[region_row], col, cols)
+                if 0 <= region_row < len(self._rows)
+                else 0
+            )
+            for region_row in range(row, row + rows)
+        ]
+
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the Coordinates of all the live cells, by row top to bottom then left to right."""
+        for row_index, row in enumerate(self._rows):
+            while row:
+                lowest: int = row & -row
+                yield (row_index, lowest.bit_length() - 1)
+                row ^= lowest
+
+    def __str__(self) -> str:
+        """Return the universe as a formatted string."""
+        str_list: list[str] = ["Generation: " + str(self.generation)]
+        for row in self._rows:
+            str_list.append(
+                "".join("■ " if (row >> col) & 1 else "□ " for col in range(self._cols))
+            )
+        return "\n".join(str_list)
@@ -1,90 +1,182 @@
 """Game of Life dict implementation."""
 
-from gameoflife import Coordinate, GameOfLife
+from typing import Iterable, Iterator
+from gameoflife import Bounds, Coordinate, GameOfLife
+from gameoflife.cell_stats import CellStats
+from gameoflife.fingerprint import Fingerprint
+from gameoflife.rule import CENTRE_BIT, CONWAY, NEIGHBOUR_BITS, Rule
 
 
 class GameOfLifeDict(GameOfLife):
-    """Implements Game of Life using a Python dict implementation."""
+    """
+    Implements Game of Life using a Python dict implementation.
 
-    def __init__(self) -> None:
+    The dict maps the coordinates of every live cell, and every dead cell with live neighbours, to
+    its state: the number of live neighbours shifted left by one, with the live flag in bit 0. The
+    neighbour counts are updated as cells are born and die, and only cells whose state changed
+    last generation are evaluated, so progressing is proportional to the number of changed cells.
+
+    The state of a cell is also the index of its next state in the next_state table of an outer
+    totalistic rule. With an isotropic non-totalistic rule the neighbourhoods of the cells to
+    evaluate are looked up in the table of the rule instead, which is slower.
+    """
+
+    def __init__(self, rule: Rule = CONWAY) -> None:
         """Initialise the map."""
         super().__init__()
-        self._cells: dict[Coordinate, bool] = {}
-        self._min_row: int
-        self._max_row: int
-        self._min_col: int
-        self._max_col: int
+        self._cells: dict[Coordinate, int] = {}
+        # the cells whose state changed since they were last evaluated
+        self._dirty: set[Coordinate] = set()
+        self._stats: CellStats = CellStats()
+        # only kept updated once it has been asked for
+        self._fingerprint: Fingerprint | None = None
+        self.rule = rule
 
     def __str__(self) -> str:
         """Iterate over all the cells and return a human readable string."""
         str_list: list[str] = ["Generation: " + str(self.generation)]
-        for row in range(self._min_row, self._max_row + 1):  # add 1 to include last
-            row_list: list[str] = []
-            for col in range(self._min_col, self._max_col + 1):  # add 1 to include last
-                if (row, col) in self._cells:
-                    row_list.append("■ " if self._cells.get((row, col)) else "□ ")
-                else:
-                    row_list.append("  ")
-            str_list.append("".join(row_list))
+        # only the live cells are in the bounds, not the dead cells tracked for their counts
+        bounds: Bounds | None = self._stats.bounds
+        if bounds is not None:
+            for row in range(bounds[0], bounds[2] + 1):  # add 1 to include last
+                row_list: list[str] = []
+                for col in range(bounds[1], bounds[3] + 1):  # add 1 to include last
+                    state: int | None = self._cells.get((row, col))
+                    if state is None:
+                        row_list.append("  ")
+                    else:
+                        row_list.append("■ " if state & 1 else "□ ")
+                str_list.append("".join(row_list))
         return "\n".join(str_list)
 
     def progress(self) -> int:
         """Progress another generation."""
-        old_gen: dict[Coordinate, bool] = self._cells
-        self._cells = {}
-        count: int = 0
-        # loop over every tracked cell
-        for coords, live in old_gen.items():
-            match GameOfLifeDict._live_neighbours(old_gen, coords):
-                # 2. A live cell with exactly 2 neighbours is alive in the next generation.
-                case 2:
-                    if live:
-                        self.set_cell(coords[0], coords[1], live)
-                        count += 1
-                    else:
-                        pass  # required for code coverage? :/
-                # 1. Any cell, dead or alive, with exactly 3 neighbours is alive in the
-                # next generation.
-                case 3:
-                    self.set_cell(coords[0], coords[1], True)
-                    count += 1
-                # 3. All other cells are dead in the next generation.
-                case _:
-                    pass
+        cells: dict[Coordinate, int] = self._cells
+        next_state: bytes = self._rule.next_state
+        births: list[Coordinate] = []
+        deaths: list[Coordinate] = []
+        if not self._rule.is_totalistic:
+            births, deaths = self._evaluate_isotropic()
+        else:
+            # only cells whose state changed can change, every other cell stays as it is
+            for coords in self._dirty:
+                state: int | None = cells.get(coords)
+                if state is None:
+                    continue  # pruned since it was marked dirty
+                # the state is the count of live neighbours and the live flag, as the rule expects
+                if next_state[state] != state & 1:
+                    (deaths if state & 1 else births).append(coords)
+
+        # every decision has been made, so now the changes can be applied to the counts
+        self._dirty = set()
+        for coords in births:
+            self._update(coords, True)
+        for coords in deaths:
+            self._update(coords, False)
         self.generation += 1
-        return count
+        return self._stats.population
+
+    def _evaluate_isotropic(self) -> tuple[list[Coordinate], list[Coordinate]]:
+        """
+        Return the dirty cells that are born and that die by any rule, using neighbourhoods.
+
+        Every neighbour of a cell that changed is dirty, so the dirty cells include every cell
+        whose neighbourhood changed, even when its count of live neighbours didn't.
+        """
+        cells: dict[Coordinate, int] = self._cells
+        table: bytes = self._rule.table
+        births: list[Coordinate] = []
+        deaths: list[Coordinate] = []
+        for coords in self._dirty:
+            state: int | None = cells.get(coords)
+            if state is None:
+                continue  # pruned since it was marked dirty
+            live: int = state & 1
+            # build the neighbourhood of the cell, one bit for it and each live neighbour
+            neighbourhood: int = CENTRE_BIT if live else 0
+            for neighbour, bit in zip(
+                GameOfLifeDict._compute_neighbours(coords[0], coords[1]), NEIGHBOUR_BITS
+            ):
+                if cells.get(neighbour, 0) & 1:
+                    neighbourhood |= bit
+            if table[neighbourhood] != live:
+                (deaths if live else births).append(coords)
+        return births, deaths
+
+    def _check_rule(self, rule: Rule) -> None:
+        """Raise a ValueError if cells are born from nothing."""
+        if rule.births_from_nothing:
+            raise ValueError(f"{type(self).__name__} doesn't support B0 rules.")
 
     def set_cell(self, row: int, col: int, live: bool) -> None:
         """Set a cell in the map to the given live value."""
-        # track the min/max of cols
-        if len(self._cells) == 0:  # just set them first time around
-            self._min_row = row
-            self._max_row = row
-            self._min_col = col
-            self._max_col = col
+        state: int = self._cells.get((row, col), 0)
+        if bool(state & 1) != live:
+            self._update((row, col), live)
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """
+        Set all the given cells live.
+
+        Cells are only born, so unlike _update() no dead cells need pruning, and all the counts
+        are updated in one loop without any method calls per cell.
+        """
+        states: dict[Coordinate, int] = self._cells
+        dirty: set[Coordinate] = self._dirty
+        born: list[Coordinate] = []
+        for coords in dict.fromkeys(cells):
+            if states.get(coords, 0) & 1:
+                continue
+            born.append(coords)
+            states[coords] = states.get(coords, 0) | 1
+            dirty.add(coords)
+            for neighbour in GameOfLifeDict._compute_neighbours(coords[0], coords[1]):
+                # counts are stored shifted left by one
+                states[neighbour] = states.get(neighbour, 0) + 2
+                dirty.add(neighbour)
+        self._stats.add_cells(born)
+        if self._fingerprint is not None:
+            for row, col in born:
+                self._fingerprint.flip(row, col, True)
+
+    def _update(self, coords: Coordinate, live: bool) -> None:
+        """Flip the live state of a cell and update the neighbour counts of its neighbours."""
+        cells: dict[Coordinate, int] = self._cells
+        dirty: set[Coordinate] = self._dirty
+        delta: int = 2 if live else -2  # counts are stored shifted left by one
+        for neighbour in GameOfLifeDict._compute_neighbours(coords[0], coords[1]):
+            neighbour_state: int = cells.get(neighbour, 0) + delta
+            if neighbour_state:
+                cells[neighbour] = neighbour_state
+            else:
+                # prune dead cells without any live neighbours
+                del cells[neighbour]
+            dirty.add(neighbour)
+        state: int = cells.get(coords, 0) ^ 1
+        if state:
+            cells[coords] = state
         else:
-            self._min_row = row if row < self._min_row else self._min_row
-            self._max_row = row if row > self._max_row else self._max_row
-            self._min_col = col if col < self._min_col else self._min_col
-            self._max_col = col if col > self._max_col else self._max_col
-        # if we are adding a live cell, also add dead neighbours if they don't already exist
+            del cells[coords]
+        dirty.add(coords)
         if live:
-            self._cells[(row, col)] = live
-            # add all the dead neighbours if there is not a cell in the map already
-            for neighbour in GameOfLifeDict._compute_neighbours(row, col):
-                if neighbour not in self._cells:
-                    # recurse to set min/max
-                    self.set_cell(neighbour[0], neighbour[1], False)
+            self._stats.add(coords[0], coords[1])
         else:
-            self._cells[(row, col)] = False
+            self._stats.remove(coords[0], coords[1])
+        if self._fingerprint is not None:
+            self._fingerprint.flip(coords[0], coords[1], live)
 
     def count_live_cells(self) -> int:
         """Count the total number of live cells in the GoL universe."""
-        count: int = 0
-        for cell in self._cells.values():
-            if cell:
-                count += 1
-        return count
+        return self._stats.population
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        return self._stats.bounds
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, using the rows of live cells."""
+        return self._stats.get_region(row, col, rows, cols)
 
     def get_cell(self, row: int, col: int) -> bool | None:
         """
@@ -92,28 +184,17 @@ class GameOfLifeDict(GameOfLife):
 
         This implementation never returns None since the universe is "infinite".
         """
-        live: bool | None = self._cells.get((row, col))
-        if live is None:
-            return False
-        return live
+        return self._cells.get((row, col), 0) & 1 == 1
 
-    def get_live_cells(self) -> list[Coordinate]:
-        """Return a list of the Coordinates of all the live cells."""
-        # TODO: finish this some day
-        raise NotImplementedError
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the live cells by row then col, from the row index so only rows are sorted."""
+        return self._stats.iter_cells()
 
-    @staticmethod
-    def _live_neighbours(cell_map: dict[Coordinate, bool], coords: Coordinate) -> int:
-        """Count the number of live neighbours the cell at the given coords has."""
-        live_count: int = 0
-        for cell_coord in GameOfLifeDict._compute_neighbours(coords[0], coords[1]):
-            if cell_map.get(cell_coord):
-                live_count += 1
-            # the funny thing is that doing the below actually slows the progress() down by 2.5%...
-            # if there's more than 3 we're done
-            # if live_count > 3:
-            #     return live_count
-        return live_count
+    def fingerprint(self) -> Fingerprint:
+        """Return the fingerprint of the live cells, which is kept updated as cells change."""
+        if self._fingerprint is None:
+            self._fingerprint = Fingerprint.from_cells(self.iter_live_cells())
+        return self._fingerprint
 
     @staticmethod
     def _compute_neighbours(row: int, col: int) -> list[Coordinate]:
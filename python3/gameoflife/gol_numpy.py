@@ -0,0 +1,200 @@
+"""Game of Life NumPy array based implementation, requires the optional numpy dependency."""
+
+from array import array
+from itertools import chain
+from typing import Iterable
+import numpy as np
+import numpy.typing as npt
+from gameoflife import Bounds, CellBuffer, Coordinate, GameOfLife
+from gameoflife.coordinate import grow_bounds, on_edge
+
+
+class GameOfLifeNumpy(GameOfLife):  # pylint: disable=too-many-instance-attributes
+    """
+    Implements Game of Life using NumPy arrays, with universe wrap around.
+
+    Every generation is computed with whole array operations into preallocated buffers, so no
+    Python code runs per cell and no memory is allocated per generation.
+
+    The number of live cells is counted at the end of each progress() and kept updated by
+    set_cell(), the bounds are worked out from the array when first asked for after a change.
+    """
+
+    # indexed by 10 * live + number of live cells in the 3x3 block centred on the cell, which
+    # is the number of live neighbours plus the cell itself
+    _NEXT_STATE: npt.NDArray[np.uint8] = np.array(
+        # 1. Any dead cell with exactly 3 neighbours is alive in next gen.
+        [0, 0, 0, 1, 0, 0, 0, 0, 0, 0]
+        # 2. A live cell with 2 or 3 neighbours is alive in the next generation.
+        # 3. All other cells are dead in the next generation.
+        + [0, 0, 0, 1, 1, 0, 0, 0, 0, 0],
+        dtype=np.uint8,
+    )
+
+    def __init__(self, rows: int, cols: int) -> None:
+        """Initialise the double buffered arrays and the scratch arrays for counting."""
+        super().__init__()
+        self._a_array: npt.NDArray[np.uint8] = np.zeros((rows, cols), dtype=np.uint8)
+        self._b_array: npt.NDArray[np.uint8] = np.zeros((rows, cols), dtype=np.uint8)
+        # sums of each cell and its left and right neighbour
+        self._row_sums: npt.NDArray[np.uint8] = np.zeros((rows, cols), dtype=np.uint8)
+        # sums of the 3x3 block centred on each cell, then turned into _NEXT_STATE indexes
+        self._block_sums: npt.NDArray[np.uint8] = np.zeros((rows, cols), dtype=np.uint8)
+        # None when it needs counting again
+        self._live_count: int | None = 0
+        self._bounds: Bounds | None = None
+        self._bounds_stale: bool = False
+
+    def progress(self) -> int:
+        """Progress the game another generation."""
+        self._next_generation()
+        self.generation += 1
+        self._live_count = None
+        self._bounds_stale = True
+        return self.count_live_cells()
+
+    def progress_many(self, generations: int, want_counts: bool = False) -> list[int]:
+        """Progress the given number of generations, only counting live cells if wanted."""
+        if want_counts:
+            return super().progress_many(generations, want_counts)
+        for _ in range(generations):
+            self._next_generation()
+        self.generation += generations
+        self._live_count = None
+        self._bounds_stale = True
+        return []
+
+    def _next_generation(self) -> None:
+        """Compute the next generation into the other buffer, then swap the buffers."""
+        cells: npt.NDArray[np.uint8] = self._a_array
+        row_sums: npt.NDArray[np.uint8] = self._row_sums
+        block_sums: npt.NDArray[np.uint8] = self._block_sums
+
+        # add the left and right neighbours, wrapping around the first and last cols
+        row_sums[...] = cells
+        row_sums[:, 1:] += cells[:, :-1]
+        row_sums[:, 0] += cells[:, -1]
+        row_sums[:, :-1] += cells[:, 1:]
+        row_sums[:, -1] += cells[:, 0]
+
+        # add the row sums above and below, wrapping around the first and last rows
+        block_sums[...] = row_sums
+        block_sums[1:] += row_sums[:-1]
+        block_sums[0] += row_sums[-1]
+        block_sums[:-1] += row_sums[1:]
+        block_sums[-1] += row_sums[0]
+
+        # look up the next state of every cell into the other buffer, then swap the buffers
+        np.multiply(cells, 10, out=row_sums)
+        block_sums += row_sums
+        np.take(GameOfLifeNumpy._NEXT_STATE, block_sums, out=self._b_array)
+        self._a_array, self._b_array = self._b_array, self._a_array
+
+    def set_cell(self, row: int, col: int, live: bool) -> None:
+        """
+        Set a cell in the array to the given live value.
+
+        Cells outside of the boundaries of the array will wrap around as their coordinate will be
+        modulo the array height and width.
+        """
+        rows, cols = self._a_array.shape
+        row %= rows
+        col %= cols
+        if bool(self._a_array[row, col]) == live:
+            return
+        self._a_array[row, col] = live
+        if self._live_count is not None:
+            self._live_count += 1 if live else -1
+        if not self._bounds_stale:
+            # a birth can only grow the bounds, a death can only shrink them from an edge
+            if live:
+                self._bounds = grow_bounds(self._bounds, row, col)
+            elif on_edge(self._bounds, row, col):
+                self._bounds_stale = True
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live with one scatter into the array, wrapping them around."""
+        if isinstance(cells, CellBuffer):
+            # the arrays of a buffer are used in place without being copied
+            cell_rows: npt.NDArray[np.int64] = np.frombuffer(cells.rows, dtype=np.int64)
+            cell_cols: npt.NDArray[np.int64] = np.frombuffer(cells.cols, dtype=np.int64)
+        else:
+            coords: npt.NDArray[np.int64] = np.fromiter(
+                chain.from_iterable(cells), dtype=np.int64
+            ).reshape(-1, 2)
+            cell_rows, cell_cols = coords[:, 0], coords[:, 1]
+        if not cell_rows.size:
+            return
+        rows, cols = self._a_array.shape
+        self._a_array[cell_rows % rows, cell_cols % cols] = 1
+        self._live_count = None
+        self._bounds_stale = True
+
+    def count_live_cells(self) -> int:
+        """Return the total number of live cells, only counting them if they have changed."""
+        if self._live_count is None:
+            self._live_count = int(np.count_nonzero(self._a_array))
+        return self._live_count
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        if self._bounds_stale:
+            rows: npt.NDArray[np.intp] = np.flatnonzero(self._a_array.any(axis=1))
+            cols: npt.NDArray[np.intp] = np.flatnonzero(self._a_array.any(axis=0))
+            self._bounds = (
+                (int(rows[0]), int(cols[0]), int(rows[-1]), int(cols[-1]))
+                if rows.size
+                else None
+            )
+            self._bounds_stale = False
+        return self._bounds
+
+    def get_cell(self, row: int, col: int) -> bool | None:
+        """Return the live status of the given cell."""
+        rows, cols = self._a_array.shape
+        if 0 <= row < rows and 0 <= col < cols:
+            return bool(self._a_array[row, col])
+        return None
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, packed from a slice."""
+        region: list[int] = [0] * rows
+        array_rows, array_cols = self._a_array.shape
+        # only the part of the region inside the array can have live cells
+        first_row: int = max(row, 0)
+        first_col: int = max(col, 0)
+        end_row: int = min(row + rows, array_rows)
+        end_col: int = min(col + cols, array_cols)
+        if first_row < end_row and first_col < end_col:
+            packed: npt.NDArray[np.uint8] = np.packbits(
+                self._a_array[first_row:end_row, first_col:end_col],
+                axis=1,
+                bitorder="little",
+            )
+            for index, cells in enumerate(packed):
+                region[first_row - row + index] = int.from_bytes(
+                    cells.tobytes(), "little"
+                ) << (first_col - col)
+        return region
+
+    def get_live_cells(self) -> CellBuffer:
+        """
+        Return a CellBuffer of the Coordinates of all the live cells.
+
+        The cells must be sorted by row top to bottom and then in the row from left to right.
+        """
+        # nonzero() returns the indices in row major order, which are copied into the arrays
+        rows, cols = np.nonzero(self._a_array)
+        row_array: array[int] = array("q")
+        row_array.frombytes(rows.astype(np.int64).tobytes())
+        col_array: array[int] = array("q")
+        col_array.frombytes(cols.astype(np.int64).tobytes())
+        return CellBuffer.from_arrays(row_array, col_array)
+
+    def __str__(self) -> str:
+        """Return the array as a formatted string."""
+        str_list: list[str] = ["Generation: " + str(self.generation)]
+        for row in self._a_array.tolist():
+            str_list.append("".join("■ " if cell else "□ " for cell in row))
+        return "\n".join(str_list)
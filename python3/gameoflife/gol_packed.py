@@ -0,0 +1,241 @@
+"""Game of Life packed coordinates implementation."""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable, Iterator
+from gameoflife import Bounds, CellBuffer, Coordinate, GameOfLife
+from gameoflife.coordinate import grow_bounds, on_edge
+from gameoflife.fingerprint import Fingerprint
+
+
+class GameOfLifePacked(GameOfLife):
+    """
+    Implements Game of Life using a Python set of coordinates packed into single ints.
+
+    The row is stored in the high bits and the col in the low bits of the int, so the keys of
+    all the neighbours of a cell are just the key of the cell plus a fixed offset, and no tuples
+    need to be created or hashed while progressing. Cols must be within +/- 2^31. The keys are
+    unpacked into an index of the cols in each row when the cells are first looked at after a
+    generation, so regions only look at the live cells inside them.
+    """
+
+    COL_BITS: int = 32
+    _ROW_STRIDE: int = 1 << COL_BITS
+    _COL_OFFSET: int = 1 << (COL_BITS - 1)
+
+    # the key offsets of the 8 neighbours of a cell
+    _NEIGHBOURS: tuple[int, ...] = (
+        -_ROW_STRIDE - 1,
+        -_ROW_STRIDE,
+        -_ROW_STRIDE + 1,
+        -1,
+        1,
+        _ROW_STRIDE - 1,
+        _ROW_STRIDE,
+        _ROW_STRIDE + 1,
+    )
+
+    def __init__(self) -> None:
+        """Initialise the set."""
+        super().__init__()
+        self._cells: set[int] = set()
+        # worked out from the keys when first asked for after a change
+        self._bounds: Bounds | None = None
+        self._bounds_stale: bool = False
+        # the cols of the live cells in each row, built when first asked for after a change
+        self._rows: dict[int, list[int]] | None = None
+        # the rows of the index whose cols have been sorted
+        self._sorted_rows: set[int] = set()
+        # only kept updated once it has been asked for
+        self._fingerprint: Fingerprint | None = None
+
+    def __str__(self) -> str:
+        """Iterate over all the cells and return a human readable string."""
+        str_list: list[str] = ["Generation: " + str(self.generation)]
+        cells: CellBuffer = self.get_live_cells()
+        if cells:
+            min_col: int = min(col for _, col in cells)
+            max_col: int = max(col for _, col in cells)
+            for row in range(cells[0][0], cells[-1][0] + 1):  # add 1 to include last
+                row_list: list[str] = []
+                for col in range(min_col, max_col + 1):  # add 1 to include last
+                    row_list.append("■ " if self.get_cell(row, col) else "  ")
+                str_list.append("".join(row_list))
+        return "\n".join(str_list)
+
+    def progress(self) -> int:
+        """Progress another generation."""
+        cells: set[int] = self._cells
+        # count the live neighbours of every cell next to a live cell in a single pass
+        counts: Counter[int] = Counter(
+            key + offset for key in cells for offset in GameOfLifePacked._NEIGHBOURS
+        )
+        # 1. Any cell, dead or alive, with exactly 3 neighbours is alive in the next generation.
+        # 2. A live cell with exactly 2 neighbours is alive in the next generation.
+        # 3. All other cells are dead in the next generation.
+        self._cells = {
+            key
+            for key, count in counts.items()
+            if count == 3 or (count == 2 and key in cells)
+        }
+        if self._fingerprint is not None:
+            # only the cells that were born or died change the fingerprint
+            for key in self._cells - cells:
+                self._fingerprint.flip(*GameOfLifePacked.unpack(key), True)
+            for key in cells - self._cells:
+                self._fingerprint.flip(*GameOfLifePacked.unpack(key), False)
+        self.generation += 1
+        self._bounds_stale = True
+        self._rows = None
+        return len(self._cells)
+
+    def set_cell(self, row: int, col: int, live: bool) -> None:
+        """Set a cell in the set to the given live value."""
+        key: int = GameOfLifePacked.pack(row, col)
+        if (key in self._cells) == live:
+            return
+        if live:
+            self._cells.add(key)
+        else:
+            self._cells.remove(key)
+        if self._fingerprint is not None:
+            self._fingerprint.flip(row, col, live)
+        if not self._bounds_stale:
+            # a birth can only grow the bounds, a death can only shrink them from an edge
+            if live:
+                self._bounds = grow_bounds(self._bounds, row, col)
+            elif on_edge(self._bounds, row, col):
+                self._bounds_stale = True
+        self._rows = None
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live, adding all their keys to the set at once."""
+        stride: int = GameOfLifePacked._ROW_STRIDE
+        keys: list[int] = [row * stride + col for row, col in cells]
+        if self._fingerprint is not None:
+            live: set[int] = self._cells
+            for key in dict.fromkeys(keys):
+                if key not in live:
+                    self._fingerprint.flip(*GameOfLifePacked.unpack(key), True)
+        self._cells.update(keys)
+        self._bounds_stale = True
+        self._rows = None
+
+    def count_live_cells(self) -> int:
+        """Count the total number of live cells in the GoL universe."""
+        return len(self._cells)
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        if self._bounds_stale:
+            self._bounds_stale = False
+            cells: set[int] = self._cells
+            if not cells:
+                self._bounds = None
+                return None
+            # the keys sort by row first, and the low bits of a key plus the offset are the col
+            offset: int = GameOfLifePacked._COL_OFFSET
+            mask: int = GameOfLifePacked._ROW_STRIDE - 1
+            cols: list[int] = [(key + offset) & mask for key in cells]
+            self._bounds = (
+                GameOfLifePacked.unpack(min(cells))[0],
+                min(cols) - offset,
+                GameOfLifePacked.unpack(max(cells))[0],
+                max(cols) - offset,
+            )
+        return self._bounds
+
+    def fingerprint(self) -> Fingerprint:
+        """Return the fingerprint of the live cells, which is kept updated as cells change."""
+        if self._fingerprint is None:
+            self._fingerprint = Fingerprint.from_cells(
+                map(GameOfLifePacked.unpack, self._cells)
+            )
+        return self._fingerprint
+
+    def get_cell(self, row: int, col: int) -> bool | None:
+        """
+        Return the live status of the given cell.
+
+        This implementation never returns None since the universe is "infinite".
+        """
+        return GameOfLifePacked.pack(row, col) in self._cells
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, from the live cells in it."""
+        region: list[int] = []
+        end_col: int = col + cols
+        for region_row in range(row, row + rows):
+            row_cols: list[int] = self._row_cols(region_row)
+            row_cells: int = 0
+            # only the live cells of the row inside the region are looked at
+            for index in range(
+                bisect_left(row_cols, col), bisect_left(row_cols, end_col)
+            ):
+                row_cells |= 1 << (row_cols[index] - col)
+            region.append(row_cells)
+        return region
+
+    def _row_index(self) -> dict[int, list[int]]:
+        """
+        Return the cols of the live cells in each row, unpacking the keys once per generation.
+
+        The index is only built when it is needed, so progressing without looking at the cells
+        doesn't pay for it, and it is thrown away as soon as any cell changes.
+        """
+        if self._rows is None:
+            offset: int = GameOfLifePacked._COL_OFFSET
+            bits: int = GameOfLifePacked.COL_BITS
+            stride: int = GameOfLifePacked._ROW_STRIDE
+            rows: dict[int, list[int]] = {}
+            for key in self._cells:
+                row: int = (key + offset) >> bits
+                row_cols: list[int] | None = rows.get(row)
+                if row_cols is None:
+                    rows[row] = [key - row * stride]
+                else:
+                    row_cols.append(key - row * stride)
+            self._rows = rows
+            self._sorted_rows = set()
+        return self._rows
+
+    def _row_cols(self, row: int) -> list[int]:
+        """Return the sorted cols of the live cells in a row, sorting them when first asked for."""
+        row_cols: list[int] | None = self._row_index().get(row)
+        if row_cols is None:
+            return []
+        if row not in self._sorted_rows:
+            row_cols.sort()
+            self._sorted_rows.add(row)
+        return row_cols
+
+    def get_live_cells(self) -> CellBuffer:
+        """
+        Return a CellBuffer of the Coordinates of all the live cells.
+
+        The cells must be sorted by row top to bottom and then in the row from left to right.
+        """
+        # the rows are sorted, then the cols of one row at a time
+        cells: CellBuffer = CellBuffer()
+        for row in sorted(self._row_index()):
+            cells.extend(CellBuffer.from_row(row, array("q", self._row_cols(row))))
+        return cells
+
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the live cells by row then col, from the row index of the live cells."""
+        for row in sorted(self._row_index()):
+            for col in self._row_cols(row):
+                yield (row, col)
+
+    @staticmethod
+    def pack(row: int, col: int) -> int:
+        """Pack a row and col into a single int key."""
+        return row * GameOfLifePacked._ROW_STRIDE + col
+
+    @staticmethod
+    def unpack(key: int) -> Coordinate:
+        """Unpack an int key into a row and col."""
+        row: int = (key + GameOfLifePacked._COL_OFFSET) >> GameOfLifePacked.COL_BITS
+        return (row, key - row * GameOfLifePacked._ROW_STRIDE)
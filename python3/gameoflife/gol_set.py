@@ -1,26 +1,73 @@
 """Game of Life set implementation."""
 
-from gameoflife import Coordinate, GameOfLife
+import sys
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from os import cpu_count
+from typing import Iterable, Iterator
+from weakref import finalize
+from gameoflife import Bounds, Coordinate, GameOfLife
+from gameoflife.cell_stats import CellStats
+from gameoflife.fingerprint import Fingerprint
+from gameoflife.rule import CENTRE_BIT, CONWAY, NEIGHBOUR_BITS, Rule
 
+# the live cells of the next generation of a band of rows, and their statistics
+BandResult = tuple[set[Coordinate], CellStats]
 
-class GameOfLifeSet(GameOfLife):
+
+def gil_enabled() -> bool:
+    """Return True unless running on a free-threaded build of Python with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+class GameOfLifeSet(GameOfLife):  # pylint: disable=too-many-instance-attributes
     """Implements Game of Life using a Python set implementation."""
 
-    def __init__(self) -> None:
-        """Initialise the map."""
+    def __init__(
+        self,
+        incremental: bool = False,
+        workers: int = 1,
+        threads: bool | None = None,
+        rule: Rule = CONWAY,
+    ) -> None:
+        """
+        Initialise the map.
+
+        In incremental mode only the cells next to cells that changed in the previous generation
+        are evaluated, so the time to progress depends on the activity rather than the population.
+
+        With more than 1 worker (0 means one per CPU) the live cells are split into bands of rows
+        which are progressed in parallel. Threads are used on free-threaded builds of Python and
+        processes when the GIL is enabled, unless threads is set to choose explicitly. Only outer
+        totalistic rules are supported with more than 1 worker.
+        """
         super().__init__()
+        workers = workers if workers else cpu_count() or 1
+        if incremental and workers > 1:
+            raise ValueError("Incremental mode can't be used with more than 1 worker.")
         self._cells: set[Coordinate] = set()
-        self._min_row: int
-        self._max_row: int
-        self._min_col: int
-        self._max_col: int
+        # the cells that changed last generation, or None when not in incremental mode
+        self._changed: set[Coordinate] | None = set() if incremental else None
+        self._workers: int = workers
+        self._threads: bool = not gil_enabled() if threads is None else threads
+        # the worker threads or processes are started by the first parallel progress()
+        self._executor: Executor | None = None
+        # only kept updated once it has been asked for
+        self._fingerprint: Fingerprint | None = None
+        self._stats: CellStats = CellStats()
+        self.rule = rule
 
     def __str__(self) -> str:
         """Iterate over all the cells and return a human readable string."""
         str_list: list[str] = ["Generation: " + str(self.generation)]
-        for row in range(self._min_row, self._max_row + 1):  # add 1 to include last
+        bounds: Bounds | None = self._stats.bounds
+        if bounds is None:
+            return str_list[0]
+        for row in range(bounds[0], bounds[2] + 1):  # add 1 to include last
             row_list: list[str] = []
-            for col in range(self._min_col, self._max_col + 1):  # add 1 to include last
+            for col in range(bounds[1], bounds[3] + 1):  # add 1 to include last
                 if (row, col) in self._cells:
                     row_list.append("■ " if (row, col) in self._cells else "□ ")
                 else:
@@ -28,12 +75,20 @@ class GameOfLifeSet(GameOfLife):
             str_list.append("".join(row_list))
         return "\n".join(str_list)
 
-    def progress(self) -> int:
+    def progress(self) -> int:  # pylint: disable=too-many-branches
         """Progress another generation."""
+        if self._changed is not None:
+            return self._progress_incremental(self._changed)
+        if not self._rule.is_totalistic:
+            # every live cell might change, which is the same as all of them having just changed
+            return self._progress_incremental(self._cells)
+        if self._workers > 1:
+            return self._progress_parallel()
         old_gen: set[Coordinate] = self._cells
-        self._cells = set()
+        new_gen: set[Coordinate] = set()
+        stats: CellStats = CellStats()
+        next_state: bytes = self._rule.next_state
         checked_dead_cells: set[Coordinate] = set()
-        count: int = 0
         # loop over every live cell
         for coords in old_gen:
             # check how many live neighbours we have
@@ -45,20 +100,10 @@ class GameOfLifeSet(GameOfLife):
                 else:
                     dead_neighbour_coords.append(cell_coord)
 
-            # check if the current cell being processed should live
-            match num_live_neighbours:
-                # 2. A live cell with exactly 2 neighbours is alive in the next generation.
-                case 2:
-                    self._set_cell(coords)
-                    count += 1
-                # 1. Any cell, dead or alive, with exactly 3 neighbours is alive in the
-                # next generation.
-                case 3:
-                    self._set_cell(coords)
-                    count += 1
-                # 3. All other cells are dead in the next generation.
-                case _:
-                    pass
+            # the rule gives the next state of a live cell from its count of live neighbours
+            if next_state[num_live_neighbours << 1 | 1]:
+                new_gen.add(coords)
+                stats.add(coords[0], coords[1])
 
             # check if any of the dead neighbours should come alive
             for coords in dead_neighbour_coords:
@@ -69,40 +114,250 @@ class GameOfLifeSet(GameOfLife):
                     ):
                         if cell_coord in old_gen:
                             num_live_neighbours += 1
-                    if num_live_neighbours == 3:
-                        self._set_cell(coords)
-                        count += 1
+                    if next_state[num_live_neighbours << 1]:
+                        new_gen.add(coords)
+                        stats.add(coords[0], coords[1])
                 checked_dead_cells.add(coords)
 
+        self._flip_changes(old_gen, new_gen)
+        self._cells = new_gen
+        self._stats = stats
+        self.generation += 1
+        return stats.population
+
+    def _flip_changes(self, old_gen: set[Coordinate], new_gen: set[Coordinate]) -> None:
+        """Update the fingerprint, if it is kept, for the cells born and died."""
+        if self._fingerprint is not None:
+            for row, col in new_gen - old_gen:
+                self._fingerprint.flip(row, col, True)
+            for row, col in old_gen - new_gen:
+                self._fingerprint.flip(row, col, False)
+
+    def _progress_incremental(self, changed: set[Coordinate]) -> int:
+        """Progress another generation by only evaluating cells next to last gen's changes."""
+        cells: set[Coordinate] = self._cells
+        # a cell can only change if it, or one of its neighbours, changed last generation
+        candidates: set[Coordinate] = set(changed)
+        for row, col in changed:
+            candidates.update(GameOfLifeSet._compute_neighbours(row, col))
+
+        births: list[Coordinate]
+        deaths: list[Coordinate]
+        if self._rule.is_totalistic:
+            births, deaths = GameOfLifeSet._evaluate(
+                cells, candidates, self._rule.next_state
+            )
+        else:
+            births, deaths = GameOfLifeSet._evaluate_isotropic(
+                cells, candidates, self._rule.table
+            )
+
+        # only apply the changes once every candidate has been evaluated, everything else stays
+        for coords in deaths:
+            cells.remove(coords)
+            self._stats.remove(coords[0], coords[1])
+            if self._fingerprint is not None:
+                self._fingerprint.flip(coords[0], coords[1], False)
+        for coords in births:
+            self._set_cell(coords)
+        if self._changed is not None:
+            self._changed = set(births)
+            self._changed.update(deaths)
+        self.generation += 1
+        return len(cells)
+
+    @staticmethod
+    def _evaluate(
+        cells: set[Coordinate], candidates: set[Coordinate], next_state: bytes
+    ) -> tuple[list[Coordinate], list[Coordinate]]:
+        """Return the candidates that are born and that die by an outer totalistic rule."""
+        births: list[Coordinate] = []
+        deaths: list[Coordinate] = []
+        for coords in candidates:
+            num_live_neighbours: int = 0
+            for cell_coord in GameOfLifeSet._compute_neighbours(coords[0], coords[1]):
+                if cell_coord in cells:
+                    num_live_neighbours += 1
+            live: bool = coords in cells
+            if next_state[num_live_neighbours << 1 | live] != live:
+                (deaths if live else births).append(coords)
+        return births, deaths
+
+    @staticmethod
+    def _evaluate_isotropic(
+        cells: set[Coordinate], candidates: set[Coordinate], table: bytes
+    ) -> tuple[list[Coordinate], list[Coordinate]]:
+        """Return the candidates that are born and that die by any rule, using neighbourhoods."""
+        births: list[Coordinate] = []
+        deaths: list[Coordinate] = []
+        for coords in candidates:
+            live: bool = coords in cells
+            # build the neighbourhood of the cell, one bit for it and each live neighbour
+            neighbourhood: int = CENTRE_BIT if live else 0
+            for cell_coord, bit in zip(
+                GameOfLifeSet._compute_neighbours(coords[0], coords[1]), NEIGHBOUR_BITS
+            ):
+                if cell_coord in cells:
+                    neighbourhood |= bit
+            if table[neighbourhood] != live:
+                (deaths if live else births).append(coords)
+        return births, deaths
+
+    def _progress_parallel(self) -> int:
+        """Progress another generation by progressing bands of rows in parallel."""
+        bounds: Bounds | None = self._stats.bounds
+        if bounds is not None:
+            # births can happen on the rows just outside of the live cells
+            bands: list[tuple[list[Coordinate], int, int]] = GameOfLifeSet._split_bands(
+                self._cells, bounds[0] - 1, bounds[2] + 2, self._workers
+            )
+            if self._executor is None:
+                self._executor = (
+                    ThreadPoolExecutor(self._workers)
+                    if self._threads
+                    else ProcessPoolExecutor(self._workers)
+                )
+                # make sure the workers are stopped, even without close()
+                finalize(self, self._executor.shutdown)
+            results: list[BandResult] = list(
+                self._executor.map(
+                    GameOfLifeSet._next_band,
+                    *zip(*bands),
+                    repeat(self._rule.next_state),
+                )
+            )
+            # the bands don't overlap, so merging is just a union of the sets and statistics
+            new_gen: set[Coordinate] = set().union(*(cells for cells, _ in results))
+            self._flip_changes(self._cells, new_gen)
+            self._cells = new_gen
+            self._stats = CellStats()
+            for _, stats in results:
+                self._stats.update(stats)
         self.generation += 1
-        return count
+        return len(self._cells)
+
+    @staticmethod
+    def _split_bands(
+        cells: set[Coordinate], first_row: int, end_row: int, bands: int
+    ) -> list[tuple[list[Coordinate], int, int]]:
+        """
+        Split the rows first_row to end_row - 1 into bands of rows, with the cells of each band.
+
+        Each band also gets the cells in the rows directly above and below it, as those are
+        needed to progress the rows at the edges of the band.
+        """
+        bounds: list[int] = [
+            first_row + (end_row - first_row) * band // bands
+            for band in range(bands + 1)
+        ]
+        # map each row that is in a band, or next to one, to the indexes of those bands
+        row_bands: dict[int, list[int]] = {}
+        for band, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            for row in range(start - 1, end + 1):
+                row_bands.setdefault(row, []).append(band)
+        band_cells: list[list[Coordinate]] = [[] for _ in range(bands)]
+        for coords in cells:
+            for band in row_bands[coords[0]]:
+                band_cells[band].append(coords)
+        return [
+            (band_cells[band], bounds[band], bounds[band + 1])
+            for band in range(bands)
+            if bounds[band] < bounds[band + 1]
+        ]
+
+    @staticmethod
+    def _next_band(
+        cells: list[Coordinate], start: int, end: int, next_state: bytes
+    ) -> BandResult:
+        """
+        Compute the next generation of the rows start to end - 1 from the cells in those rows.
+
+        The cells must include the cells in the rows start - 1 and end. This runs in a worker
+        thread or process, so only uses its own private set. The next state of each cell comes
+        from the next_state table of an outer totalistic rule.
+        """
+        old_gen: set[Coordinate] = set(cells)
+        # the live cells of the band start at 0, so isolated cells still survive S0 rules
+        counts: Counter[Coordinate] = Counter(
+            dict.fromkeys((coords for coords in cells if start <= coords[0] < end), 0)
+        )
+        # count the live neighbours of every cell next to a live cell in a single pass
+        counts.update(
+            neighbour
+            for row, col in cells
+            for neighbour in GameOfLifeSet._compute_neighbours(row, col)
+        )
+        # cells outside of the rows of the band are progressed by another band
+        next_gen: set[Coordinate] = {
+            coords
+            for coords, count in counts.items()
+            if start <= coords[0] < end and next_state[count << 1 | (coords in old_gen)]
+        }
+        stats: CellStats = CellStats()
+        for row, col in next_gen:
+            stats.add(row, col)
+        return next_gen, stats
+
+    def _check_rule(self, rule: Rule) -> None:
+        """Raise a ValueError if cells are born from nothing, or the rule can't be parallelised."""
+        if rule.births_from_nothing:
+            raise ValueError(f"{type(self).__name__} doesn't support B0 rules.")
+        if self._workers > 1 and not rule.is_totalistic:
+            raise ValueError(
+                "Only outer totalistic rules can be used with more than 1 worker."
+            )
+
+    def close(self) -> None:
+        """Stop the worker threads or processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def _set_cell(self, coord: Coordinate) -> None:
         self.set_cell(coord[0], coord[1], True)
 
     def set_cell(self, row: int, col: int, live: bool) -> None:
         """Set a cell in the map to the given live value."""
-        # only add the cell to the map if it is live
-        if live:
-            # track the min/max of cols
-            if len(self._cells) == 0:  # just set them first time around
-                self._min_row = row
-                self._max_row = row
-                self._min_col = col
-                self._max_col = col
+        if ((row, col) in self._cells) != live:
+            if self._fingerprint is not None:
+                self._fingerprint.flip(row, col, live)
+            # only add the cell to the map if it is live
+            if live:
+                self._cells.add((row, col))
+                self._stats.add(row, col)
             else:
-                self._min_row = row if row < self._min_row else self._min_row
-                self._max_row = row if row > self._max_row else self._max_row
-                self._min_col = col if col < self._min_col else self._min_col
-                self._max_col = col if col > self._max_col else self._max_col
-            self._cells.add((row, col))
-        else:
-            self._cells.remove((row, col))
+                self._cells.remove((row, col))
+                self._stats.remove(row, col)
+        if self._changed is not None:
+            self._changed.add((row, col))
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live, adding them to the set and the statistics at once."""
+        # deduplicated in their original order, as iterating a set of cells is slower
+        new_cells: list[Coordinate] = list(dict.fromkeys(cells))
+        live: set[Coordinate] = self._cells
+        born: list[Coordinate] = [coords for coords in new_cells if coords not in live]
+        if self._fingerprint is not None:
+            for row, col in born:
+                self._fingerprint.flip(row, col, True)
+        live.update(born)
+        self._stats.add_cells(born)
+        if self._changed is not None:
+            self._changed.update(new_cells)
 
     def count_live_cells(self) -> int:
         """Count the total number of live cells in the GoL universe."""
         return len(self._cells)
 
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        return self._stats.bounds
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, using the rows of live cells."""
+        return self._stats.get_region(row, col, rows, cols)
+
     def get_cell(self, row: int, col: int) -> bool | None:
         """
         Return the live status of the given cell.
@@ -111,13 +366,15 @@ class GameOfLifeSet(GameOfLife):
         """
         return (row, col) in self._cells
 
-    def get_live_cells(self) -> list[Coordinate]:
-        """
-        Return a list of the Coordinates of all the live cells.
+    def fingerprint(self) -> Fingerprint:
+        """Return the fingerprint of the live cells, which is kept updated as cells change."""
+        if self._fingerprint is None:
+            self._fingerprint = Fingerprint.from_cells(self._cells)
+        return self._fingerprint
 
-        The list must be sorted by row top to bottom and then in the row from left to right.
-        """
-        return sorted(self._cells)
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the live cells by row then col, from the row index so only rows are sorted."""
+        return self._stats.iter_cells()
 
     @staticmethod
     def _compute_neighbours(row: int, col: int) -> list[Coordinate]:
@@ -0,0 +1,239 @@
+"""Game of Life multi-process implementation, stepping horizontal strips in parallel."""
+
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import Iterable, Iterator
+from weakref import finalize
+from gameoflife import Bounds, Coordinate, GameOfLife
+from gameoflife.coordinate import grow_bounds, on_edge
+from gameoflife.bitrows import cell_rows, next_row, row_bounds, row_region
+
+
+class _SharedGrid:
+    """
+    Two buffers of rows of cells in shared memory, one bit per cell.
+
+    Each row is stored as a little endian int, so bit N of a row is the cell in column N. Only
+    one buffer is current at a time, the next generation is written into the other one.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, rows: int, cols: int) -> None:
+        """Wrap the shared memory, which must be big enough for two buffers."""
+        self.shared_memory: SharedMemory = shared_memory
+        self.rows: int = rows
+        self.cols: int = cols
+        self.row_bytes: int = (cols + 7) // 8
+        self.buffer_bytes: int = rows * self.row_bytes
+
+    def get_row(self, buffer: int, row: int) -> int:
+        """Read a row of the given buffer as an int."""
+        start: int = buffer * self.buffer_bytes + row * self.row_bytes
+        return int.from_bytes(
+            self.shared_memory.buf[start : start + self.row_bytes], "little"
+        )
+
+    def set_row(self, buffer: int, row: int, cells: int) -> None:
+        """Write an int as a row of the given buffer."""
+        start: int = buffer * self.buffer_bytes + row * self.row_bytes
+        self.shared_memory.buf[start : start + self.row_bytes] = cells.to_bytes(
+            self.row_bytes, "little"
+        )
+
+    def step(self, buffer: int, start: int, end: int) -> int:
+        """
+        Compute the next generation of rows start to end - 1 of a buffer into the other buffer.
+
+        Only the rows of the strip and the halo rows directly above and below it are read.
+        Returns the number of live cells in the next generation of the strip.
+        """
+        cols: int = self.cols
+        mask: int = (1 << cols) - 1
+        left_shift: int = cols - 1
+        right_shift: int = cols + 1
+        # extend the rows with the cells just outside the left and right edges for next_row()
+        extended: list[int] = []
+        for row_index in range(start - 1, end + 1):
+            row: int = self.get_row(buffer, row_index % self.rows)
+            extended.append(
+                (row << 1) | (row >> left_shift) | ((row & 1) << right_shift)
+            )
+
+        count: int = 0
+        for offset in range(end - start):
+            new_row: int = next_row(
+                extended[offset], extended[offset + 1], extended[offset + 2], mask
+            )
+            self.set_row(1 - buffer, start + offset, new_row)
+            count += new_row.bit_count()
+        return count
+
+
+# the grid attached to by a worker process of the pool
+_WORKER_GRID: dict[str, _SharedGrid] = {}
+
+
+def _attach_worker(name: str, rows: int, cols: int) -> None:
+    """Pool initializer, attach the worker process to the shared memory of the grid."""
+    _WORKER_GRID["grid"] = _SharedGrid(SharedMemory(name), rows, cols)
+
+
+def _step_strip(buffer: int, start: int, end: int) -> int:
+    """Pool task, step a strip of the grid in a worker process."""
+    return _WORKER_GRID["grid"].step(buffer, start, end)
+
+
+def _shutdown(pool: PoolType, shared_memory: SharedMemory) -> None:
+    """Stop the worker processes and free the shared memory."""
+    pool.terminate()
+    pool.join()
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+class GameOfLifeStrips(GameOfLife):  # pylint: disable=too-many-instance-attributes
+    """
+    Implements Game of Life using a pool of processes, with universe wrap around.
+
+    The universe lives in shared memory and is split into horizontal strips of rows, each strip is
+    stepped by a process of a persistent pool. Only the buffer to read from and the rows of each
+    strip are sent to the processes, which read the rows above and below their strip themselves,
+    so the results are identical for any number of worker processes.
+    """
+
+    def __init__(self, rows: int, cols: int, workers: int = 0) -> None:
+        """Initialise the shared memory and start the pool, default to one worker per CPU."""
+        super().__init__()
+        workers = workers if workers else cpu_count() or 1
+        row_bytes: int = (cols + 7) // 8
+        # SharedMemory can't be zero sized, and it is always zero filled when created
+        shared_memory: SharedMemory = SharedMemory(
+            create=True, size=max(1, 2 * rows * row_bytes)
+        )
+        self._grid: _SharedGrid = _SharedGrid(shared_memory, rows, cols)
+        self._buffer: int = 0  # the buffer with the current generation
+        self._live_count: int = 0
+        # worked out from the rows when first asked for after a change
+        self._bounds: Bounds | None = None
+        self._bounds_stale: bool = False
+        bounds: list[int] = [rows * worker // workers for worker in range(workers + 1)]
+        self._strips: list[Coordinate] = [
+            (start, end) for start, end in zip(bounds, bounds[1:]) if start < end
+        ]
+        pool: PoolType = Pool(  # pylint: disable=consider-using-with
+            len(self._strips) or 1,
+            initializer=_attach_worker,
+            initargs=(shared_memory.name, rows, cols),
+        )
+        self._pool: PoolType = pool
+        # make sure the processes and the shared memory are cleaned up, even without close()
+        self._finalizer: finalize[..., "GameOfLifeStrips"] = finalize(
+            self, _shutdown, pool, shared_memory
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory, the game can't be used after."""
+        self._finalizer()
+
+    def progress(self) -> int:
+        """Progress the game another generation."""
+        count: int = sum(
+            self._pool.starmap(
+                _step_strip,
+                [(self._buffer, start, end) for start, end in self._strips],
+            )
+        )
+        self._buffer = 1 - self._buffer
+        self.generation += 1
+        self._live_count = count
+        self._bounds_stale = True
+        return count
+
+    def set_cell(self, row: int, col: int, live: bool) -> None:
+        """
+        Set a cell in the universe to the given live value.
+
+        Cells outside of the boundaries of the universe will wrap around as their coordinate will
+        be modulo the number of rows and cols.
+        """
+        row %= self._grid.rows
+        col %= self._grid.cols
+        cells: int = self._grid.get_row(self._buffer, row)
+        if (cells >> col) & 1 == live:
+            return
+        if live:
+            cells |= 1 << col
+        else:
+            cells &= ~(1 << col)
+        self._grid.set_row(self._buffer, row, cells)
+        self._live_count += 1 if live else -1
+        if not self._bounds_stale:
+            # a birth can only grow the bounds, a death can only shrink them from an edge
+            if live:
+                self._bounds = grow_bounds(self._bounds, row, col)
+            elif on_edge(self._bounds, row, col):
+                self._bounds_stale = True
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live, reading and writing each row of them only once."""
+        grid: _SharedGrid = self._grid
+        for row, cells_row in cell_rows(cells, grid.rows, grid.cols).items():
+            old_row: int = grid.get_row(self._buffer, row)
+            born: int = (cells_row & ~old_row).bit_count()
+            if born:
+                grid.set_row(self._buffer, row, old_row | cells_row)
+                self._live_count += born
+                self._bounds_stale = True
+
+    def count_live_cells(self) -> int:
+        """Return the total number of live cells, which is kept updated as cells change."""
+        return self._live_count
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        if self._bounds_stale:
+            self._bounds = row_bounds(
+                self._grid.get_row(self._buffer, row) for row in range(self._grid.rows)
+            )
+            self._bounds_stale = False
+        return self._bounds
+
+    def get_cell(self, row: int, col: int) -> bool | None:
+        """Return the live status of the given cell."""
+        if 0 <= row < self._grid.rows and 0 <= col < self._grid.cols:
+            return (self._grid.get_row(self._buffer, row) >> col) & 1 == 1
+        return None
+
+    def get_region(self, row: int, col: int, rows: int, cols: int) -> list[int]:
+        """Return the live cells of a region as one int per row, shifted out of the rows."""
+        return [
+            (
+                row_region(self._grid.get_row(self._buffer, region_row), col, cols)
+                if 0 <= region_row < self._grid.rows
+                else 0
+            )
+            for region_row in range(row, row + rows)
+        ]
+
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the Coordinates of all the live cells, by row top to bottom then left to right."""
+        for row_index in range(self._grid.rows):
+            row: int = self._grid.get_row(self._buffer, row_index)
+            while row:
+                lowest: int = row & -row
+                yield (row_index, lowest.bit_length() - 1)
+                row ^= lowest
+
+    def __str__(self) -> str:
+        """Return the universe as a formatted string."""
+        str_list: list[str] = ["Generation: " + str(self.generation)]
+        for row_index in range(self._grid.rows):
+            row: int = self._grid.get_row(self._buffer, row_index)
+            str_list.append(
+                "".join(
+                    "■ " if (row >> col) & 1 else "□ " for col in range(self._grid.cols)
+                )
+            )
+        return "\n".join(str_list)
@@ -0,0 +1,339 @@
+"""Game of Life sparse tile implementation."""
+
+from typing import Iterable, Iterator
+from gameoflife import Bounds, CellBuffer, Coordinate, GameOfLife
+from gameoflife.coordinate import grow_bounds, on_edge
+from gameoflife.bitrows import next_row, row_bounds, row_region
+from gameoflife.fingerprint import Fingerprint
+
+
+class GameOfLifeTiles(GameOfLife):
+    """
+    Implements Game of Life using a dict of fixed size tiles of cells, with an "infinite" universe.
+
+    Each tile is a list of TILE_SIZE ints, one int per row of cells in the tile, one bit per cell.
+    Only tiles that have live cells are stored, and only those and the tiles next to them are
+    progressed each generation, so memory and work follow the live region of the universe.
+    """
+
+    TILE_BITS: int = 6
+    TILE_SIZE: int = 1 << TILE_BITS
+    _TILE_MASK: int = TILE_SIZE - 1
+    _ROW_MASK: int = (1 << TILE_SIZE) - 1
+    _EMPTY_TILE: list[int] = [0] * TILE_SIZE
+
+    # the tile coords offsets of all the neighbours of a tile
+    _NEIGHBOURS: tuple[Coordinate, ...] = tuple(
+        (row, col) for row in (-1, 0, 1) for col in (-1, 0, 1) if row or col
+    )
+
+    def __init__(self) -> None:
+        """Initialise the tiles."""
+        super().__init__()
+        self._tiles: dict[Coordinate, list[int]] = {}
+        # None when it needs counting again
+        self._live_count: int | None = 0
+        # worked out from the tiles when first asked for after a change
+        self._bounds: Bounds | None = None
+        self._bounds_stale: bool = False
+        # only kept updated once it has been asked for, and not by progress_many()
+        self._fingerprint: Fingerprint | None = None
+
+    def __str__(self) -> str:
+        """Iterate over all the cells and return a human readable string."""
+        str_list: list[str] = ["Generation: " + str(self.generation)]
+        cells: CellBuffer = self.get_live_cells()
+        if cells:
+            min_col: int = min(col for _, col in cells)
+            max_col: int = max(col for _, col in cells)
+            live: set[Coordinate] = set(cells)
+            for row in range(cells[0][0], cells[-1][0] + 1):  # add 1 to include last
+                row_list: list[str] = []
+                for col in range(min_col, max_col + 1):  # add 1 to include last
+                    row_list.append("■ " if (row, col) in live else "  ")
+                str_list.append("".join(row_list))
+        return "\n".join(str_list)
+
+    def progress(self) -> int:
+        """Progress another generation, return the number of live cells in the new generation."""
+        old_tiles: dict[Coordinate, list[int]] = self._tiles
+        self._tiles = GameOfLifeTiles._next_generation(old_tiles)
+        self._flip_changes(old_tiles, self._tiles)
+        self.generation += 1
+        self._live_count = None
+        self._bounds_stale = True
+        return self.count_live_cells()
+
+    def progress_many(self, generations: int, want_counts: bool = False) -> list[int]:
+        """Progress the given number of generations, only counting live cells if wanted."""
+        if want_counts:
+            return super().progress_many(generations, want_counts)
+        tiles: dict[Coordinate, list[int]] = self._tiles
+        for _ in range(generations):
+            tiles = GameOfLifeTiles._next_generation(tiles)
+        self._tiles = tiles
+        self.generation += generations
+        self._live_count = None
+        self._bounds_stale = True
+        self._fingerprint = None
+        return []
+
+    def _flip_changes(
+        self, old_tiles: dict[Coordinate, list[int]], tiles: dict[Coordinate, list[int]]
+    ) -> None:
+        """Update the fingerprint, if it is kept, for the cells born and died in each tile."""
+        fingerprint: Fingerprint | None = self._fingerprint
+        if fingerprint is None:
+            return
+        empty: list[int] = GameOfLifeTiles._EMPTY_TILE
+        bits: int = GameOfLifeTiles.TILE_BITS
+        for coords in old_tiles.keys() | tiles.keys():
+            first_row: int = coords[0] << bits
+            first_col: int = coords[1] << bits
+            for row_index, (old_row, new_row) in enumerate(
+                zip(old_tiles.get(coords, empty), tiles.get(coords, empty))
+            ):
+                changed: int = old_row ^ new_row
+                while changed:
+                    lowest: int = changed & -changed
+                    fingerprint.flip(
+                        first_row + row_index,
+                        first_col + lowest.bit_length() - 1,
+                        new_row & lowest != 0,
+                    )
+                    changed ^= lowest
+
+    @staticmethod
+    def _next_generation(
+        old_tiles: dict[Coordinate, list[int]],
+    ) -> dict[Coordinate, list[int]]:
+        """Compute the tiles of the next generation from the given tiles."""
+        # every tile with live cells, and every tile next to one, might have live cells next gen
+        candidates: set[Coordinate] = set(old_tiles)
+        for tile_row, tile_col in old_tiles:
+            for row_offset, col_offset in GameOfLifeTiles._NEIGHBOURS:
+                candidates.add((tile_row + row_offset, tile_col + col_offset))
+
+        tiles: dict[Coordinate, list[int]] = {}
+        for coords in candidates:
+            tile: list[int] | None = GameOfLifeTiles._next_tile(old_tiles, coords)
+            if tile is not None:
+                tiles[coords] = tile
+        return tiles
+
+    @staticmethod
+    def _next_tile(  # pylint: disable=too-many-locals
+        tiles: dict[Coordinate, list[int]], coords: Coordinate
+    ) -> list[int] | None:
+        """Compute the next generation of the given tile, returns None if it will be empty."""
+        empty: list[int] = GameOfLifeTiles._EMPTY_TILE
+        last: int = GameOfLifeTiles.TILE_SIZE - 1
+        tile_row, tile_col = coords
+        north_west: list[int] = tiles.get((tile_row - 1, tile_col - 1), empty)
+        north: list[int] = tiles.get((tile_row - 1, tile_col), empty)
+        north_east: list[int] = tiles.get((tile_row - 1, tile_col + 1), empty)
+        west: list[int] = tiles.get((tile_row, tile_col - 1), empty)
+        centre: list[int] = tiles.get(coords, empty)
+        east: list[int] = tiles.get((tile_row, tile_col + 1), empty)
+        south_west: list[int] = tiles.get((tile_row + 1, tile_col - 1), empty)
+        south: list[int] = tiles.get((tile_row + 1, tile_col), empty)
+        south_east: list[int] = tiles.get((tile_row + 1, tile_col + 1), empty)
+
+        # build the rows of the tile, plus the row above and below, extended with the cells on
+        # either side of the tile as expected by next_row()
+        right_shift: int = GameOfLifeTiles.TILE_SIZE + 1
+        extended: list[int] = [
+            (north_west[last] >> last)
+            | (north[last] << 1)
+            | ((north_east[last] & 1) << right_shift)
+        ]
+        for row_index in range(GameOfLifeTiles.TILE_SIZE):
+            extended.append(
+                (west[row_index] >> last)
+                | (centre[row_index] << 1)
+                | ((east[row_index] & 1) << right_shift)
+            )
+        extended.append(
+            (south_west[0] >> last)
+            | (south[0] << 1)
+            | ((south_east[0] & 1) << right_shift)
+        )
+        # nothing in or next to this tile means nothing can be alive in it next gen
+        if not any(extended):
+            return None
+
+        mask: int = GameOfLifeTiles._ROW_MASK
+        tile: list[int] = [
+            next_row(
+                extended[row_index],
+                extended[row_index + 1],
+                extended[row_index + 2],
+                mask,
+            )
+            for row_index in range(GameOfLifeTiles.TILE_SIZE)
+        ]
+        return tile if any(tile) else None
+
+    def set_cell(self, row: int, col: int, live: bool) -> None:
+        """Set a cell in the universe to the given live value."""
+        coords: Coordinate = (
+            row >> GameOfLifeTiles.TILE_BITS,
+            col >> GameOfLifeTiles.TILE_BITS,
+        )
+        bit: int = 1 << (col & GameOfLifeTiles._TILE_MASK)
+        tile: list[int] | None = self._tiles.get(coords)
+        was_live: bool = (
+            tile is not None and (tile[row & GameOfLifeTiles._TILE_MASK] & bit) != 0
+        )
+        if was_live == live:
+            return
+        if self._live_count is not None:
+            self._live_count += 1 if live else -1
+        if self._fingerprint is not None:
+            self._fingerprint.flip(row, col, live)
+        if not self._bounds_stale:
+            # a birth can only grow the bounds, a death can only shrink them from an edge
+            if live:
+                self._bounds = grow_bounds(self._bounds, row, col)
+            elif on_edge(self._bounds, row, col):
+                self._bounds_stale = True
+        if live:
+            if tile is None:
+                tile = [0] * GameOfLifeTiles.TILE_SIZE
+                self._tiles[coords] = tile
+            tile[row & GameOfLifeTiles._TILE_MASK] |= bit
+        elif tile is not None:
+            tile[row & GameOfLifeTiles._TILE_MASK] &= ~bit
+            # free the tile as soon as it is empty
+            if not any(tile):
+                del self._tiles[coords]
+
+    def set_cells(self, cells: Iterable[Coordinate]) -> None:
+        """Set all the given cells live, the live count is worked out again when next asked for."""
+        tiles: dict[Coordinate, list[int]] = self._tiles
+        bits: int = GameOfLifeTiles.TILE_BITS
+        mask: int = GameOfLifeTiles._TILE_MASK
+        for row, col in cells:
+            coords: Coordinate = (row >> bits, col >> bits)
+            tile: list[int] | None = tiles.get(coords)
+            if tile is None:
+                tile = tiles[coords] = [0] * GameOfLifeTiles.TILE_SIZE
+            bit: int = 1 << (col & mask)
+            if self._fingerprint is not None and not tile[row & mask] & bit:
+                self._fingerprint.flip(row, col, True)
+            tile[row & mask] |= bit
+        self._live_count = None
+        self._bounds_stale = True
+
+    def count_live_cells(self) -> int:
+        """Return the total number of live cells, only counting them if they have changed."""
+        if self._live_count is None:
+            count: int = 0
+            for tile in self._tiles.values():
+                for row in tile:
+                    count += row.bit_count()
+            self._live_count = count
+        return self._live_count
+
+    @property
+    def bounds(self) -> Bounds | None:
+        """Return the min row, min col, max row and max col of the live cells, or None if none."""
+        if self._bounds_stale:
+            self._bounds_stale = False
+            tiles: dict[Coordinate, list[int]] = self._tiles
+            if not tiles:
+                self._bounds = None
+                return None
+            # tiles are never empty, so only the tiles on the edges need to be looked at
+            min_row: int = min(tile_row for tile_row, _ in tiles)
+            max_row: int = max(tile_row for tile_row, _ in tiles)
+            min_col: int = min(tile_col for _, tile_col in tiles)
+            max_col: int = max(tile_col for _, tile_col in tiles)
+            edges: list[Bounds] = [
+                bounds
+                for (tile_row, tile_col), tile in tiles.items()
+                if tile_row in (min_row, max_row) or tile_col in (min_col, max_col)
+                for bounds in (
+                    row_bounds(
+                        tile,
+                        tile_row << GameOfLifeTiles.TILE_BITS,
+                        tile_col << GameOfLifeTiles.TILE_BITS,
+                    ),
+                )
+                if bounds is not None
+            ]
+            self._bounds = (
+                min(bounds[0] for bounds in edges),
+                min(bounds[1] for bounds in edges),
+                max(bounds[2] for bounds in edges),
+                max(bounds[3] for bounds in edges),
+            )
+        return self._bounds
+
+    def fingerprint(self) -> Fingerprint:
+        """Return the fingerprint of the live cells, which progress() keeps updated."""
+        if self._fingerprint is None:
+            self._fingerprint = Fingerprint.from_cells(self.iter_live_cells())
+        return self._fingerprint
+
+    def get_cell(self, row: int, col: int) -> bool | None:
+        """
+        Return the live status of the given cell.
+
+        This implementation never returns None since the universe is "infinite".
+        """
+        tile: list[int] | None = self._tiles.get(
+            (row >> GameOfLifeTiles.TILE_BITS, col >> GameOfLifeTiles.TILE_BITS)
+        )
+        if tile is None:
+            return False
+        return (
+            tile[row & GameOfLifeTiles._TILE_MASK] >> (col & GameOfLifeTiles._TILE_MASK)
+        ) & 1 == 1
+
+    def get_region(  # pylint: disable=too-many-locals
+        self, row: int, col: int, rows: int, cols: int
+    ) -> list[int]:
+        """Return the live cells of a region as one int per row, joined from rows of tiles."""
+        bits: int = GameOfLifeTiles.TILE_BITS
+        first_tile_col: int = col >> bits
+        last_tile_col: int = (col + cols - 1) >> bits
+        # the col of the region in the rows of the tiles joined together
+        joined_col: int = col - (first_tile_col << bits)
+        region: list[int] = []
+        for tile_row in range(row >> bits, ((row + rows - 1) >> bits) + 1):
+            # the tiles across the region, and how far to shift their rows to join them
+            row_tiles: list[tuple[int, list[int]]] = []
+            for index, tile_col in enumerate(range(first_tile_col, last_tile_col + 1)):
+                tile: list[int] | None = self._tiles.get((tile_row, tile_col))
+                if tile is not None:
+                    row_tiles.append((index << bits, tile))
+            for region_row in range(
+                max(row, tile_row << bits), min(row + rows, (tile_row + 1) << bits)
+            ):
+                row_index: int = region_row & GameOfLifeTiles._TILE_MASK
+                cells: int = 0
+                for shift, tile in row_tiles:
+                    cells |= tile[row_index] << shift
+                region.append(row_region(cells, joined_col, cols))
+        return region
+
+    def iter_live_cells(self) -> Iterator[Coordinate]:
+        """Yield the Coordinates of all the live cells, by row top to bottom then left to right."""
+        # group the tiles into rows of tiles, then go through each row of cells across the tiles
+        tile_rows: dict[int, list[int]] = {}
+        for tile_row, tile_col in self._tiles:
+            tile_rows.setdefault(tile_row, []).append(tile_col)
+
+        for tile_row in sorted(tile_rows):
+            tile_cols: list[int] = sorted(tile_rows[tile_row])
+            tiles: list[list[int]] = [self._tiles[(tile_row, col)] for col in tile_cols]
+            for row_index in range(GameOfLifeTiles.TILE_SIZE):
+                row: int = (tile_row << GameOfLifeTiles.TILE_BITS) + row_index
+                for tile_col, tile in zip(tile_cols, tiles):
+                    bits: int = tile[row_index]
+                    first_col: int = tile_col << GameOfLifeTiles.TILE_BITS
+                    while bits:
+                        lowest: int = bits & -bits
+                        yield (row, first_col + lowest.bit_length() - 1)
+                        bits ^= lowest
@@ -2,13 +2,37 @@
 
 # from sys import exit as sysexit
 from datetime import datetime
+from functools import partial
 from math import floor
+from os import cpu_count
 from os.path import isfile
 from time import perf_counter_ns
+from typing import Callable
 from blessed import Terminal  # type:ignore
 from blessed.keyboard import Keystroke  # type:ignore
-from gameoflife import GameOfLife, GameOfLifeSet, GameOfLifeArrays
+from gameoflife import (
+    GameOfLife,
+    GameOfLifeArrays,
+    GameOfLifeBitboard,
+    GameOfLifeDict,
+    GameOfLifeHashLife,
+    GameOfLifePacked,
+    GameOfLifeSet,
+    GameOfLifeStrips,
+    GameOfLifeTiles,
+)
+from gameoflife.cycle_detector import Cycle, CycleDetector
 from gameoflife.dataio.create_io import create_reader, create_writer
+from gameoflife.dataio.pattern_cache import PatternCache
+
+# engines that need optional dependencies are only available if they can be imported
+OPTIONAL_WRAP_ENGINES: dict[str, Callable[[int, int], GameOfLife]] = {}
+try:
+    from gameoflife.gol_numpy import GameOfLifeNumpy
+
+    OPTIONAL_WRAP_ENGINES["numpy"] = GameOfLifeNumpy
+except ImportError:  # pragma: no cover
+    pass
 
 
 class MainGame:
@@ -17,10 +41,39 @@ class MainGame:
     HEADER_ROWS: int = 2
     FOOTER_ROWS: int = 8
 
-    def __init__(
-        self, wrap: bool, file: str = "", wrap_rows: int = 0, wrap_cols: int = 0
+    # the implementations that can be chosen for each type of universe, the first is the default
+    INFINITE_ENGINES: dict[str, Callable[[], GameOfLife]] = {
+        "set": GameOfLifeSet,
+        "set-incremental": partial(GameOfLifeSet, incremental=True),
+        "set-parallel": partial(GameOfLifeSet, workers=0),
+        "dict": GameOfLifeDict,
+        "packed": GameOfLifePacked,
+        "hashlife": GameOfLifeHashLife,
+        "tiles": GameOfLifeTiles,
+    }
+    WRAP_ENGINES: dict[str, Callable[[int, int], GameOfLife]] = {
+        "arrays": GameOfLifeArrays,
+        "bitboard": GameOfLifeBitboard,
+        "strips": GameOfLifeStrips,
+        **OPTIONAL_WRAP_ENGINES,
+    }
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        wrap: bool,
+        file: str = "",
+        wrap_rows: int = 0,
+        wrap_cols: int = 0,
+        engine: str = "",
+        cache: PatternCache | None = None,
     ) -> None:
-        """Initialise the game."""
+        """
+        Initialise the game.
+
+        The cells of the file are streamed into the game, unless a cache is given. Then the file is
+        read through the cache, which holds all the cells in memory when the file is parsed, but
+        only parses each file once.
+        """
         self._run: bool = True  # keep looping as long as this is true
         self._wrap: bool = wrap
         self._automatic: bool = False  # loop automatically and continuously when true
@@ -34,6 +87,8 @@ class MainGame:
         self._edit_mode = False  # are editing right now?
         self._last_edit_location: tuple[int, int]  # save where the cursor was last
         self._t = Terminal()
+        # the rows and cols of a wrapping universe, cells outside of it aren't shown
+        self._wrap_size: tuple[int, int] = (0, 0)
 
         # infinite or wrapping universe
         if wrap:
@@ -43,12 +98,21 @@ class MainGame:
                 else self._t.height - MainGame.HEADER_ROWS - MainGame.FOOTER_ROWS
             )
             width: int = wrap_cols if wrap_cols else floor((self._t.width + 1) / 2)
-            self._gol: GameOfLife = GameOfLifeArrays(height, width)
+            self._wrap_size = (height, width)
+            self._gol: GameOfLife = MainGame.WRAP_ENGINES[
+                engine if engine else next(iter(MainGame.WRAP_ENGINES))
+            ](height, width)
         else:
-            self._gol = GameOfLifeSet()
+            self._gol = MainGame.INFINITE_ENGINES[
+                engine if engine else next(iter(MainGame.INFINITE_ENGINES))
+            ]()
 
         if file:
-            with create_reader(file) as reader:
+            # stream the cells into the game rather than reading them all first, unless they
+            # are read through the cache of parsed files
+            with create_reader(
+                file, stream=True, cache=cache, workers=cpu_count() or 1
+            ) as reader:
                 self._gol.add_cells(reader)
 
     def main(self) -> None:
@@ -98,6 +162,31 @@ class MainGame:
                         # update the UI to reflect any changes
                         self.print_ui_update(True, live_count, last_gen_time)
 
+    def run_headless(self, generations: int, until_stable: bool = False) -> None:
+        """
+        Progress the given number of generations without the UI, then print the results.
+
+        When until_stable, stop as soon as the universe repeats itself, or if a number of
+        generations was given, skip ahead to it by whole periods of the repeat.
+        """
+        start: int = perf_counter_ns()
+        cycle: Cycle | None = None
+        if until_stable:
+            last: int = self._gol.generation + generations
+            # patterns can't move off to infinity in a universe that wraps around
+            detector: CycleDetector = CycleDetector(self._gol, not self._wrap)
+            cycle = detector.run(generations)
+            if cycle is not None and generations:
+                detector.fast_forward(cycle, last)
+        else:
+            self._gol.progress_many(generations)
+        progress_time: int = perf_counter_ns() - start
+        print(f"Generation:    {self._gol.generation}")
+        print(f"Live cells:    {self._gol.count_live_cells()}")
+        if until_stable:
+            print(f"Stable:        {cycle if cycle is not None else 'no'}")
+        print(f"Progress time: {round(progress_time / 1000)} µs")
+
     def update_screen_size(self) -> None:
         """Update the screen size on first run, or when the terminal size has changed."""
         self._term_width = self._t.width
@@ -198,11 +287,14 @@ class MainGame:
             outcome: str
             try:
                 with create_writer(filename) as writer:
-                    writer.write([], self._gol.get_live_cells())
+                    writer.rule = str(self._gol.rule)
+                    writer.write([], self._gol.iter_live_cells(), self._gol.bounds)
                 timestamp: str = datetime.now().strftime("%H:%M:%S")
                 outcome = f"Saved game to file '{filename}' at {timestamp}"
             except ValueError as _:
-                outcome = "Incorrect file extension - please use '.cells'"
+                outcome = (
+                    "Incorrect file extension - please use '.cells', '.rle' or '.mc'"
+                )
             with self._t.location(0, self._t.height - 1):
                 print(outcome, end="")
 
@@ -382,23 +474,37 @@ class MainGame:
     def print_game(self) -> None:
         """Print the actual game board with cells from the GameOfLife instance."""
         with self._t.location(0, MainGame.HEADER_ROWS), self._t.hidden_cursor():
-            row_list: list[str] = []
             max_rows: int = self._t.height - MainGame.HEADER_ROWS - MainGame.FOOTER_ROWS
             # because we separate all cells by a space we can only do half the number of cols
             max_cols: int = floor((self._t.width + 1) / 2)
-            for view_row in range(max_rows):
-                for view_col in range(max_cols):
-                    cell: bool | None = self._gol.get_cell(
-                        self._origin_row + view_row, self._origin_col + view_col
-                    )
-                    dead_cell_str: str = "." if self._wrap else " "
-                    if cell is None:
-                        row_list.append(" ")
-                    else:
-                        row_list.append("■" if cell else dead_cell_str)
-                        # □ ■ ▫ ◉ ○ ◌ ◎ ● ◯ ☉ ☐ ☻ ◦
-                print(" ".join(row_list))
-                row_list = []
+            region: list[int] = self._gol.get_region(
+                self._origin_row, self._origin_col, max_rows, max_cols
+            )
+            # □ ■ ▫ ◉ ○ ◌ ◎ ● ◯ ☉ ☐ ☻ ◦
+            cell_strs: dict[int, int] = str.maketrans(
+                "01", ("." if self._wrap else " ") + "■"
+            )
+            # the view cols inside of a wrapping universe, every col of an infinite one
+            first_col: int = 0
+            end_col: int = max_cols
+            if self._wrap:
+                first_col = min(max(-self._origin_col, 0), max_cols)
+                end_col = min(max(self._wrap_size[1] - self._origin_col, 0), max_cols)
+            for view_row, cells in enumerate(region):
+                if (
+                    self._wrap
+                    and not 0 <= self._origin_row + view_row < self._wrap_size[0]
+                ):
+                    print(" ".join(" " * max_cols))
+                    continue
+                # bit 0 is the left most cell, so the binary digits need reversing
+                row_str: str = format(cells, f"0{max_cols}b")[::-1].translate(cell_strs)
+                row_str = (
+                    " " * first_col
+                    + row_str[first_col:end_col]
+                    + " " * (max_cols - end_col)
+                )
+                print(" ".join(row_str))
 
     def print_ui(self) -> None:
         """
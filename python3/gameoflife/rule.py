@@ -0,0 +1,232 @@
+"""
+Rules for Life-like cellular automata, compiled into lookup tables of the next state of a cell.
+
+Both outer totalistic rules, e.g. B3/S23 where only the number of live neighbours matters, and
+isotropic non-totalistic rules in Hensel notation, e.g. B2-a/S12, are supported.
+
+The neighbourhood of a cell is a 9 bit index with one bit per cell, the cell itself in bit 4:
+
+    NW = 1    N = 2     NE = 4
+    W  = 8    C = 16    E  = 32
+    SW = 64   S = 128   SE = 256
+"""
+
+from re import Match, fullmatch, finditer
+
+# the bit of each of the 8 neighbours in the neighbourhood index, in order around the cell
+NEIGHBOUR_BITS: tuple[int, ...] = (1, 2, 4, 32, 256, 128, 64, 8)
+CENTRE_BIT: int = 16
+_ALL_NEIGHBOURS: int = 511 & ~CENTRE_BIT
+
+# one neighbourhood for each Hensel letter for 1 to 4 live neighbours, the neighbourhoods for 5
+# to 7 live neighbours are the complement of those for 3 to 1 live neighbours
+_HENSEL: dict[int, dict[str, int]] = {
+    1: {"c": 1, "e": 2},
+    2: {"c": 5, "e": 10, "a": 3, "i": 40, "k": 33, "n": 68},
+    3: {
+        "c": 69,
+        "e": 42,
+        "a": 11,
+        "i": 7,
+        "k": 98,
+        "n": 13,
+        "j": 14,
+        "q": 70,
+        "r": 41,
+        "y": 97,
+    },
+    4: {
+        "c": 325,
+        "e": 170,
+        "a": 15,
+        "i": 45,
+        "k": 99,
+        "n": 71,
+        "j": 106,
+        "q": 102,
+        "r": 43,
+        "t": 105,
+        "w": 78,
+        "y": 101,
+        "z": 108,
+    },
+}
+
+
+def _symmetries(neighbours: int) -> set[int]:
+    """Return all the rotations and reflections of a neighbourhood."""
+    cells: list[tuple[int, int]] = [
+        (bit // 3 - 1, bit % 3 - 1) for bit in range(9) if neighbours >> bit & 1
+    ]
+    symmetries: set[int] = set()
+    # the 4 rotations, each with and without a reflection, as 2x2 matrices
+    for row_row, row_col, col_row, col_col in (
+        (1, 0, 0, 1),
+        (0, 1, -1, 0),
+        (-1, 0, 0, -1),
+        (0, -1, 1, 0),
+        (1, 0, 0, -1),
+        (-1, 0, 0, 1),
+        (0, 1, 1, 0),
+        (0, -1, -1, 0),
+    ):
+        symmetry: int = 0
+        for row, col in cells:
+            new_row: int = row_row * row + row_col * col
+            new_col: int = col_row * row + col_col * col
+            symmetry |= 1 << ((new_row + 1) * 3 + new_col + 1)
+        symmetries.add(symmetry)
+    return symmetries
+
+
+def _classify() -> dict[int, str]:
+    """Map every arrangement of the 8 neighbours of a cell to its Hensel letter."""
+    letters: dict[int, str] = {}
+    for count, representatives in _HENSEL.items():
+        for letter, neighbours in representatives.items():
+            for symmetry in _symmetries(neighbours):
+                letters[symmetry] = letter
+                if count < 4:
+                    letters[symmetry ^ _ALL_NEIGHBOURS] = letter
+    letters[0] = ""
+    letters[_ALL_NEIGHBOURS] = ""
+    return letters
+
+
+_LETTERS: dict[int, str] = _classify()
+
+
+class Rule:
+    """
+    A rule compiled into lookup tables of the next state of a cell.
+
+    The table is indexed by the 9 bit neighbourhood of a cell. For outer totalistic rules the
+    next_state table can be used instead, which is indexed by the number of live neighbours
+    shifted left by one, with the live state of the cell itself in bit 0.
+    """
+
+    def __init__(self, rule: str = "B3/S23") -> None:
+        """
+        Parse and compile a rule string, raise a ValueError if it isn't valid.
+
+        Rules can be given as B3/S23, B3S23 or in the older S/B form 23/3, with Hensel letters
+        after each number of neighbours, and a "-" before the letters to exclude them.
+        """
+        birth, survival = Rule._split(rule)
+        self._birth: set[int] = Rule._parse(birth, rule)
+        self._survival: set[int] = Rule._parse(survival, rule)
+        self.table: bytes = bytes(
+            (
+                neighbourhood & ~CENTRE_BIT
+                in (self._survival if neighbourhood & CENTRE_BIT else self._birth)
+            )
+            for neighbourhood in range(512)
+        )
+        # every arrangement of the same number of neighbours has the same next state
+        self.is_totalistic: bool = all(
+            len({self.table[neighbourhood] for neighbourhood in arrangements}) == 1
+            for arrangements in Rule._arrangements_by_count()
+        )
+        self.next_state: bytes = bytes(
+            self.table[sum(NEIGHBOUR_BITS[:count]) | live * CENTRE_BIT]
+            for count in range(9)
+            for live in (0, 1)
+        )
+        self._str: str = f"B{Rule._format(self._birth)}/S{Rule._format(self._survival)}"
+
+    @property
+    def births_from_nothing(self) -> bool:
+        """Return True if dead cells without any live neighbours are born, as for B0 rules."""
+        return self.table[0] == 1
+
+    def __str__(self) -> str:
+        """Return the rule in the canonical B/S form, e.g. B3/S23."""
+        return self._str
+
+    def __repr__(self) -> str:
+        """Return the code to create the rule."""
+        return f'Rule("{self._str}")'
+
+    def __eq__(self, other: object) -> bool:
+        """Rules are equal if they compile to the same table."""
+        return isinstance(other, Rule) and self.table == other.table
+
+    def __hash__(self) -> int:
+        """Hash the table, as that is what makes rules equal."""
+        return hash(self.table)
+
+    @staticmethod
+    def _split(rule: str) -> tuple[str, str]:
+        """Split a rule string into the birth and survival parts."""
+        stripped: str = rule.replace(" ", "").upper()
+        match: Match[str] | None = fullmatch(r"B([^/S]*)/?S([^/]*)", stripped)
+        if match is not None:
+            return match.group(1), match.group(2)
+        # the older S/B forms, S23/B3 or just 23/3
+        match = fullmatch(r"S?([^/B]*)/B?([^/]*)", stripped)
+        if match is not None:
+            return match.group(2), match.group(1)
+        raise ValueError(f"Invalid rule: {rule}")
+
+    @staticmethod
+    def _parse(part: str, rule: str) -> set[int]:
+        """Parse the numbers of neighbours, with any Hensel letters, to a set of neighbourhoods."""
+        if not fullmatch(r"([0-8](-?[A-Z]+)?)*", part):
+            raise ValueError(f"Invalid rule: {rule}")
+        neighbourhoods: set[int] = set()
+        for match in finditer(r"([0-8])(-?)([A-Z]*)", part):
+            count: int = int(match.group(1))
+            letters: set[str] = set(match.group(3).lower())
+            known: set[str] = {
+                letter
+                for neighbours, letter in _LETTERS.items()
+                if neighbours.bit_count() == count
+            }
+            if not letters <= known:
+                raise ValueError(f"Invalid rule: {rule}")
+            for neighbours, letter in _LETTERS.items():
+                if neighbours.bit_count() == count and (
+                    not letters or (letter in letters) != bool(match.group(2))
+                ):
+                    neighbourhoods.add(neighbours)
+        return neighbourhoods
+
+    @staticmethod
+    def _format(neighbourhoods: set[int]) -> str:
+        """Format a set of neighbourhoods as numbers of neighbours with any Hensel letters."""
+        formatted: list[str] = []
+        for count in range(9):
+            letters: set[str] = {
+                letter
+                for neighbours, letter in _LETTERS.items()
+                if neighbours.bit_count() == count
+            }
+            included: set[str] = {
+                _LETTERS[neighbours]
+                for neighbours in neighbourhoods
+                if neighbours.bit_count() == count
+            }
+            if included == letters:
+                formatted.append(str(count))
+            elif included and len(included) * 2 <= len(letters):
+                formatted.append(str(count) + "".join(sorted(included)))
+            elif included:
+                formatted.append(str(count) + "-" + "".join(sorted(letters - included)))
+        return "".join(formatted)
+
+    @staticmethod
+    def _arrangements_by_count() -> list[list[int]]:
+        """Return the neighbourhoods, both dead and live, grouped by live state and count."""
+        groups: dict[tuple[int, int], list[int]] = {}
+        for neighbourhood in range(512):
+            groups.setdefault(
+                (
+                    neighbourhood & CENTRE_BIT,
+                    (neighbourhood & ~CENTRE_BIT).bit_count(),
+                ),
+                [],
+            ).append(neighbourhood)
+        return list(groups.values())
+
+
+CONWAY: Rule = Rule()
@@ -0,0 +1,208 @@
+"""Tests for the CellStats class, and the live counts, bounds and regions of every engine."""
+
+from typing import Callable
+from gameoflife import (
+    Bounds,
+    CellBuffer,
+    Coordinate,
+    GameOfLife,
+    GameOfLifeArrays,
+    GameOfLifeBitboard,
+    GameOfLifeDict,
+    GameOfLifeHashLife,
+    GameOfLifePacked,
+    GameOfLifeSet,
+    GameOfLifeStrips,
+    GameOfLifeTiles,
+)
+from gameoflife.cell_stats import CellStats
+from gameoflife.dataio.create_io import create_reader
+
+ENGINES: list[Callable[[], GameOfLife]] = [
+    lambda: GameOfLifeArrays(100, 100),
+    lambda: GameOfLifeBitboard(100, 100),
+    GameOfLifeDict,
+    GameOfLifeSet,
+    lambda: GameOfLifeSet(incremental=True),
+    lambda: GameOfLifeSet(workers=2, threads=True),
+    GameOfLifeHashLife,
+    GameOfLifeTiles,
+    GameOfLifePacked,
+    lambda: GameOfLifeStrips(100, 100, 1),
+]
+
+
+def test_cell_stats() -> None:
+    """Test that the bounds grow and shrink as cells are added and removed."""
+    stats: CellStats = CellStats()
+    assert stats.bounds is None
+    for row, col in ((0, 0), (5, -3), (2, 7), (2, 8)):
+        stats.add(row, col)
+    assert stats.population == 4
+    assert stats.bounds == (0, -3, 5, 8)
+    # a row inside the bounds emptying doesn't change them
+    stats.remove(2, 7)
+    assert stats.bounds == (0, -3, 5, 8)
+    stats.remove(2, 8)
+    assert stats.bounds == (0, -3, 5, 0)
+    stats.remove(5, -3)
+    assert stats.bounds == (0, 0, 0, 0)
+
+    other: CellStats = CellStats()
+    other.add(-10, 1)
+    other.add(-10, 2)
+    stats.update(other)
+    stats.update(CellStats())
+    assert stats.population == 3
+    assert stats.bounds == (-10, 0, 0, 2)
+    stats.remove(-10, 1)
+    stats.remove(-10, 2)
+    stats.remove(0, 0)
+    assert stats.population == 0
+    assert stats.bounds is None
+
+
+def test_bounds() -> None:
+    """Test that the live count and bounds are kept updated, including shrinking."""
+    for engine in ENGINES:
+        gol: GameOfLife = engine()
+        assert gol.bounds is None
+        assert gol.count_live_cells() == 0
+        # a glider crossing the edges of tiles
+        for row, col in ((60, 61), (61, 62), (62, 60), (62, 61), (62, 62)):
+            gol.set_cell(row, col, True)
+        assert gol.bounds == (60, 60, 62, 62)
+        gol.set_cell(5, 90, True)
+        gol.set_cell(5, 90, True)
+        assert gol.bounds == (5, 60, 62, 90)
+        assert gol.count_live_cells() == 6
+        # the far away cell dies straight away, then the bounds follow the glider
+        gol.progress()
+        assert gol.bounds == (61, 60, 63, 62)
+        gol.progress_many(7)
+        assert gol.bounds == (62, 62, 64, 64)
+        for _ in range(12):
+            gol.progress()
+            assert gol.count_live_cells() == 5
+            assert gol.bounds == _bounds(gol.get_live_cells())
+        # a cell set after the bounds were worked out grows them, and shrinks them when it dies
+        bounds: Bounds | None = gol.bounds
+        assert bounds is not None
+        gol.set_cell(bounds[0] - 2, bounds[3] + 2, True)
+        assert gol.bounds == (bounds[0] - 2, bounds[1], bounds[2], bounds[3] + 2)
+        gol.set_cell(bounds[0] - 2, bounds[3] + 2, False)
+        assert gol.bounds == bounds
+        # killing the cells on the edges shrinks the bounds
+        for row, col in gol.get_live_cells()[:3]:
+            gol.set_cell(row, col, False)
+            gol.set_cell(row, col, False)
+            assert gol.bounds == _bounds(gol.get_live_cells())
+        assert gol.count_live_cells() == 2
+        for row, col in gol.get_live_cells():
+            gol.set_cell(row, col, False)
+        assert gol.bounds is None
+        assert gol.count_live_cells() == 0
+        _close(gol)
+
+
+def test_get_region() -> None:
+    """Test that regions have the same cells as get_cell(), including outside the universe."""
+    for engine in ENGINES:
+        gol: GameOfLife = engine()
+        with create_reader("../data/Gosper_glider_gun.rle") as reader:
+            gol.add_cells(reader)
+        gol.progress_many(60)
+        for row, col, rows, cols in (
+            (0, 0, 20, 50),
+            (-5, -7, 30, 80),
+            (3, 10, 4, 5),
+            (2, -70, 5, 70),
+            (90, 90, 20, 20),
+            (0, 0, 0, 10),
+            (5, 5, 3, 0),
+        ):
+            expected: list[int] = [
+                sum(
+                    1 << index
+                    for index in range(cols)
+                    if gol.get_cell(region_row, col + index)
+                )
+                for region_row in range(row, row + rows)
+            ]
+            assert gol.get_region(row, col, rows, cols) == expected
+        assert any(gol.get_region(0, 0, 20, 50))
+        # changing a cell after a region has been read changes the next region
+        gol.set_cell(95, 95, True)
+        assert gol.get_region(90, 90, 10, 10)[5] == 1 << 5
+        gol.set_cell(95, 95, False)
+        assert gol.get_region(90, 90, 10, 10)[5] == 0
+        _close(gol)
+
+
+def test_iter_live_cells() -> None:
+    """Test that the live cells are iterated in the same order as get_live_cells() returns."""
+    for engine in ENGINES:
+        gol: GameOfLife = engine()
+        assert not list(gol.iter_live_cells())
+        with create_reader("../data/Gosper_glider_gun.rle", stream=True) as reader:
+            gol.add_cells(reader)
+        gol.progress_many(45)
+        gol.set_cell(99, 0, True)
+        gol.set_cell(0, 99, True)
+        live_cells: list[Coordinate] = list(gol.iter_live_cells())
+        assert live_cells == sorted(live_cells)
+        assert live_cells == gol.get_live_cells()
+        assert len(live_cells) == gol.count_live_cells()
+        _close(gol)
+
+
+def test_set_cells() -> None:
+    """Test that setting cells in bulk is the same as setting them one at a time."""
+    with create_reader("../data/Gosper_glider_gun.rle") as reader:
+        cells: CellBuffer = reader.cells
+    # cells which are duplicated, already live, or outside of the fixed size universes
+    cells = cells + cells[:5] + [(-3, -4), (150, 2), (2, -1)]
+    for engine in ENGINES:
+        # the live cells, live count, bounds and fingerprint hash, before and after progressing
+        states: list[list[tuple[CellBuffer, int, Bounds | None, int]]] = []
+        for bulk in (False, True):
+            gol: GameOfLife = engine()
+            gol.set_cell(cells[0][0], cells[0][1], True)
+            gol.set_cells([])
+            # engines which keep the fingerprint updated only do so once it is asked for
+            gol.fingerprint()
+            if bulk:
+                gol.set_cells(iter(cells))
+            else:
+                for row, col in cells:
+                    gol.set_cell(row, col, True)
+            states.append([])
+            for _ in range(2):
+                states[-1].append(
+                    (
+                        gol.get_live_cells(),
+                        gol.count_live_cells(),
+                        gol.bounds,
+                        gol.fingerprint().hash,
+                    )
+                )
+                gol.progress_many(30)
+            _close(gol)
+        assert states[1] == states[0]
+
+
+def _close(gol: GameOfLife) -> None:
+    """Close the engines which have worker processes or threads."""
+    close: Callable[[], None] | None = getattr(gol, "close", None)
+    if close is not None:
+        close()
+
+
+def _bounds(cells: CellBuffer) -> Bounds:
+    """Return the min row, min col, max row and max col of the given cells."""
+    return (
+        min(row for row, _ in cells),
+        min(col for _, col in cells),
+        max(row for row, _ in cells),
+        max(col for _, col in cells),
+    )
@@ -0,0 +1,154 @@
+"""Tests for the Fingerprint, Cycle and CycleDetector classes."""
+
+from gameoflife import (
+    GameOfLife,
+    GameOfLifeBitboard,
+    GameOfLifeDict,
+    GameOfLifeHashLife,
+    GameOfLifePacked,
+    GameOfLifeSet,
+    GameOfLifeTiles,
+    MainGame,
+)
+from gameoflife.cycle_detector import Cycle, CycleDetector
+from gameoflife.dataio.create_io import create_reader
+from gameoflife.fingerprint import POWER_CACHE_SIZE, Fingerprint, _row_power
+
+
+def test_fingerprint() -> None:
+    """Test that fingerprints can be updated a cell at a time, and normalised."""
+    glider: list[tuple[int, int]] = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+    fingerprint: Fingerprint = Fingerprint.from_cells(glider)
+    assert fingerprint.population == 5
+    assert fingerprint.anchor == (1, 1)
+    # the order cells are added and removed in doesn't matter
+    updated: Fingerprint = Fingerprint()
+    updated.flip(-7, 3, True)
+    for row, col in reversed(glider):
+        updated.flip(row, col, True)
+    updated.flip(-7, 3, False)
+    assert updated.hash == fingerprint.hash
+    assert updated.normalised() == fingerprint.normalised()
+    # the same pattern anywhere else has the same normalised hash, but a different hash
+    moved: Fingerprint = Fingerprint.from_cells(
+        (row - 1000, col + 12345) for row, col in glider
+    )
+    assert moved.hash != fingerprint.hash
+    assert moved.normalised() == fingerprint.normalised()
+    assert moved.anchor == (-999, 12346)
+    # a different pattern with the same population doesn't
+    assert (
+        Fingerprint.from_cells(glider[:4] + [(3, 3)]).normalised()
+        != fingerprint.normalised()
+    )
+    assert Fingerprint().anchor == (0, 0)
+    assert Fingerprint().normalised() == (0, 0)
+
+
+def test_incremental_fingerprints() -> None:
+    """Test that the fingerprints kept updated by the engines match computed ones."""
+    for gol in (
+        GameOfLifeDict(),
+        GameOfLifeSet(incremental=True),
+        GameOfLifeSet(),
+        GameOfLifeSet(workers=2, threads=True),
+        GameOfLifePacked(),
+        GameOfLifeTiles(),
+    ):
+        with create_reader("../data/Gosper_glider_gun.cells") as reader:
+            gol.add_cells(reader)
+        fingerprint: Fingerprint = gol.fingerprint()
+        for generation in range(60):
+            gol.progress()
+            if generation == 30:
+                gol.set_cell(-20, -20, True)
+                gol.set_cell(-20, -20, True)
+                gol.set_cell(*gol.get_live_cells()[-1], False)
+                gol.set_cells([(-30, -30), (-30, -30), gol.get_live_cells()[0]])
+            # the same fingerprint is kept updated rather than computed again
+            assert gol.fingerprint() is fingerprint
+            expected: Fingerprint = Fingerprint.from_cells(gol.get_live_cells())
+            assert fingerprint.hash == expected.hash
+            assert fingerprint.population == expected.population
+            assert fingerprint.anchor == expected.anchor
+
+
+def test_still_life_and_oscillator() -> None:
+    """Test that still lifes and oscillators are detected."""
+    gol: GameOfLife = GameOfLifeSet()
+    for row, col in ((0, 0), (0, 1), (1, 0), (1, 1)):
+        gol.set_cell(row, col, True)
+    cycle: Cycle | None = CycleDetector(gol).run()
+    assert cycle is not None
+    assert (cycle.generation, cycle.period, cycle.displacement) == (0, 1, (0, 0))
+
+    gol = GameOfLifeDict()
+    # a blinker next to a block that is still being formed
+    for row, col in ((0, 0), (0, 1), (0, 2), (10, 10), (10, 11), (11, 10)):
+        gol.set_cell(row, col, True)
+    cycle = CycleDetector(gol).run()
+    assert cycle is not None
+    assert (cycle.generation, cycle.period, cycle.displacement) == (1, 2, (0, 0))
+    assert str(cycle) == "period 2, displacement (0, 0), from generation 1"
+
+
+def test_spaceship() -> None:
+    """Test that a spaceship is detected, and can be fast forwarded."""
+    gol: GameOfLife = GameOfLifeSet()
+    MainGame.add_glider(gol)
+    detector: CycleDetector = CycleDetector(gol)
+    cycle: Cycle | None = detector.run()
+    assert cycle is not None
+    assert (cycle.period, cycle.displacement) == (4, (1, 1))
+    detector.fast_forward(cycle, 1_000_003)
+    assert gol.generation == 1_000_003
+
+    hashlife: GameOfLife = GameOfLifeHashLife()
+    MainGame.add_glider(hashlife)
+    hashlife.progress_many(1_000_003)
+    assert gol.get_live_cells() == hashlife.get_live_cells()
+    # fast forwarding to the past doesn't do anything
+    detector.fast_forward(cycle, 10)
+    assert gol.generation == 1_000_003
+
+
+def test_no_cycle() -> None:
+    """Test that a pattern which keeps growing doesn't repeat."""
+    gol: GameOfLife = GameOfLifeDict()
+    with create_reader("../data/Gosper_glider_gun.cells") as reader:
+        gol.add_cells(reader)
+    assert CycleDetector(gol).run(100) is None
+    assert gol.generation == 100
+
+
+def test_wrap() -> None:
+    """Test exact repeats of a universe which wraps around."""
+    gol: GameOfLife = GameOfLifeBitboard(8, 10)
+    MainGame.add_glider(gol)
+    detector: CycleDetector = CycleDetector(gol, translations=False)
+    cycle: Cycle | None = detector.run()
+    assert cycle is not None
+    # the glider needs to go around 5 times vertically and 4 times horizontally
+    assert (cycle.period, cycle.displacement) == (160, (0, 0))
+    detector.fast_forward(cycle, 1000)
+    assert gol.generation == 1000
+    expected: GameOfLife = GameOfLifeBitboard(8, 10)
+    MainGame.add_glider(expected)
+    expected.progress_many(40)
+    assert gol.get_live_cells() == expected.get_live_cells()
+
+
+def test_max_period() -> None:
+    """Test that only the fingerprints of the last max_period generations are kept."""
+    for max_period, period in ((100, None), (160, 160), (0, 160)):
+        gol: GameOfLife = GameOfLifeBitboard(8, 10)
+        MainGame.add_glider(gol)
+        detector: CycleDetector = CycleDetector(gol, False, max_period)
+        cycle: Cycle | None = detector.run(500)
+        assert (cycle.period if cycle is not None else None) == period
+        if max_period:
+            # pylint: disable-next=protected-access
+            assert len(detector._seen) <= max_period + 1
+    # the powers of the bases used by the fingerprints are only cached up to a limit
+    Fingerprint.from_cells((row, row) for row in range(2 * POWER_CACHE_SIZE))
+    assert _row_power.cache_info().currsize <= POWER_CACHE_SIZE
@@ -1,11 +1,19 @@
 """Tests for all the FileReader implementations."""
 
+import tracemalloc
+from array import array
+from os import listdir, remove
+from shutil import rmtree
+from time import time
 from pytest import raises
+from gameoflife import CellBuffer, Coordinate, MainGame
+from gameoflife.dataio.compression import COMPRESSIONS
 from gameoflife.dataio.create_io import create_reader
 from gameoflife.dataio.file_reader import FileReader
 from gameoflife.dataio.runlengthencoded_reader import RunLengthEncodedReader
 from gameoflife.dataio.plaintext_reader import PlainTextReader
-import pyparsing as pp
+from gameoflife.dataio.macrocell_reader import MacrocellReader
+from gameoflife.dataio.pattern_cache import CachedReader, PatternCache
 
 
 def test_create_reader() -> None:
@@ -14,53 +22,232 @@ def test_create_reader() -> None:
     assert reader.__class__ is RunLengthEncodedReader
     reader = create_reader("file.cells")
     assert reader.__class__ is PlainTextReader
+    reader = create_reader("file.mc")
+    assert reader.__class__ is MacrocellReader
+    reader = create_reader("file.RLE.GZ")
+    assert reader.__class__ is RunLengthEncodedReader
+    reader = create_reader("file.cells.xz")
+    assert reader.__class__ is PlainTextReader
+    with raises(ValueError):
+        create_reader("file.gz")
     with raises(ValueError):
         create_reader("foo.bar")
 
 
-# pylint: disable=protected-access
+def test_streaming() -> None:
+    """Test that streaming readers read the same cells a row at a time."""
+    for file in (
+        "../data/glider.cells",
+        "../data/empty_data_rows.cells",
+        "../data/Gosper_glider_gun.rle",
+        "../data/t1point5infinitegrowth2.rle",
+        "../data/glider.mc",
+    ):
+        with create_reader(file) as reader:
+            cells: CellBuffer = reader.cells
+            metadata: list[list[str]] = reader.metadata
+            assert list(reader.iter_batches()) == [cells]
+        with create_reader(file, stream=True) as reader:
+            assert reader.metadata == metadata
+            batches: list[CellBuffer] = list(reader.iter_batches())
+            assert not reader.cells
+        assert [cell for batch in batches for cell in batch] == cells
+        assert all(len({row for row, _ in batch}) == 1 for batch in batches)
+
+
+def test_compressed() -> None:
+    """Test that compressed files are read the same as uncompressed ones."""
+    for file in (
+        "../data/glider.cells",
+        "../data/Gosper_glider_gun.rle",
+        "../data/glider.mc",
+    ):
+        with create_reader(file) as reader:
+            cells: CellBuffer = reader.cells
+            metadata: list[list[str]] = reader.metadata
+        with open(file, encoding="UTF-8") as file_data:
+            data: str = file_data.read()
+        for compression, open_compressed in COMPRESSIONS.items():
+            compressed_file: str = f"{time()}_{file.rsplit('/', 1)[-1]}.{compression}"
+            with open_compressed(compressed_file, "wt", encoding="UTF-8") as output:
+                output.write(data)
+            with create_reader(compressed_file, stream=True) as reader:
+                assert reader.metadata == metadata
+                assert [
+                    cell for batch in reader.iter_batches() for cell in batch
+                ] == cells
+            remove(compressed_file)
+
+
+def test_streaming_memory() -> None:
+    """Test that streaming a large file doesn't hold all its cells in memory."""
+    tracemalloc.start()
+    try:
+        live_cells: int = 0
+        with create_reader("../data/period59glidergun.rle", stream=True) as reader:
+            for batch in reader.iter_batches():
+                live_cells += len(batch)
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert live_cells == 160697
+    # all the cells as a list of tuples would take over 10MB
+    assert peak < 1_000_000
+
+
+def test_cell_buffer() -> None:
+    """Test that a CellBuffer behaves like a list of the cells."""
+    cells: list[Coordinate] = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+    buffer: CellBuffer = CellBuffer(cells)
+    assert buffer == cells
+    assert list(buffer) == cells
+    assert len(buffer) == 5
+    assert buffer[1] == (1, 2) and buffer[-1] == (2, 2)
+    assert buffer[2:] == CellBuffer(cells[2:])
+    assert buffer[:2] + buffer[2:] == buffer
+    assert buffer != cells[:4] and buffer != set(cells)
+    assert (2, 0) in buffer and (1, 1) not in buffer
+    assert buffer.index((2, 0)) == 2
+    assert CellBuffer.from_row(2, buffer.cols[2:]) == cells[2:]
+    buffer.append(3, 1)
+    buffer.extend([(4, 0)])
+    assert buffer == cells + [(3, 1), (4, 0)]
+    assert not CellBuffer()
+
+
+def test_cell_buffer_memory() -> None:
+    """Test that the cells read into a CellBuffer take much less memory than tuples."""
+    with create_reader("../data/period59glidergun.rle") as reader:
+        buffer: CellBuffer = reader.cells
+    tracemalloc.start()
+    try:
+        cells: list[Coordinate] = list(buffer)
+        tuples: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(cells) == len(buffer) == 160697
+    assert buffer.rows.itemsize * 2 * len(buffer) * 4 < tuples
+
+
+def test_pattern_cache() -> None:
+    """Test that files read through a PatternCache are only parsed once."""
+    cache: PatternCache = PatternCache(f"{time()}_test_cache")
+    try:
+        assert create_reader("file.rle", cache=cache).__class__ is CachedReader
+        assert create_reader("file.mc", cache=cache).__class__ is MacrocellReader
+        for file in (
+            "../data/glider.cells",
+            "../data/empty_data_rows.cells",
+            "../data/highlife_replicator.rle",
+            "../data/t1point5infinitegrowth2.rle",
+        ):
+            with create_reader(file) as reader:
+                expected: tuple[str, list[list[str]], CellBuffer] = (
+                    reader.rule,
+                    reader.metadata,
+                    reader.cells,
+                )
+            # parsed and stored, then loaded
+            for _ in range(2):
+                with create_reader(file, cache=cache) as reader:
+                    assert (reader.rule, reader.metadata, reader.cells) == expected
+            assert cache.load(cache.key(file)) == expected
+            with create_reader(file, stream=True, cache=cache) as reader:
+                batches: list[CellBuffer] = list(reader.iter_batches())
+                assert not reader.cells
+            assert [cell for batch in batches for cell in batch] == expected[2]
+            assert all(len({row for row, _ in batch}) == 1 for batch in batches)
+        assert len(listdir(cache.directory)) == 4
+    finally:
+        rmtree(cache.directory)
+
+
+def test_pattern_cache_changes() -> None:
+    """Test that a changed file misses the cache, and the least recently used are evicted."""
+    cache: PatternCache = PatternCache(f"{time()}_test_cache", max_bytes=100)
+    test_file_name: str = f"{time()}_test_file.rle"
+    try:
+        for data, cells in (
+            ("x = 3, y = 1\n3o!\n", [(0, 0), (0, 1), (0, 2)]),
+            ("x = 3, y = 2\nbo$2bo!\n", [(0, 1), (1, 2)]),
+        ):
+            with open(test_file_name, "w", encoding="UTF-8") as file:
+                file.write(data)
+            with create_reader(test_file_name, cache=cache) as reader:
+                assert reader.cells == cells
+            # only the newest blob fits in 100 bytes
+            assert listdir(cache.directory) == [
+                cache.key(test_file_name) + PatternCache.EXTENSION
+            ]
+        header: bytes = b'{"rule": "B3/S23", "metadata": [["Glider"]]}\n'
+        valid: bytes = header + array("q", [0, 1, 2, 3]).tobytes()
+        # corrupt blobs are treated as misses
+        for blob in (
+            b"not a blob",
+            b"[]\n",
+            b"{}\n",
+            b'{"rule": 3, "metadata": []}\n',
+            b'{"rule": "B3/S23", "metadata": "Glider"}\n',
+            b'{"rule": "B3/S23", "metadata": [[1]]}\n',
+            valid[:-8],
+            valid[:-1],
+            valid,
+        ):
+            with open(f"{cache.directory}/{listdir(cache.directory)[0]}", "wb") as file:
+                file.write(blob)
+            assert (cache.load(cache.key(test_file_name)) is None) == (blob != valid)
+    finally:
+        rmtree(cache.directory)
+        remove(test_file_name)
+
+
+def test_pattern_cache_main_game() -> None:
+    """Test that MainGame only caches the files it loads when it is given a cache."""
+    cache: PatternCache = PatternCache(f"{time()}_test_cache")
+    try:
+        main: MainGame = MainGame(False, "../data/glider.rle", cache=cache)
+        assert listdir(cache.directory) == [
+            cache.key("../data/glider.rle") + PatternCache.EXTENSION
+        ]
+        # pylint: disable-next=protected-access
+        assert main._gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+    finally:
+        rmtree(cache.directory)
+
+
+# pylint: disable=protected-access,no-member
 # pyright: reportPrivateUsage=false
 class TestPlainText:
     """Tests specifically for the class PlainText."""
 
     def test_metadata_parser(self) -> None:
-        """Test the METADATA parser."""
-        results: pp.ParseResults = PlainTextReader._METADATA_LINE.parse_string(
-            """\
-!Name: Glider
-!Author: Richard K. Guy
-!The smallest, most common, and first discovered spaceship.
-!www.conwaylife.com/wiki/index.php?title=Glider
-.O
-..O
-OOO
-"""
-        )
-        assert results.metadata.as_list() == [  # type:ignore
+        """Test parsing metadata lines."""
+        assert [
+            PlainTextReader._parse_metadata(line)
+            for line in (
+                "!Name: Glider\n",
+                "!Author: Richard K. Guy\n",
+                "!The smallest, most common, and first discovered spaceship.\n",
+                "!www.conwaylife.com/wiki/index.php?title=Glider\n",
+                "!\n",
+            )
+        ] == [
             ["Name: Glider"],
             ["Author: Richard K. Guy"],
             ["The smallest, most common, and first discovered spaceship."],
             ["www.conwaylife.com/wiki/index.php?title=Glider"],
+            [],
         ]
 
     def test_data_rows_parser(self) -> None:
-        """Test the CELL_ROWS parser."""
-        results: pp.ParseResults = PlainTextReader._DATA_ROWS.parse_string(
-            """\
-.O
-..O
-OOO
-"""
-        )
-        assert results.data_rows.as_list() == [  # type:ignore
-            [".", "O"],
-            [".", ".", "O"],
-            ["O", "O", "O"],
-            [],
-        ]
+        """Test decoding the data rows into rows of cells."""
+        assert list(
+            PlainTextReader._decode([".O\n", "..O\n", "OOO\n"], 0, "file.cells")
+        ) == [[(0, 1)], [(1, 2)], [(2, 0), (2, 1), (2, 2)]]
 
-        results = PlainTextReader._DATA_ROWS.parse_string(
-            """\
+        batches: list[CellBuffer] = list(
+            PlainTextReader._decode(
+                """\
 ........................O...........
 ......................O.O...........
 ............OO......OO............OO
@@ -69,15 +256,22 @@ OO........O.....O...OO..............
 OO........O...O.OO....O.O...........
 ..........O.....O.......O...........
 ...........O...O....................
-............OO......................"""
+............OO......................""".splitlines(),
+                0,
+                "file.cells",
+            )
         )
-        assert len(results.data_rows) == 9  # type:ignore
-        assert results.data_rows[0].as_list()[24] == "O"  # type:ignore
-        assert results.data_rows[6].as_list()[10] == "O"  # type:ignore
-        assert results.data_rows[8].as_list()[11] == "."  # type:ignore
-        assert results.data_rows[8].as_list()[12] == "O"  # type:ignore
-        assert results.data_rows[8].as_list()[13] == "O"  # type:ignore
-        assert results.data_rows[8].as_list()[14] == "."  # type:ignore
+        assert len(batches) == 9
+        assert batches[0] == [(0, 24)]
+        assert (6, 10) in batches[6]
+        assert batches[8] == [(8, 12), (8, 13)]
+
+        # empty rows have no batch, spaces and tabs are ignored and the first row can be offset
+        assert list(
+            PlainTextReader._decode(["\n", ". O\t.O\n", "...\n", "O"], 3, "file.cells")
+        ) == [[(4, 1), (4, 3)], [(6, 0)]]
+        with raises(ValueError):
+            list(PlainTextReader._decode([".O\n", "OX\n"], 0, "file.cells"))
 
     def test_plain_text(self) -> None:
         """Test the PlainText file type."""
@@ -123,7 +317,7 @@ cells:
             )
 
 
-# pylint: disable=protected-access
+# pylint: disable=protected-access,no-member
 # pyright: reportPrivateUsage=false
 class TestRunLengthEncoded:
     """Tests specifically for the class RunLengthEncoded."""
@@ -168,6 +362,15 @@ class TestRunLengthEncoded:
             assert reader.cells[44] == (8, 72)
             assert len(reader.cells) == 1186
 
+    def test_large_file(self) -> None:
+        """Test loading a large RLE file, of about 6000 lines."""
+        with create_reader("../data/period59glidergun.rle") as reader:
+            assert reader._cols == 4091  # type: ignore
+            assert reader._rows == 3082  # type: ignore
+            assert len(reader.cells) == 160697
+            assert reader.cells[0] == (0, 60)
+            assert reader.cells[-1] == (3081, 2996)
+
     def test_run_length_encoded(self) -> None:
         """Test the RunLengthEncoded file type."""
         # with create_reader("../data/Gosper_glider_gun.rle") as reader:
@@ -195,19 +398,17 @@ rule: B3/S23"""
             )
 
     def test_metadata_no_content(self) -> None:
-        """Test the METADATA parser."""
-        results: pp.ParseResults = RunLengthEncodedReader._METADATA_LINE.parse_string(
-            """\
-#N next row has trailing space
-#O 
-#C
-#
-#C www.conwaylife.com/wiki/index.php?title=Glider
-x = 3, y = 3, rule = B3/S23
-bob$2bo$3o!
-"""
-        )
-        assert results.metadata.as_list() == [  # type:ignore
+        """Test parsing metadata lines with no type or no text."""
+        assert [
+            RunLengthEncodedReader._parse_metadata(line)
+            for line in (
+                "#N next row has trailing space\n",
+                "#O \n",
+                "#C\n",
+                "#\n",
+                "#C www.conwaylife.com/wiki/index.php?title=Glider\n",
+            )
+        ] == [
             ["N", "next row has trailing space"],
             ["O"],
             ["C"],
@@ -216,18 +417,17 @@ bob$2bo$3o!
         ]
 
     def test_metadata_parser(self) -> None:
-        """Test the METADATA parser."""
-        results: pp.ParseResults = RunLengthEncodedReader._METADATA_LINE.parse_string(
-            """\
-#N Glider
-#O Richard K. Guy
-#C The smallest, most common, and first discovered spaceship. Diagonal, has period 4 and speed c/4.
-#C www.conwaylife.com/wiki/index.php?title=Glider
-x = 3, y = 3, rule = B3/S23
-bob$2bo$3o!
-"""
-        )
-        assert results.metadata.as_list() == [  # type:ignore
+        """Test parsing metadata lines."""
+        assert [
+            RunLengthEncodedReader._parse_metadata(line)
+            for line in (
+                "#N Glider\n",
+                "#O Richard K. Guy\n",
+                "#C The smallest, most common, and first discovered spaceship. Diagonal, has "
+                + "period 4 and speed c/4.\n",
+                "#C www.conwaylife.com/wiki/index.php?title=Glider",
+            )
+        ] == [
             ["N", "Glider"],
             ["O", "Richard K. Guy"],
             [
@@ -239,58 +439,157 @@ bob$2bo$3o!
         ]
 
     def test_header_rule_parser(self) -> None:
-        """Test the HEADER parser."""
-        results: pp.ParseResults = (
-            RunLengthEncodedReader._HEADER + RunLengthEncodedReader._RULE
-        ).parse_string("x = 4, y = 5, rule = B3/S23")
-        assert results.header.as_list() == [["x", 4], ["y", 5]]  # type:ignore
-        assert results.rule.as_list() == ["B3/S23"]  # type:ignore
-
-        results = (
-            RunLengthEncodedReader._HEADER + RunLengthEncodedReader._RULE
-        ).parse_string("x = 4, y = 5")
-        assert results.header.as_list() == [["x", 4], ["y", 5]]  # type:ignore
-        assert len(results.rule) == 0  # type:ignore
+        """Test parsing the header line."""
+        assert RunLengthEncodedReader._parse_header(
+            "x = 4, y = 5, rule = B3/S23\n", "file.rle"
+        ) == (4, 5, "B3/S23")
+        assert RunLengthEncodedReader._parse_header("x = 4, y = 5", "file.rle") == (
+            4,
+            5,
+            "",
+        )
+        assert RunLengthEncodedReader._parse_header(
+            "x=12,y=3,rule=B36/S23 \n", "file.rle"
+        ) == (12, 3, "B36/S23")
+        with raises(ValueError):
+            RunLengthEncodedReader._parse_header("bob$2bo$3o!", "file.rle")
+        with raises(ValueError):
+            RunLengthEncodedReader._parse_header("x = 4", "file.rle")
 
     def test_data_rows_parser(self) -> None:
-        """Test the CELL_ROWS parser."""
-        results: pp.ParseResults = RunLengthEncodedReader._DATA_ROWS.parse_string(
-            "bob$2bo$3o!"
-        )
-        assert results.data_rows.as_list() == [  # type:ignore
-            ["b", "o", "b"],
-            [2, "b", "o"],
-            [3, "o"],
-        ]
+        """Test decoding the data rows into cells."""
+        assert _decode("bob$2bo$3o!") == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
 
-        results = RunLengthEncodedReader._DATA_ROWS.parse_string(
+        cells: list[Coordinate] = _decode(
             """\
 24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$2o8bo5bo3b2o$2o8bo3bob2o4b
 obo$10bo5bo7bo$11bo3bo$12b2o!
 """
         )
-        assert len(results.data_rows) == 9  # type:ignore
-        assert results.data_rows[0].as_list() == [24, "b", "o"]  # type:ignore
-        assert results.data_rows[6].as_list() == [  # type:ignore
-            10,
-            "b",
-            "o",
-            5,
-            "b",
-            "o",
-            7,
-            "b",
-            "o",
-        ]
-        assert results.data_rows[8].as_list() == [12, "b", 2, "o"]  # type:ignore
+        assert len(cells) == 36
+        assert cells[0] == (0, 24)
+        assert [col for row, col in cells if row == 6] == [10, 16, 24]
+        assert cells[-2:] == [(8, 12), (8, 13)]
 
         # Specific test for data that starts with multiple newlines
-        results = RunLengthEncodedReader._DATA_ROWS.parse_string(
-            "32$8b3o$7bo3bo$6bo4b2o!"
-        )
-        assert results.data_rows.as_list() == [  # type:ignore
-            [32, "$"],
-            [8, "b", 3, "o"],
-            [7, "b", "o", 3, "b", "o"],
-            [6, "b", "o", 4, "b", 2, "o"],
+        assert _decode("32$8b3o$7bo3bo$6bo4b2o!") == [
+            (32, 8),
+            (32, 9),
+            (32, 10),
+            (33, 7),
+            (33, 11),
+            (34, 6),
+            (34, 11),
+            (34, 12),
         ]
+
+        # other letters are dead cells, line breaks can split run counts and the "!" is optional
+        assert _decode("2A1\n0o$o!foo") == [(0, col) for col in range(2, 12)] + [(1, 0)]
+        assert _decode("bo$o") == [(0, 1), (1, 0)]
+
+        # a batch for each row with live cells
+        assert list(
+            RunLengthEncodedReader._decode(["bo2$\n", "2o$o", "b!\n"], "file.rle")
+        ) == [[(0, 1)], [(2, 0), (2, 1)], [(3, 0)]]
+
+    def test_invalid_data(self) -> None:
+        """Test that invalid data raises ValueError."""
+        for data in ("bo$*o!", "3!", "bo$2"):
+            with raises(ValueError):
+                _decode(data)
+
+    def test_parallel(self) -> None:
+        """Test that decoding in parallel reads the same cells as decoding serially."""
+        assert RunLengthEncodedReader._split("2o$bo$3o$o!", 3) == [
+            "2o$bo$",
+            "3o$",
+            "o!",
+        ]
+        assert RunLengthEncodedReader._split("2o$bo!", 4) == ["2o$", "bo!"]
+        chunk_bytes: int = RunLengthEncodedReader.CHUNK_BYTES
+        test_file_name: str = f"{time()}_test_file.rle"
+        try:
+            RunLengthEncodedReader.CHUNK_BYTES = 500
+            for file in (
+                "../data/Gosper_glider_gun.rle",
+                "../data/t1point5infinitegrowth2.rle",
+                "../data/period59glidergun.rle",
+            ):
+                with create_reader(file) as reader:
+                    cells: CellBuffer = reader.cells
+                with create_reader(file, workers=3) as reader:
+                    assert reader.cells == cells
+            with open(test_file_name, "w", encoding="UTF-8") as file_data:
+                file_data.write("x = 3, y = 1000\n" + "3o$\n" * 500 + "b*o!\n")
+            with raises(ValueError):
+                with create_reader(test_file_name, workers=3) as reader:
+                    pass
+        finally:
+            RunLengthEncodedReader.CHUNK_BYTES = chunk_bytes
+            remove(test_file_name)
+
+
+class TestMacrocell:
+    """Tests specifically for the class MacrocellReader."""
+
+    def test_macrocell(self) -> None:
+        """Test the Macrocell file type, where the root is centred on 0,0."""
+        with create_reader("../data/glider.mc") as reader:
+            assert reader.__class__ is MacrocellReader
+            assert reader.rule == "B3/S23"
+            assert reader.metadata == [
+                ["N", "Glider and block"],
+                [
+                    "C",
+                    "The same 16x16 node of a block and a glider, in the nw and se quadrants",
+                ],
+                [],
+            ]
+            block_glider: list[Coordinate] = [
+                (6, 0),
+                (6, 1),
+                (7, 0),
+                (7, 1),
+                (8, 9),
+                (9, 10),
+                (10, 8),
+                (10, 9),
+                (10, 10),
+            ]
+            assert (
+                reader.cells
+                == [(row - 16, col - 16) for row, col in block_glider] + block_glider
+            )
+
+    def test_node_parser(self) -> None:
+        """Test parsing leaves and nodes, and that invalid nodes raise ValueError."""
+        reader: MacrocellReader = MacrocellReader("file.mc")
+        assert reader._parse_node(".*$..*$***$\n") == (3, (2, 4, 7, 0, 0, 0, 0, 0))
+        assert reader._parse_node("$$$$$$$*......*$\n") == (3, (0,) * 7 + (129,))
+        reader.nodes.append(reader._parse_node("*$\n"))
+        assert reader._parse_node("4 0 1 1 0\n") == (4, (0, 1, 1, 0))
+        reader.nodes.append(reader._parse_node("4 0 1 1 0\n"))
+        assert reader._parse_node("5 2 0 0 2\n") == (5, (2, 0, 0, 2))
+        for line in (
+            # multi state nodes
+            "1 0 1 1 0\n",
+            # a child which is the wrong level
+            "5 1 0 0 0\n",
+            # a child which isn't defined yet
+            "4 0 0 0 3\n",
+            "4 0 0 1\n",
+            "4 0 0 x 1\n",
+        ):
+            with raises(ValueError):
+                reader._parse_node(line)
+
+
+def _decode(data: str) -> list[Coordinate]:
+    """Decode RLE data rows into a list of all their live cells."""
+    return [
+        cell
+        for batch in RunLengthEncodedReader._decode(
+            data.splitlines(keepends=True), "file.rle"
+        )
+        for cell in batch
+    ]
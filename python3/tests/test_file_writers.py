@@ -7,13 +7,21 @@ from pytest import raises
 from gameoflife.dataio.create_io import create_writer, create_reader
 from gameoflife.dataio.file_writer import FileWriter
 from gameoflife.dataio.plaintext_writer import PlainTextWriter
-from gameoflife import Coordinate, GameOfLife, GameOfLifeSet
+from gameoflife.dataio.runlengthencoded_writer import RunLengthEncodedWriter
+from gameoflife.dataio.macrocell_writer import MacrocellWriter
+from gameoflife import CellBuffer, GameOfLife, GameOfLifeHashLife, GameOfLifeSet
 
 
 def test_create_writer() -> None:
     """Test the create_writer function."""
     writer: FileWriter = create_writer("test_file.cells")
     assert writer.__class__ is PlainTextWriter
+    writer = create_writer("test_file.RLE")
+    assert writer.__class__ is RunLengthEncodedWriter
+    writer = create_writer("test_file.mc")
+    assert writer.__class__ is MacrocellWriter
+    writer = create_writer("test_file.mc.bz2")
+    assert writer.__class__ is MacrocellWriter
     with raises(ValueError):
         create_writer("test_file.not_a_real_extension")
 
@@ -33,11 +41,182 @@ def test_write_growth() -> None:
     _test_load_write("../data/t1point5infinitegrowth2.rle", 21617)
 
 
-def _test_load_write(file_to_load: str, saved_file_size: int) -> None:
-    """Test that we can save plaintext."""
-    test_file_name: str = f"{time()}_test_file.cells"
+def test_write_gosper_rle() -> None:
+    """Test load and writing a Gosper glider gun as RLE."""
+    _test_load_write("../data/Gosper_glider_gun.cells", 176, "rle")
+
+
+def test_write_growth_rle() -> None:
+    """Test load and writing a large pattern as RLE."""
+    _test_load_write("../data/t1point5infinitegrowth2.rle", 3027, "rle")
+
+
+def test_write_glider_rle() -> None:
+    """Test writing a glider as RLE, with its rule and metadata."""
+    test_file_name: str = f"{time()}_test_file.rle"
+    with create_writer(test_file_name) as writer:
+        writer.rule = "B36/S23"
+        writer.write(["A comment.", ""], [(-1, 4), (0, 5), (1, 3), (1, 4), (1, 5)])
+    with open(test_file_name, encoding="UTF-8") as file:
+        assert (
+            file.read()
+            == """\
+#C A comment.
+#C
+x = 3, y = 3, rule = B36/S23
+bo$2bo$3o!
+"""
+        )
+    remove(test_file_name)
+
+
+def test_write_large_rle() -> None:
+    """Test that a large pattern is encoded the same as the original, in 70 char lines."""
+    test_file_name: str = f"{time()}_test_file.rle"
+    with create_reader("../data/period59glidergun.rle") as reader:
+        cells: CellBuffer = reader.cells
+    with create_writer(test_file_name) as writer:
+        writer.write([], cells)
+    with open(test_file_name, encoding="UTF-8") as file:
+        lines: list[str] = file.read().splitlines()
+    with open("../data/period59glidergun.rle", encoding="UTF-8") as file:
+        original: list[str] = [
+            line for line in file.read().splitlines() if line[0] != "#"
+        ]
+    assert lines[0] == "x = 4091, y = 3082, rule = B3/S23"
+    assert lines[1:] == original[1:]
+    assert max(len(line) for line in lines[1:]) == 70
+    remove(test_file_name)
+
+
+def test_no_cells_rle() -> None:
+    """Test that we can save a game with no cells as RLE."""
+    test_file_name: str = f"{time()}_test_file.rle"
+    with create_writer(test_file_name) as writer:
+        writer.write([], [])
+    with open(test_file_name, encoding="UTF-8") as file:
+        assert file.read() == "x = 0, y = 0, rule = B3/S23\n!\n"
+    with create_reader(test_file_name) as reader:
+        assert not reader.cells
+    remove(test_file_name)
+
+
+def test_write_macrocell() -> None:
+    """Test writing Macrocell files, where identical nodes are only written once."""
+    test_file_name: str = f"{time()}_test_file.mc"
+    with create_reader("../data/glider.mc") as reader:
+        cells: CellBuffer = reader.cells
+    with create_writer(test_file_name) as writer:
+        writer.write(["A comment."], cells)
+    with open(test_file_name, encoding="UTF-8") as file:
+        assert (
+            file.read()
+            == """\
+[M2] (gameoflife)
+#R B3/S23
+#C A comment.
+$$$$$$**$**$
+.*$..*$***$
+4 1 0 0 2
+5 3 0 0 3
+"""
+        )
+    # a root which is a single leaf
+    with create_writer(test_file_name) as writer:
+        writer.rule = "B36/S23"
+        writer.write([], [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)])
+    with open(test_file_name, encoding="UTF-8") as file:
+        assert (
+            file.read()
+            == """\
+[M2] (gameoflife)
+#R B36/S23
+$$$$.....*$......*$....***$
+"""
+        )
+    remove(test_file_name)
+
+
+def test_write_macrocell_large() -> None:
+    """Test that a large pattern keeps its cells, and loads into HashLife the same as RLE."""
+    test_file_name: str = f"{time()}_test_file.mc"
+    gol: GameOfLife = GameOfLifeHashLife()
+    with create_reader("../data/t1point5infinitegrowth2.rle") as reader:
+        gol.add_cells(reader)
+    gol.progress_many(100)
+    with create_writer(test_file_name) as writer:
+        writer.write([], gol.iter_live_cells(), gol.bounds)
+    # the nodes are joined straight into HashLife
+    hashlife: GameOfLife = GameOfLifeHashLife()
+    gol_set: GameOfLife = GameOfLifeSet()
+    with create_reader(test_file_name, stream=True) as reader:
+        hashlife.add_cells(reader)
+    with create_reader(test_file_name, stream=True) as reader:
+        gol_set.add_cells(reader)
+    remove(test_file_name)
+    assert hashlife.get_live_cells() == gol_set.get_live_cells() == gol.get_live_cells()
+    for _ in range(3):
+        assert hashlife.progress() == gol_set.progress() == gol.progress()
+    hashlife.progress_many(64)
+    gol.progress_many(64)
+    assert hashlife.get_live_cells() == gol.get_live_cells()
+
+
+def test_write_compressed() -> None:
+    """Test that compressed files are written, which read back the same."""
+    with create_reader("../data/t1point5infinitegrowth2.rle") as reader:
+        cells: CellBuffer = reader.cells
+    for extension in ("cells", "rle", "mc"):
+        with open(f"{time()}_test_file.{extension}", "w", encoding="UTF-8") as file:
+            file_name: str = file.name
+        with create_writer(file_name) as writer:
+            writer.write(["A comment."], cells)
+        for compression, magic in (
+            ("gz", b"\x1f\x8b"),
+            ("bz2", b"BZh"),
+            ("xz", b"\xfd7zXZ"),
+        ):
+            compressed_file: str = f"{file_name}.{compression}"
+            with create_writer(compressed_file) as writer:
+                writer.write(["A comment."], cells)
+            with open(compressed_file, "rb") as file_bytes:
+                assert file_bytes.read().startswith(magic)
+            assert stat(compressed_file).st_size < stat(file_name).st_size
+            with create_reader(compressed_file) as reader:
+                assert reader.cells == cells
+            remove(compressed_file)
+        remove(file_name)
+
+
+def test_write_iterator() -> None:
+    """Test that writing from an iterator, with or without bounds, is the same as from a list."""
+    gol: GameOfLife = GameOfLifeSet()
+    with create_reader("../data/t1point5infinitegrowth2.rle") as reader:
+        gol.add_cells(reader)
+    gol.progress_many(20)
+    for extension in ("cells", "rle", "mc"):
+        contents: list[str] = []
+        for cells, bounds in (
+            (gol.get_live_cells(), None),
+            (gol.iter_live_cells(), gol.bounds),
+            (gol.iter_live_cells(), None),
+        ):
+            test_file_name: str = f"{time()}_test_file.{extension}"
+            with create_writer(test_file_name) as writer:
+                writer.write(["A comment."], cells, bounds)
+            with open(test_file_name, encoding="UTF-8") as file:
+                contents.append(file.read())
+            remove(test_file_name)
+        assert contents[0] == contents[1] == contents[2]
+
+
+def _test_load_write(
+    file_to_load: str, saved_file_size: int, extension: str = "cells"
+) -> None:
+    """Test that we can save a file of the given type and size, then load it again."""
+    test_file_name: str = f"{time()}_test_file.{extension}"
     gol: GameOfLife = GameOfLifeSet()
-    orig_cells: list[Coordinate]
+    orig_cells: CellBuffer
     with create_reader(file_to_load) as reader:
         gol.add_cells(reader)
         orig_cells = gol.get_live_cells()
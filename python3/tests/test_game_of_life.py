@@ -1,14 +1,22 @@
 """Tests for all the Conway's Game of Life implementations."""
 
+from typing import Callable
 from pytest import CaptureFixture, raises
 from gameoflife import (
     MainGame,
     GameOfLife,
     GameOfLifeArrays,
+    GameOfLifeBitboard,
     GameOfLifeDict,
+    GameOfLifeHashLife,
+    GameOfLifePacked,
     GameOfLifeSet,
+    GameOfLifeStrips,
+    GameOfLifeTiles,
+    Rule,
 )
 from gameoflife.dataio.create_io import create_reader
+from gameoflife.rule import CONWAY
 
 
 def test_set_unset_set() -> None:
@@ -23,6 +31,11 @@ def test_set_unset_set() -> None:
     set_cell_and_assert(gol, False, 0)
     set_cell_and_assert(gol, True, 1)
 
+    gol = GameOfLifeBitboard(100, 200)
+    set_cell_and_assert(gol, True, 1)
+    set_cell_and_assert(gol, False, 0)
+    set_cell_and_assert(gol, True, 1)
+
     gol = GameOfLifeDict()
     set_cell_and_assert(gol, True, 1)
     set_cell_and_assert(gol, False, 0)
@@ -33,6 +46,48 @@ def test_set_unset_set() -> None:
     set_cell_and_assert(gol, False, 0)
     set_cell_and_assert(gol, True, 1)
 
+    gol = GameOfLifeHashLife()
+    set_cell_and_assert(gol, True, 1)
+    set_cell_and_assert(gol, False, 0)
+    set_cell_and_assert(gol, True, 1)
+
+    gol = GameOfLifeTiles()
+    set_cell_and_assert(gol, True, 1)
+    set_cell_and_assert(gol, False, 0)
+    set_cell_and_assert(gol, True, 1)
+
+    gol = GameOfLifePacked()
+    set_cell_and_assert(gol, True, 1)
+    set_cell_and_assert(gol, False, 0)
+    set_cell_and_assert(gol, True, 1)
+
+
+def test_progress_many() -> None:
+    """Test that progressing many generations at once is the same as one at a time."""
+    engines: list[Callable[[], GameOfLife]] = [
+        lambda: GameOfLifeArrays(40, 50),
+        lambda: GameOfLifeBitboard(40, 50),
+        lambda: GameOfLifeBitboard(40, 50, False),
+        GameOfLifeDict,
+        GameOfLifeSet,
+        GameOfLifeHashLife,
+        GameOfLifeTiles,
+        GameOfLifePacked,
+    ]
+    for engine in engines:
+        gol: GameOfLife = engine()
+        many: GameOfLife = engine()
+        with create_reader("../data/Gosper_glider_gun.cells") as reader:
+            gol.add_cells(reader)
+            many.add_cells(reader)
+        counts: list[int] = [gol.progress() for _ in range(37)]
+        assert many.progress_many(30, want_counts=True) == counts[:30]
+        assert not many.progress_many(7)
+        assert many.generation == gol.generation == 37
+        assert many.count_live_cells() == gol.count_live_cells()
+        assert many.get_live_cells() == gol.get_live_cells()
+        assert not many.progress_many(0)
+
 
 def set_cell_and_assert(gol: GameOfLife, live: bool, num_live: int) -> None:
     """Set a cell and assert it stuck."""
@@ -41,6 +96,8 @@ def set_cell_and_assert(gol: GameOfLife, live: bool, num_live: int) -> None:
     assert gol.count_live_cells() == num_live
 
 
+# pylint: disable=protected-access
+# pyright: reportPrivateUsage=false
 class TestGameOfLifeSet:
     """Tests specifically for the class GameOfLifeSet."""
 
@@ -84,6 +141,74 @@ class TestGameOfLifeSet:
         print(gol)
         assert str(gol) == "Generation: 100\n  ■   \n    ■ \n■ ■ ■ "
 
+    def test_incremental(self) -> None:
+        """Test that incremental mode gives the same results as evaluating every cell."""
+        gol: GameOfLife = GameOfLifeSet()
+        incremental: GameOfLife = GameOfLifeSet(incremental=True)
+        with create_reader("../data/Gosper_glider_gun.cells") as reader:
+            gol.add_cells(reader)
+            incremental.add_cells(reader)
+        for generation in range(100):
+            assert incremental.progress() == gol.progress()
+            if generation == 50:
+                # edits between generations must be picked up too
+                row, col = gol.get_live_cells()[0]
+                for game in (gol, incremental):
+                    game.set_cell(20, 20, True)
+                    game.set_cell(20, 21, True)
+                    game.set_cell(row, col, False)
+        assert incremental.get_live_cells() == gol.get_live_cells()
+
+    def test_incremental_still_life(self) -> None:
+        """Test that in incremental mode nothing is evaluated once a pattern is stable."""
+        gol: GameOfLifeSet = GameOfLifeSet(incremental=True)
+        for row, col in ((0, 0), (0, 1), (1, 0), (1, 1), (10, 10), (10, 11), (10, 12)):
+            gol.set_cell(row, col, True)
+        gol.progress()
+        # only the blinker changed, not the block
+        assert gol._changed == {(9, 11), (11, 11), (10, 10), (10, 12)}
+        gol.set_cell(10, 11, False)
+        gol.progress()
+        gol.progress()
+        assert gol._changed == set()
+        assert gol.get_live_cells() == [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+    def test_parallel(self) -> None:
+        """Test that progressing bands in parallel gives the same results as serially."""
+        # with S0 isolated live cells survive, which they have to in every band
+        for rule, threads in ((CONWAY, True), (CONWAY, False), (Rule("B3/S023"), True)):
+            for workers in (2, 3, 50):
+                gol: GameOfLife = GameOfLifeSet(rule=rule)
+                parallel: GameOfLifeSet = GameOfLifeSet(
+                    workers=workers, threads=threads, rule=rule
+                )
+                with create_reader("../data/Gosper_glider_gun.cells") as reader:
+                    gol.add_cells(reader)
+                    parallel.add_cells(reader)
+                for game in (gol, parallel):
+                    game.set_cells([(-20, -20), (-20, 60)])
+                for _ in range(40):
+                    assert parallel.progress() == gol.progress()
+                    assert parallel.get_live_cells() == gol.get_live_cells()
+                assert str(parallel) == str(gol)
+                parallel.close()
+
+    def test_parallel_empty(self) -> None:
+        """Test progressing an empty universe in parallel."""
+        gol: GameOfLifeSet = GameOfLifeSet(workers=2, threads=True)
+        assert gol.progress() == 0
+        gol.set_cell(0, 0, True)
+        assert gol.progress() == 0
+        assert gol.progress() == 0
+        assert gol.generation == 3
+        gol.close()
+        gol.close()
+
+    def test_parallel_incremental(self) -> None:
+        """Test that incremental mode can't be combined with parallel workers."""
+        with raises(ValueError):
+            GameOfLifeSet(incremental=True, workers=2)
+
     def test_match_case2(self) -> None:
         """Test a live cell with exactly 2 neighbours."""
         gol: GameOfLife = GameOfLifeSet()
@@ -177,16 +302,156 @@ class TestGameOfLifeArrays:
         )
 
 
+class TestGameOfLifeBitboard:
+    """Tests specifically for the class GameOfLifeBitboard."""
+
+    def test_get_live_cells(self) -> None:
+        """Test the get_live_cells method."""
+        gol: GameOfLife = GameOfLifeBitboard(12, 15)
+        MainGame.add_glider(gol)
+        assert gol.count_live_cells() == 5
+        assert gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+    def test_modulo_wrap(self) -> None:
+        """Test that a pattern larger than the universe is wrapped the same as the arrays."""
+        gol: GameOfLife = GameOfLifeBitboard(12, 10)
+        arrays: GameOfLife = GameOfLifeArrays(12, 10)
+        with create_reader("../data/test_wrap.cells") as reader:
+            gol.add_cells(reader)
+            arrays.add_cells(reader)
+        assert str(gol) == str(arrays)
+
+    def test_same_as_arrays(self) -> None:
+        """Test that progressing is the same as GameOfLifeArrays, including tiny universes."""
+        for rows, cols in ((12, 10), (2, 7), (5, 1), (1, 1)):
+            gol: GameOfLife = GameOfLifeBitboard(rows, cols)
+            arrays: GameOfLife = GameOfLifeArrays(rows, cols)
+            with create_reader("../data/Gosper_glider_gun.cells") as reader:
+                gol.add_cells(reader)
+                arrays.add_cells(reader)
+            for _ in range(20):
+                assert gol.progress() == arrays.progress()
+                assert gol.get_live_cells() == arrays.get_live_cells()
+
+    def test_glider(self) -> None:
+        """Test that a simple glider progresses as expected."""
+        gol: GameOfLife = GameOfLifeBitboard(12, 15)
+        MainGame.add_glider(gol)
+        for _ in range(1000):
+            assert gol.progress() == 5
+        assert gol.get_live_cells() == [(0, 10), (0, 11), (0, 12), (10, 11), (11, 12)]
+        assert gol.generation == 1000
+
+    def test_bounded(self) -> None:
+        """Test that a glider dies at the edge of a universe which doesn't wrap."""
+        gol: GameOfLife = GameOfLifeBitboard(12, 15, False)
+        MainGame.add_glider(gol)
+        gol.set_cell(20, 20, True)
+        assert gol.count_live_cells() == 5
+        for _ in range(40):
+            gol.progress()
+        # the glider turns into a block when it hits the bottom edge
+        assert gol.get_live_cells() == [(10, 10), (10, 11), (11, 10), (11, 11)]
+
+    def test_outofbounds(self) -> None:
+        """Test that we get None when asking for a cell out of bounds."""
+        gol: GameOfLife = GameOfLifeBitboard(12, 15)
+        gol.set_cell(5, 6, True)
+        assert gol.get_cell(5, 6) is True
+        assert gol.get_cell(2, 2) is False
+        assert gol.get_cell(20, 20) is None
+
+    def test_str(self) -> None:
+        """Test the str generation."""
+        gol: GameOfLife = GameOfLifeBitboard(3, 4)
+        MainGame.add_glider(gol)
+        assert str(gol) == "Generation: 0\n□ ■ □ □ \n□ □ ■ □ \n■ ■ ■ □ "
+
+
+class TestGameOfLifeStrips:
+    """Tests specifically for the class GameOfLifeStrips."""
+
+    def test_set_unset_set(self) -> None:
+        """Test that we can set, unset, then set a cell as live."""
+        gol: GameOfLifeStrips = GameOfLifeStrips(100, 200, 2)
+        set_cell_and_assert(gol, True, 1)
+        set_cell_and_assert(gol, False, 0)
+        set_cell_and_assert(gol, True, 1)
+        gol.close()
+
+    def test_glider(self) -> None:
+        """Test that a simple glider progresses as expected."""
+        gol: GameOfLifeStrips = GameOfLifeStrips(12, 15, 3)
+        MainGame.add_glider(gol)
+        assert gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+        for _ in range(1000):
+            assert gol.progress() == 5
+        assert gol.get_live_cells() == [(0, 10), (0, 11), (0, 12), (10, 11), (11, 12)]
+        assert gol.generation == 1000
+        gol.close()
+
+    def test_same_as_arrays(self) -> None:
+        """Test that the results are identical to GameOfLifeArrays for any number of workers."""
+        for workers in (1, 2, 5, 20):
+            gol: GameOfLifeStrips = GameOfLifeStrips(12, 10, workers)
+            arrays: GameOfLife = GameOfLifeArrays(12, 10)
+            with create_reader("../data/Gosper_glider_gun.cells") as reader:
+                gol.add_cells(reader)
+                arrays.add_cells(reader)
+            assert str(gol) == str(arrays)
+            for _ in range(20):
+                assert gol.progress() == arrays.progress()
+                assert gol.get_live_cells() == arrays.get_live_cells()
+            assert gol.count_live_cells() == arrays.count_live_cells()
+            gol.close()
+
+    def test_outofbounds(self) -> None:
+        """Test that we get None when asking for a cell out of bounds."""
+        gol: GameOfLifeStrips = GameOfLifeStrips(12, 15, 1)
+        gol.set_cell(5, 6, True)
+        assert gol.get_cell(5, 6) is True
+        assert gol.get_cell(2, 2) is False
+        assert gol.get_cell(20, 20) is None
+        gol.close()
+
+
+# pylint: disable=protected-access
+# pyright: reportPrivateUsage=false
 class TestGameOfLifeDict:
-    """Tests specifically for the class GameOfLifeSortedDict."""
+    """Tests specifically for the class GameOfLifeDict."""
 
     def test_get_live_cells(self) -> None:
         """Test the get_live_cells method."""
         gol: GameOfLife = GameOfLifeDict()
         MainGame.add_glider(gol)
         assert gol.count_live_cells() == 5
-        with raises(NotImplementedError):
-            gol.get_live_cells()
+        assert gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+    def test_neighbour_counts(self) -> None:
+        """Test that neighbour counts are maintained and cells without neighbours are pruned."""
+        gol: GameOfLifeDict = GameOfLifeDict()
+        gol.set_cell(0, 0, True)
+        gol.set_cell(0, 1, True)
+        assert gol._cells[(0, 0)] == 0b11  # 1 neighbour, live
+        assert gol._cells[(1, 1)] == 0b100  # 2 neighbours, dead
+        assert len(gol._cells) == 12
+        gol.set_cell(0, 1, False)
+        assert gol._cells[(0, 0)] == 0b1
+        assert len(gol._cells) == 9
+        gol.progress()
+        assert not gol._cells
+        assert gol.count_live_cells() == 0
+
+    def test_same_as_set(self) -> None:
+        """Test a large pattern gives the same results as GameOfLifeSet."""
+        gol: GameOfLife = GameOfLifeDict()
+        gol_set: GameOfLife = GameOfLifeSet()
+        with create_reader("../data/t1point5infinitegrowth2.rle") as reader:
+            gol.add_cells(reader)
+            gol_set.add_cells(reader)
+        for _ in range(50):
+            assert gol.progress() == gol_set.progress()
+        assert gol.get_live_cells() == gol_set.get_live_cells()
 
     def test_glider(self) -> None:
         """Test that a simple glider progresses as expected."""
@@ -217,15 +482,7 @@ class TestGameOfLifeDict:
         for _ in range(100):
             gol.progress()
             assert gol.count_live_cells() == 5
-        assert (
-            str(gol)
-            == "Generation: 100\n"
-            + "  □ □ □   \n"
-            + "  □ ■ □ □ \n"
-            + "□ □ □ ■ □ \n"
-            + "□ ■ ■ ■ □ \n"
-            + "□ □ □ □ □ "
-        )
+        assert str(gol) == "Generation: 100\n" + "□ ■ □ \n" + "□ □ ■ \n" + "■ ■ ■ "
 
     def test_match_case2(self) -> None:
         """Test a live cell with exactly 2 neighbours."""
@@ -240,6 +497,255 @@ class TestGameOfLifeDict:
         assert gol.get_cell(0, 2) is False
 
 
+# pylint: disable=protected-access
+# pyright: reportPrivateUsage=false
+class TestGameOfLifeHashLife:
+    """Tests specifically for the class GameOfLifeHashLife."""
+
+    def test_get_live_cells(self) -> None:
+        """Test the get_live_cells method."""
+        gol: GameOfLife = GameOfLifeHashLife()
+        MainGame.add_glider(gol)
+        assert gol.count_live_cells() == 5
+        assert gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+    def test_glider(self) -> None:
+        """Test that a simple glider progresses as expected."""
+        gol: GameOfLife = GameOfLifeHashLife()
+        MainGame.add_glider(gol)
+        assert gol.count_live_cells() == 5
+        for _ in range(1000):
+            gol.progress()
+            assert gol.count_live_cells() == 5
+        assert gol.get_live_cells() == [
+            (250, 251),
+            (251, 252),
+            (252, 250),
+            (252, 251),
+            (252, 252),
+        ]
+        assert gol.generation == 1000
+
+    def test_progress_pow2(self) -> None:
+        """Test that jumping 2^k generations is the same as progressing one at a time."""
+        gol: GameOfLifeHashLife = GameOfLifeHashLife()
+        MainGame.add_glider(gol)
+        assert gol.progress_pow2(10) == 5
+        assert gol.generation == 1024
+        assert gol.get_live_cells() == [
+            (256, 257),
+            (257, 258),
+            (258, 256),
+            (258, 257),
+            (258, 258),
+        ]
+
+    def test_same_as_set(self) -> None:
+        """Test a large pattern gives the same results as GameOfLifeSet."""
+        hashlife: GameOfLifeHashLife = GameOfLifeHashLife()
+        gol_set: GameOfLife = GameOfLifeSet()
+        with create_reader("../data/Gosper_glider_gun.cells") as reader:
+            hashlife.add_cells(reader)
+            gol_set.add_cells(reader)
+        for _ in range(64):
+            assert hashlife.progress() == gol_set.progress()
+        hashlife.progress_pow2(6)
+        for _ in range(64):
+            gol_set.progress()
+        assert hashlife.generation == gol_set.generation == 128
+        assert hashlife.get_live_cells() == gol_set.get_live_cells()
+
+    def test_max_nodes(self) -> None:
+        """Test that the node cache is trimmed once it grows past max_nodes."""
+        gol: GameOfLifeHashLife = GameOfLifeHashLife(max_nodes=500)
+        with create_reader("../data/Gosper_glider_gun.cells") as reader:
+            gol.add_cells(reader)
+        for _ in range(100):
+            gol.progress()
+            assert len(gol._nodes) + len(gol._results) <= 500
+        assert gol.count_live_cells() == 63
+        # the universe alone is over max_nodes, so the cap is raised rather than collecting again
+        # every generation, which would leave no results
+        gol = GameOfLifeHashLife(max_nodes=30)
+        with create_reader("../data/Gosper_glider_gun.cells") as reader:
+            gol.add_cells(reader)
+        collections: int = 0
+        for _ in range(100):
+            gol.progress()
+            collections += not gol._results
+        assert collections < 10
+        assert gol._node_limit > 30
+
+    def test_outofbounds(self) -> None:
+        """Test that we get False when asking for a cell out of bounds."""
+        gol: GameOfLife = GameOfLifeHashLife()
+        gol.set_cell(10, 10, True)
+        gol.set_cell(-1000, 1000, True)
+        assert gol.get_cell(2, 2) is False
+        assert gol.get_cell(10, 10) is True
+        assert gol.get_cell(-1000, 1000) is True
+        assert gol.get_cell(5000, -5000) is False
+
+    def test_str(self) -> None:
+        """Test the str generation."""
+        gol: GameOfLife = GameOfLifeHashLife()
+        assert str(gol) == "Generation: 0"
+        MainGame.add_glider(gol)
+        for _ in range(100):
+            gol.progress()
+            assert gol.count_live_cells() == 5
+        assert str(gol) == "Generation: 100\n  ■   \n    ■ \n■ ■ ■ "
+
+
+# pylint: disable=protected-access
+# pyright: reportPrivateUsage=false
+class TestGameOfLifeTiles:
+    """Tests specifically for the class GameOfLifeTiles."""
+
+    def test_get_live_cells(self) -> None:
+        """Test the get_live_cells method, including cells across several tiles."""
+        gol: GameOfLife = GameOfLifeTiles()
+        MainGame.add_glider(gol)
+        assert gol.count_live_cells() == 5
+        assert gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+        gol.set_cell(-1, 100, True)
+        gol.set_cell(1, -100, True)
+        assert gol.get_live_cells() == [
+            (-1, 100),
+            (0, 1),
+            (1, -100),
+            (1, 2),
+            (2, 0),
+            (2, 1),
+            (2, 2),
+        ]
+
+    def test_glider(self) -> None:
+        """Test that a simple glider progresses as expected across tiles."""
+        gol: GameOfLifeTiles = GameOfLifeTiles()
+        MainGame.add_glider(gol)
+        for _ in range(1000):
+            assert gol.progress() == 5
+        assert gol.get_live_cells() == [
+            (250, 251),
+            (251, 252),
+            (252, 250),
+            (252, 251),
+            (252, 252),
+        ]
+        assert gol.generation == 1000
+        # only the tile the glider is in is kept
+        assert len(gol._tiles) == 1
+
+    def test_same_as_set(self) -> None:
+        """Test a pattern spread over several tiles gives the same results as GameOfLifeSet."""
+        gol: GameOfLife = GameOfLifeTiles()
+        gol_set: GameOfLife = GameOfLifeSet()
+        with create_reader("../data/t1point5infinitegrowth2.rle") as reader:
+            gol.add_cells(reader)
+            gol_set.add_cells(reader)
+        for _ in range(50):
+            assert gol.progress() == gol_set.progress()
+        assert gol.get_live_cells() == gol_set.get_live_cells()
+
+    def test_free_empty_tiles(self) -> None:
+        """Test that tiles are freed as soon as they are empty."""
+        gol: GameOfLifeTiles = GameOfLifeTiles()
+        gol.set_cell(-70, 70, True)
+        assert len(gol._tiles) == 1
+        gol.set_cell(-70, 70, False)
+        assert not gol._tiles
+        gol.set_cell(-70, 70, True)
+        gol.progress()
+        assert not gol._tiles
+
+    def test_outofbounds(self) -> None:
+        """Test that we get False when asking for a cell out of bounds."""
+        gol: GameOfLife = GameOfLifeTiles()
+        gol.set_cell(10, 10, True)
+        assert gol.get_cell(2, 2) is False
+        assert gol.get_cell(10, 10) is True
+        assert gol.get_cell(-1000, 1000) is False
+
+    def test_str(self) -> None:
+        """Test the str generation."""
+        gol: GameOfLife = GameOfLifeTiles()
+        assert str(gol) == "Generation: 0"
+        MainGame.add_glider(gol)
+        for _ in range(100):
+            gol.progress()
+            assert gol.count_live_cells() == 5
+        assert str(gol) == "Generation: 100\n  ■   \n    ■ \n■ ■ ■ "
+
+
+class TestGameOfLifePacked:
+    """Tests specifically for the class GameOfLifePacked."""
+
+    def test_pack_unpack(self) -> None:
+        """Test that coordinates survive being packed, including negative and extreme values."""
+        for coords in ((0, 0), (-1, -5), (5, -(2**31)), (-7, 2**31 - 1), (10**12, 3)):
+            assert GameOfLifePacked.unpack(GameOfLifePacked.pack(*coords)) == coords
+        # keys sort in the same order as coordinates
+        assert GameOfLifePacked.pack(-1, 100) < GameOfLifePacked.pack(0, -100)
+
+    def test_get_live_cells(self) -> None:
+        """Test the get_live_cells method."""
+        gol: GameOfLife = GameOfLifePacked()
+        MainGame.add_glider(gol)
+        gol.set_cell(1, -100, True)
+        assert gol.count_live_cells() == 6
+        assert gol.get_live_cells() == [
+            (0, 1),
+            (1, -100),
+            (1, 2),
+            (2, 0),
+            (2, 1),
+            (2, 2),
+        ]
+
+    def test_glider(self) -> None:
+        """Test that a simple glider progresses as expected."""
+        gol: GameOfLife = GameOfLifePacked()
+        MainGame.add_glider(gol)
+        for _ in range(1000):
+            assert gol.progress() == 5
+        assert gol.get_live_cells() == [
+            (250, 251),
+            (251, 252),
+            (252, 250),
+            (252, 251),
+            (252, 252),
+        ]
+        assert gol.generation == 1000
+
+    def test_same_as_set(self) -> None:
+        """Test a large pattern gives the same results as GameOfLifeSet."""
+        gol: GameOfLife = GameOfLifePacked()
+        gol_set: GameOfLife = GameOfLifeSet()
+        with create_reader("../data/t1point5infinitegrowth2.rle") as reader:
+            gol.add_cells(reader)
+            gol_set.add_cells(reader)
+        for _ in range(50):
+            assert gol.progress() == gol_set.progress()
+        assert gol.get_live_cells() == gol_set.get_live_cells()
+
+    def test_outofbounds(self) -> None:
+        """Test that we get False when asking for a cell out of bounds."""
+        gol: GameOfLife = GameOfLifePacked()
+        gol.set_cell(10, 10, True)
+        assert gol.get_cell(2, 2) is False
+        assert gol.get_cell(10, 10) is True
+
+    def test_str(self) -> None:
+        """Test the str generation."""
+        gol: GameOfLife = GameOfLifePacked()
+        assert str(gol) == "Generation: 0"
+        MainGame.add_glider(gol)
+        for _ in range(100):
+            gol.progress()
+        assert str(gol) == "Generation: 100\n  ■   \n    ■ \n■ ■ ■ "
+
+
 # pylint: disable=protected-access
 # pyright: reportPrivateUsage=false
 class TestMainGame:
@@ -358,6 +864,36 @@ class TestMainGame:
         assert main
         assert main._gol.__class__.__name__ == GameOfLifeArrays(0, 0).__class__.__name__
 
+    def test_initialise_engine(self) -> None:
+        """Test that we load the requested engine."""
+        main: MainGame = MainGame(False, engine="hashlife")
+        assert main._gol.__class__ is GameOfLifeHashLife
+        main = MainGame(True, "", 10, 10, "arrays")
+        assert main._gol.__class__ is GameOfLifeArrays
+
+    def test_run_headless(self, capfd: CaptureFixture[str]) -> None:
+        """Test running generations without the UI."""
+        main: MainGame = MainGame(False, "../data/glider.rle", engine="hashlife")
+        main.run_headless(100_000)
+        out: list[str] = capfd.readouterr()[0].splitlines()
+        assert out[0] == "Generation:    100000"
+        assert out[1] == "Live cells:    5"
+        assert out[2].startswith("Progress time: ")
+
+    def test_run_headless_until_stable(self, capfd: CaptureFixture[str]) -> None:
+        """Test running until the universe repeats, then skipping ahead."""
+        main: MainGame = MainGame(False, "../data/glider.rle", engine="set")
+        main.run_headless(0, True)
+        out: list[str] = capfd.readouterr()[0].splitlines()
+        assert out[0] == "Generation:    4"
+        assert (
+            out[2] == "Stable:        period 4, displacement (1, 1), from generation 0"
+        )
+        main.run_headless(1_000_000_000, True)
+        out = capfd.readouterr()[0].splitlines()
+        assert out[0] == "Generation:    1000000004"
+        assert out[1] == "Live cells:    5"
+
     def test_load_rle_file(self, capfd: CaptureFixture[str]) -> None:
         """Test the loading of an RLE file."""
         main: MainGame = MainGame(False, "../data/glider.rle")
@@ -0,0 +1,79 @@
+"""Tests for the Game of Life implementations that need the optional numpy dependency."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from gameoflife import MainGame, GameOfLife, GameOfLifeArrays
+from gameoflife.gol_numpy import GameOfLifeNumpy
+from gameoflife.dataio.create_io import create_reader
+
+
+def test_set_unset_set() -> None:
+    """Test that we can set, unset, then set a cell as live."""
+    gol: GameOfLife = GameOfLifeNumpy(100, 200)
+    for live, num_live in ((True, 1), (False, 0), (True, 1)):
+        gol.set_cell(50, 55, live)
+        assert gol.get_cell(50, 55) is live
+        assert gol.count_live_cells() == num_live
+
+
+# pylint: disable=protected-access
+# pyright: reportPrivateUsage=false
+def test_main_game_engine() -> None:
+    """Test that MainGame can be asked to use the numpy engine."""
+    main: MainGame = MainGame(True, "", 10, 10, "numpy")
+    assert main._gol.__class__ is GameOfLifeNumpy
+
+
+class TestGameOfLifeNumpy:
+    """Tests specifically for the class GameOfLifeNumpy."""
+
+    def test_get_live_cells(self) -> None:
+        """Test the get_live_cells method."""
+        gol: GameOfLife = GameOfLifeNumpy(12, 15)
+        MainGame.add_glider(gol)
+        assert gol.count_live_cells() == 5
+        assert gol.get_live_cells() == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+    def test_glider(self) -> None:
+        """Test that a simple glider progresses as expected."""
+        gol: GameOfLife = GameOfLifeNumpy(12, 15)
+        MainGame.add_glider(gol)
+        for _ in range(1000):
+            assert gol.progress() == 5
+        assert gol.get_live_cells() == [(0, 10), (0, 11), (0, 12), (10, 11), (11, 12)]
+        assert gol.generation == 1000
+
+    def test_same_as_arrays(self) -> None:
+        """Test that a pattern larger than the array wraps the same as GameOfLifeArrays."""
+        for rows, cols in ((12, 10), (2, 7), (1, 1)):
+            arrays: GameOfLife = GameOfLifeArrays(rows, cols)
+            gol: GameOfLife = GameOfLifeNumpy(rows, cols)
+            with create_reader("../data/Gosper_glider_gun.cells") as reader:
+                arrays.add_cells(reader)
+                gol.add_cells(reader)
+            assert str(gol) == str(arrays)
+            for _ in range(20):
+                assert gol.progress() == arrays.progress()
+                assert gol.get_live_cells() == arrays.get_live_cells()
+                assert gol.bounds == arrays.bounds
+            gol.progress_many(5)
+            arrays.progress_many(5)
+            assert gol.count_live_cells() == arrays.count_live_cells()
+            assert gol.bounds == arrays.bounds
+            assert gol.get_region(-3, -2, rows + 5, cols + 9) == arrays.get_region(
+                -3, -2, rows + 5, cols + 9
+            )
+            assert not any(gol.get_region(rows, 0, 3, cols))
+            assert list(gol.iter_live_cells()) == arrays.get_live_cells()
+
+    def test_outofbounds(self) -> None:
+        """Test that we get None when asking for a cell out of bounds."""
+        gol: GameOfLife = GameOfLifeNumpy(12, 15)
+        gol.set_cell(5, 6, True)
+        assert gol.get_cell(5, 6) is True
+        assert gol.get_cell(2, 2) is False
+        assert gol.get_cell(20, 20) is None
+        assert gol.get_cell(-1, 0) is None
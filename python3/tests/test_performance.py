@@ -3,7 +3,14 @@
 import logging
 from time import perf_counter_ns
 import pytest
-from gameoflife import GameOfLife, GameOfLifeDict, GameOfLifeSet
+from gameoflife import (
+    GameOfLife,
+    GameOfLifeDict,
+    GameOfLifeHashLife,
+    GameOfLifePacked,
+    GameOfLifeSet,
+    GameOfLifeTiles,
+)
 from gameoflife.dataio.create_io import create_reader
 
 pytestmark: pytest.MarkDecorator = pytest.mark.performance
@@ -13,7 +20,29 @@ LOGGER: logging.Logger = logging.getLogger(__name__)
 # @pytest.mark.skip
 def test_dict_progress_large_file() -> None:
     """Performance test for the GameOfLifeDict().progress() method."""
-    gol: GameOfLife = GameOfLifeDict()
+    _progress_large_file(GameOfLifeDict())
+
+
+# @pytest.mark.skip
+def test_set_progress_large_file() -> None:
+    """Performance test for the GameOfLifeSet().progress() method."""
+    _progress_large_file(GameOfLifeSet())
+
+
+# @pytest.mark.skip
+def test_packed_progress_large_file() -> None:
+    """Performance test for the GameOfLifePacked().progress() method."""
+    _progress_large_file(GameOfLifePacked())
+
+
+# @pytest.mark.skip
+def test_tiles_progress_large_file() -> None:
+    """Performance test for the GameOfLifeTiles().progress() method."""
+    _progress_large_file(GameOfLifeTiles())
+
+
+def _progress_large_file(gol: GameOfLife) -> None:
+    """Load the large file and measure the average progress() time of the given engine."""
     LOGGER.info("'create_reader(period59glidergun.rle)' starting...")
     start: int = perf_counter_ns()
     with create_reader("../data/period59glidergun.rle") as reader:
@@ -24,24 +53,23 @@ def test_dict_progress_large_file() -> None:
         round(last_gen_time / 1000),
     )
 
-    # measure the progress() method
+    # measure the progress_many() method, which avoids the per generation overhead of progress()
     times: int = 100
-    LOGGER.info("'gol.progress()' * %s starting...", times)
+    LOGGER.info("'gol.progress_many(%s)' starting...", times)
     start = perf_counter_ns()
-    for _ in range(times):
-        gol.progress()
+    gol.progress_many(times)
     last_gen_time = perf_counter_ns() - start
     LOGGER.info(
-        "'gol.progress()' average(%s) time: %s µs",
+        "'gol.progress_many(%s)' average time: %s µs",
         times,
         round(last_gen_time / 1000 / times),
     )
 
 
 # @pytest.mark.skip
-def test_set_progress_large_file() -> None:
-    """Performance test for the GameOfLifeSet().progress() method."""
-    gol: GameOfLife = GameOfLifeSet()
+def test_hashlife_progress_pow2_large_file() -> None:
+    """Performance test for the GameOfLifeHashLife().progress_pow2() method."""
+    gol: GameOfLifeHashLife = GameOfLifeHashLife()
     LOGGER.info("'create_reader(period59glidergun.rle)' starting...")
     start: int = perf_counter_ns()
     with create_reader("../data/period59glidergun.rle") as reader:
@@ -52,15 +80,14 @@ def test_set_progress_large_file() -> None:
         round(last_gen_time / 1000),
     )
 
-    # measure the progress() method
-    times: int = 100
-    LOGGER.info("'gol.progress()' * %s starting...", times)
+    # measure the progress_pow2() method
+    exponent: int = 10
+    LOGGER.info("'gol.progress_pow2(%s)' starting...", exponent)
     start = perf_counter_ns()
-    for _ in range(times):
-        gol.progress()
+    gol.progress_pow2(exponent)
     last_gen_time = perf_counter_ns() - start
     LOGGER.info(
-        "'gol.progress()' average(%s) time: %s µs",
-        times,
-        round(last_gen_time / 1000 / times),
+        "'gol.progress_pow2(%s)' time: %s µs",
+        exponent,
+        round(last_gen_time / 1000),
     )
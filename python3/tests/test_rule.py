@@ -0,0 +1,150 @@
+"""Tests for the Rule class."""
+
+from pytest import raises
+from gameoflife import (
+    GameOfLife,
+    GameOfLifeArrays,
+    GameOfLifeDict,
+    GameOfLifeSet,
+    GameOfLifeTiles,
+    Rule,
+)
+from gameoflife.dataio.create_io import create_reader
+from gameoflife.rule import CONWAY
+
+
+def test_parse() -> None:
+    """Test the different forms of rule strings."""
+    for rule in ("B3/S23", "b3/s23", "B3S23", "S23/B3", "23/3", " B3 / S23 "):
+        assert Rule(rule) == CONWAY
+        assert str(Rule(rule)) == "B3/S23"
+    assert str(Rule("B63/S32")) == "B36/S23"
+    assert str(Rule("B/S")) == "B/S"
+    assert repr(Rule("B36/S23")) == 'Rule("B36/S23")'
+    assert hash(Rule("B3/S23")) == hash(CONWAY)
+    assert Rule("B36/S23") != CONWAY
+    assert CONWAY != "B3/S23"
+    for rule in ("B9/S23", "B3/S23/S", "B1z/S", "B0c/S8", "B3", "Conway", "B3/S2x3"):
+        with raises(ValueError):
+            Rule(rule)
+
+
+def test_totalistic() -> None:
+    """Test the next state table of outer totalistic rules."""
+    assert CONWAY.is_totalistic
+    assert not CONWAY.births_from_nothing
+    # indexed by the count of live neighbours shifted left by one, with the live state in bit 0
+    assert [count for count in range(9) if CONWAY.next_state[count << 1 | 1]] == [2, 3]
+    assert [count for count in range(9) if CONWAY.next_state[count << 1]] == [3]
+    assert Rule("B0/S8").births_from_nothing
+    # listing every letter of a count is the same as just the count
+    assert Rule("B3aceijknqry/S2aceikn3") == CONWAY
+    assert Rule("B3aceijknqry/S2aceikn3").is_totalistic
+
+
+def test_isotropic() -> None:
+    """Test the neighbourhood table of isotropic non-totalistic rules."""
+    rule: Rule = Rule("B2i/S")
+    assert not rule.is_totalistic
+    assert str(rule) == "B2i/S"
+    # 2i is 2 opposite edge neighbours, in both orientations
+    assert rule.table[8 | 32] and rule.table[2 | 128]
+    # 2e is 2 edge neighbours at right angles, 2n is 2 opposite corner neighbours
+    assert not rule.table[2 | 8] and not rule.table[4 | 64]
+    # the live cell itself doesn't survive
+    assert not rule.table[8 | 16 | 32]
+    assert str(Rule("B2-i/S3aceijknqy")) == "B2-i/S3-r"
+    # the letters for 5 to 7 neighbours are the complements of those for 3 to 1 neighbours
+    assert Rule("B7c/S").table[511 & ~16 & ~1]
+    assert not Rule("B7c/S").table[511 & ~16 & ~2]
+    # the neighbourhoods of the letters n and j, as in Golly's table of them
+    assert Rule("B3n/S").table[1 | 4 | 8] and not Rule("B3n/S").table[2 | 4 | 8]
+    assert Rule("B3j/S").table[2 | 4 | 8] and not Rule("B3j/S").table[1 | 4 | 8]
+    assert (
+        Rule("B4n/S").table[1 | 2 | 4 | 64] and not Rule("B4j/S").table[1 | 2 | 4 | 64]
+    )
+    assert (
+        Rule("B4j/S").table[2 | 8 | 32 | 64]
+        and not Rule("B4n/S").table[2 | 8 | 32 | 64]
+    )
+    # every one of the 70 arrangements of 4 neighbours has one of the 13 letters
+    assert all(
+        Rule("B4" + letter + "/S").table.count(1) == count
+        for letter, count in zip(
+            "aceijknqrtwyz", (8, 1, 1, 4, 8, 8, 8, 4, 8, 4, 4, 8, 4)
+        )
+    )
+
+
+def test_engines() -> None:
+    """Test that the engines which support rules all give the same results."""
+    for rule in (Rule("B36/S23"), Rule("B34/S34")):
+        games: list[GameOfLife] = [
+            GameOfLifeSet(rule=rule),
+            GameOfLifeSet(incremental=True, rule=rule),
+            GameOfLifeSet(workers=2, threads=True, rule=rule),
+            GameOfLifeDict(rule=rule),
+            GameOfLifeArrays(60, 60, rule=rule),
+        ]
+        for game in games:
+            _add_r_pentomino(game)
+        for _ in range(30):
+            counts: set[int] = {game.progress() for game in games}
+            assert len(counts) == 1
+        assert len({str(game.get_live_cells()) for game in games}) == 1
+
+
+def test_isotropic_engines() -> None:
+    """Test that the engines which support isotropic non-totalistic rules give the same results."""
+    rule: Rule = Rule("B3-k/S2-i34q")
+    games: list[GameOfLife] = [
+        GameOfLifeSet(rule=rule),
+        GameOfLifeSet(incremental=True, rule=rule),
+        GameOfLifeDict(rule=rule),
+        GameOfLifeArrays(60, 60, rule=rule),
+    ]
+    for game in games:
+        _add_r_pentomino(game)
+    for _ in range(30):
+        counts: set[int] = {game.progress() for game in games}
+        assert len(counts) == 1
+    assert len({str(game.get_live_cells()) for game in games}) == 1
+
+
+def test_unsupported() -> None:
+    """Test that engines raise a ValueError for rules they don't support."""
+    with raises(ValueError):
+        GameOfLifeTiles().rule = Rule("B36/S23")
+    with raises(ValueError):
+        GameOfLifeDict(rule=Rule("B0/S"))
+    with raises(ValueError):
+        GameOfLifeSet(rule=Rule("B0/S"))
+    with raises(ValueError):
+        GameOfLifeSet(workers=2, rule=Rule("B2i/S"))
+    # setting Conway's rule is always fine
+    gol: GameOfLife = GameOfLifeTiles()
+    gol.rule = Rule("23/3")
+    assert gol.rule == CONWAY
+
+
+def test_rule_from_file() -> None:
+    """Test that the rule in the header of a file is applied when it is loaded."""
+    gol: GameOfLife = GameOfLifeSet()
+    with create_reader("../data/highlife_replicator.rle") as reader:
+        assert reader.rule == "B36/S23"
+        gol.add_cells(reader)
+    assert gol.rule == Rule("B36/S23")
+    assert gol.count_live_cells() == 12
+    for _ in range(12):
+        gol.progress()
+    # the replicator has copied itself
+    assert gol.count_live_cells() == 24
+    with create_reader("../data/highlife_replicator.rle") as reader:
+        with raises(ValueError):
+            GameOfLifeTiles().add_cells(reader)
+
+
+def _add_r_pentomino(gol: GameOfLife) -> None:
+    """Add an R-pentomino in the middle of the universe."""
+    for row, col in ((20, 31), (20, 32), (21, 30), (21, 31), (22, 31)):
+        gol.set_cell(row, col, True)